@@ -1007,6 +1007,7 @@ if __name__ == "__main__":
         # print(f"📊 Summary: {result['summary']}")
     
     if os.getenv('OPENAI_API_KEY'):
+        WorkflowOrchestrator.install_fast_loop()
         asyncio.run(main())
     else:
         print("❌ OPENAI_API_KEY required to run example")
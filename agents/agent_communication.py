@@ -539,9 +539,10 @@ class AgentCommunicationHub:
     def _find_topic_experts(self, topic: str) -> List[str]:
         """Find agents with expertise in a topic."""
         experts = []
+        topic_key = topic.lower()
         
         for agent_id, capability in self.agent_capabilities.items():
-            if topic.lower() in [area.lower() for area in capability.expertise_areas]:
+            if any(area.lower() == topic_key for area in capability.expertise_areas):
                 experts.append(agent_id)
         
         return experts
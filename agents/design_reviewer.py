@@ -1,16 +1,35 @@
 import base64
+import hashlib
 import io
+import json
+import threading
+import time
+from concurrent.futures import Future
 from datetime import datetime
-from typing import Dict, List, Any, Optional
+from pathlib import Path
+from typing import Dict, Iterator, List, Any, Optional, Tuple
 from langchain_openai import ChatOpenAI
-from langchain_core.messages import HumanMessage, SystemMessage
+from langchain_core.messages import HumanMessage, SystemMessage, convert_to_openai_messages
 from langchain.memory import ConversationBufferMemory
+from openai import OpenAI
 from PIL import Image
 from prompts.review_prompts import DesignReviewPrompts
 from prompts.roku_prompts import RokuDesignPrompts
-from agents.utils import encode_image, extract_text_from_pdf
+from agents.utils import PDF_EXTRACTION_ERROR, encode_image_data_url, extract_text_from_pdf
 from agents.document_loaders import document_loader_manager
 from agents.vp_preferences import vp_preference_manager
+from core.persistent_cache import PersistentCache
+
+# Identical reviews (same file, options and model) reuse the earlier result,
+# from memory or from disk across restarts
+REVIEW_CACHE_TTL = 7 * 24 * 60 * 60  # 7 days
+REVIEW_CACHE_SIZE = 256
+REVIEW_CACHE_PATH = Path.home() / ".margo" / "cache.db"
+
+# Bulk reviews go through the OpenAI Batch API: half the cost, results within 24h
+BATCH_ENDPOINT = "/v1/chat/completions"
+BATCH_COMPLETION_WINDOW = "24h"
+BATCH_FAILED_STATUSES = ("failed", "expired", "cancelled")
 
 class DesignReviewAgent:
     """
@@ -24,6 +43,7 @@ class DesignReviewAgent:
         Args:
             model_name: The OpenAI model to use for analysis
         """
+        self.model_name = model_name
         self.llm = ChatOpenAI(
             model=model_name,
             temperature=0.3,
@@ -33,6 +53,18 @@ class DesignReviewAgent:
         self.prompts = DesignReviewPrompts()
         self.roku_prompts = RokuDesignPrompts()
         
+        # Review results by file content and review options, LRU-evicted and
+        # backed by SQLite so hits survive restarts
+        self._review_cache = PersistentCache(
+            REVIEW_CACHE_PATH, "reviews", REVIEW_CACHE_TTL, REVIEW_CACHE_SIZE
+        )
+        # Reviews currently being generated, by cache key
+        self._pending_reviews: Dict[str, Future] = {}
+        self._review_lock = threading.Lock()
+        
+        # Raw OpenAI client for the Batch API, created on first use
+        self._openai_client: Optional[OpenAI] = None
+        
     def review_design(
         self, 
         file, 
@@ -53,37 +85,351 @@ class DesignReviewAgent:
             Dictionary containing review results
         """
         try:
-            # Process the file based on type
+            pdf_content, file_bytes, cache_key = self._review_inputs(
+                file, review_type, detail_level, include_suggestions
+            )
+            with self._review_lock:
+                cached = self._get_cached_review(cache_key)
+                if cached is not None:
+                    return dict(cached)
+                
+                # Identical reviews already in progress are waited on rather
+                # than sent to the model again
+                pending = self._pending_reviews.get(cache_key)
+                if pending is None:
+                    self._pending_reviews[cache_key] = Future()
+            if pending is not None:
+                return dict(pending.result())
+            
+            try:
+                # Process the file based on type
+                if file.type.startswith('image'):
+                    content = self._analyze_image(
+                        file, review_type, detail_level, include_suggestions, file_bytes
+                    )
+                elif file.type == 'application/pdf':
+                    content = self._analyze_pdf(
+                        file, review_type, detail_level, include_suggestions, pdf_content
+                    )
+                else:
+                    raise ValueError(f"Unsupported file type: {file.type}")
+            except BaseException as e:
+                with self._review_lock:
+                    self._pending_reviews.pop(cache_key).set_exception(e)
+                raise
+            
+            with self._review_lock:
+                if self._is_cacheable(pdf_content):
+                    self._store_cached_review(cache_key, dict(content))
+                self._pending_reviews.pop(cache_key).set_result(dict(content))
+            
+            return content
+            
+        except Exception as e:
+            return {"error": f"Failed to analyze design: {str(e)}"}
+    
+    def stream_review_design(
+        self, 
+        file, 
+        review_type: str = "General Design",
+        detail_level: int = 3,
+        include_suggestions: bool = True
+    ) -> Iterator[str]:
+        """
+        Review a design file, yielding the review text as it is generated.
+        
+        The finished review is cached like review_design()'s; a cached review
+        is yielded in one piece.
+        
+        Args:
+            file: Uploaded file object
+            review_type: Type of review to perform
+            detail_level: Level of detail (1-5)
+            include_suggestions: Whether to include improvement suggestions
+            
+        Yields:
+            Successive pieces of the review text
+        """
+        pdf_content, file_bytes, cache_key = self._review_inputs(
+            file, review_type, detail_level, include_suggestions
+        )
+        with self._review_lock:
+            cached = self._get_cached_review(cache_key)
+        if cached is not None:
+            yield cached["review"]
+            return
+        
+        if file.type.startswith('image'):
+            messages = self._image_review_messages(
+                encode_image_data_url(file_bytes), review_type, detail_level, include_suggestions
+            )
+        elif file.type == 'application/pdf':
+            messages = self._pdf_review_messages(
+                pdf_content, review_type, detail_level, include_suggestions
+            )
+        else:
+            raise ValueError(f"Unsupported file type: {file.type}")
+        
+        # If the consumer stops early the model stream is closed and nothing is cached
+        pieces = []
+        for chunk in self.llm.stream(messages):
+            if chunk.content:
+                pieces.append(chunk.content)
+                yield chunk.content
+        
+        if self._is_cacheable(pdf_content):
+            content = self._parse_review_response("".join(pieces), include_suggestions)
+            with self._review_lock:
+                self._store_cached_review(cache_key, content)
+    
+    def _review_inputs(
+        self, 
+        file, 
+        review_type: str, 
+        detail_level: int, 
+        include_suggestions: bool
+    ) -> Tuple[Optional[str], Optional[bytes], str]:
+        """Read a file once for review: its PDF text or raw bytes, and its cache key."""
+        # PDFs are reviewed from their text only, so key them on it: a
+        # re-exported PDF with the same content is a cache hit
+        pdf_content = extract_text_from_pdf(file) if file.type == 'application/pdf' else None
+        # Other files are read once here; the same bytes are hashed for the
+        # cache key and, on a miss only, encoded for the vision API
+        file_bytes = None
+        if pdf_content is None:
+            file.seek(0)
+            file_bytes = file.read()
+            file.seek(0)
+        cache_key = self._review_cache_key(
+            file, review_type, detail_level, include_suggestions, pdf_content, file_bytes
+        )
+        return pdf_content, file_bytes, cache_key
+    
+    @staticmethod
+    def _is_cacheable(pdf_content: Optional[str]) -> bool:
+        """Whether a review may be cached: not when it saw a PDF extraction error."""
+        return not (pdf_content and pdf_content.startswith(PDF_EXTRACTION_ERROR))
+    
+    def _review_cache_key(
+        self, 
+        file, 
+        review_type: str, 
+        detail_level: int, 
+        include_suggestions: bool,
+        pdf_content: Optional[str] = None,
+        file_bytes: Optional[bytes] = None
+    ) -> str:
+        """Build a cache key from the file's content, the review options and the model."""
+        if pdf_content and not pdf_content.startswith(PDF_EXTRACTION_ERROR):
+            # Whitespace and case differences between exports don't change the review
+            digest = hashlib.sha256(" ".join(pdf_content.lower().split()).encode("utf-8"))
+        elif file_bytes is not None:
+            digest = hashlib.sha256(file_bytes)
+        else:
+            file.seek(0)
+            digest = hashlib.sha256(file.read())
+            file.seek(0)
+        
+        for part in (file.type, review_type, str(detail_level), str(include_suggestions), self.model_name):
+            digest.update(b"\0")
+            digest.update(part.encode("utf-8"))
+        
+        return digest.hexdigest()
+    
+    def _get_cached_review(self, key: str) -> Optional[Dict[str, Any]]:
+        """Return a cached review if one exists."""
+        cached = self._review_cache.get(key)
+        return json.loads(cached) if cached is not None else None
+    
+    def _store_cached_review(self, key: str, content: Dict[str, Any]):
+        """Store a review in memory and, when available, on disk."""
+        try:
+            self._review_cache.set(key, json.dumps(content))
+        except (TypeError, ValueError) as e:
+            print(f"Review cache write failed: {e}")
+    
+    def review_designs_batch(
+        self, 
+        files: List[Any], 
+        review_type: str = "General Design",
+        detail_level: int = 3,
+        include_suggestions: bool = True
+    ) -> str:
+        """
+        Submit several design files for review through the OpenAI Batch API.
+        
+        Intended for bulk, non-interactive reviews: the batch costs half as
+        much as per-file calls but may take up to 24 hours to complete.
+        
+        Args:
+            files: Uploaded file objects (images or PDFs)
+            review_type: Type of review to perform
+            detail_level: Level of detail (1-5)
+            include_suggestions: Whether to include improvement suggestions
+            
+        Returns:
+            The batch ID, to pass to get_review_batch_results()
+        """
+        lines = []
+        for index, file in enumerate(files):
+            # Same prompts and model settings as an interactive review
+            pdf_content, file_bytes, _ = self._review_inputs(
+                file, review_type, detail_level, include_suggestions
+            )
             if file.type.startswith('image'):
-                content = self._analyze_image(file, review_type, detail_level, include_suggestions)
+                messages = self._image_review_messages(
+                    encode_image_data_url(file_bytes), review_type, detail_level, include_suggestions
+                )
             elif file.type == 'application/pdf':
-                content = self._analyze_pdf(file, review_type, detail_level, include_suggestions)
+                messages = self._pdf_review_messages(
+                    pdf_content, review_type, detail_level, include_suggestions
+                )
             else:
                 raise ValueError(f"Unsupported file type: {file.type}")
             
-            return content
+            lines.append(json.dumps({
+                "custom_id": f"{index}:{getattr(file, 'name', 'file')}",
+                "method": "POST",
+                "url": BATCH_ENDPOINT,
+                "body": {
+                    "model": self.llm.model_name,
+                    "temperature": self.llm.temperature,
+                    "max_tokens": self.llm.max_tokens,
+                    "messages": convert_to_openai_messages(messages)
+                }
+            }))
+        
+        client = self._get_openai_client()
+        input_file = client.files.create(
+            file=("design_reviews.jsonl", "\n".join(lines).encode("utf-8")),
+            purpose="batch"
+        )
+        batch = client.batches.create(
+            input_file_id=input_file.id,
+            endpoint=BATCH_ENDPOINT,
+            completion_window=BATCH_COMPLETION_WINDOW,
+            metadata={"include_suggestions": str(include_suggestions)}
+        )
+        return batch.id
+    
+    def get_review_batch_results(self, batch_id: str) -> Optional[Dict[str, Dict[str, Any]]]:
+        """
+        Fetch the results of a batch submitted with review_designs_batch().
+        
+        Args:
+            batch_id: ID returned by review_designs_batch()
             
-        except Exception as e:
-            return {"error": f"Failed to analyze design: {str(e)}"}
+        Returns:
+            Review results keyed by custom ID ("<index>:<file name>"), or None
+            while the batch is still running
+        """
+        client = self._get_openai_client()
+        batch = client.batches.retrieve(batch_id)
+        if batch.status in BATCH_FAILED_STATUSES:
+            raise RuntimeError(f"Review batch {batch_id} {batch.status}")
+        if batch.status != "completed":
+            return None
+        
+        include_suggestions = (batch.metadata or {}).get("include_suggestions") != "False"
+        results = {}
+        for file_id in (batch.output_file_id, batch.error_file_id):
+            if not file_id:
+                continue
+            for line in client.files.content(file_id).text.splitlines():
+                if not line.strip():
+                    continue
+                record = json.loads(line)
+                response = record.get("response") or {}
+                if record.get("error") or response.get("status_code") != 200:
+                    error = record.get("error") or response.get("body", {}).get("error")
+                    results[record["custom_id"]] = {"error": f"Failed to analyze design: {error}"}
+                    continue
+                content = response["body"]["choices"][0]["message"]["content"]
+                results[record["custom_id"]] = self._parse_review_response(content, include_suggestions)
+        
+        return results
+    
+    def wait_for_review_batch(
+        self, 
+        batch_id: str, 
+        poll_interval: float = 60.0,
+        timeout: Optional[float] = None
+    ) -> Dict[str, Dict[str, Any]]:
+        """Block until a review batch completes and return its results."""
+        deadline = time.monotonic() + timeout if timeout is not None else None
+        while True:
+            results = self.get_review_batch_results(batch_id)
+            if results is not None:
+                return results
+            if deadline is not None and time.monotonic() >= deadline:
+                raise TimeoutError(f"Review batch {batch_id} did not complete in time")
+            time.sleep(poll_interval)
+    
+    def _get_openai_client(self) -> OpenAI:
+        """Return the OpenAI client used for batch jobs."""
+        if self._openai_client is None:
+            self._openai_client = OpenAI()
+        return self._openai_client
     
     def _analyze_image(
         self, 
         image_file, 
         review_type: str, 
         detail_level: int, 
-        include_suggestions: bool
+        include_suggestions: bool,
+        image_bytes: Optional[bytes] = None
     ) -> Dict[str, Any]:
         """Analyze an image file."""
-        # Encode image for API
-        image_data = encode_image(image_file)
+        # Encode image for API, from the caller's bytes when it already read them
+        if image_bytes is None:
+            image_bytes = image_file.read()
+            image_file.seek(0)
         
+        # Get response from LLM
+        messages = self._image_review_messages(
+            encode_image_data_url(image_bytes), review_type, detail_level, include_suggestions
+        )
+        response = self.llm.invoke(messages)
+        
+        # Parse response
+        return self._parse_review_response(response.content, include_suggestions)
+    
+    def _analyze_pdf(
+        self, 
+        pdf_file, 
+        review_type: str, 
+        detail_level: int, 
+        include_suggestions: bool,
+        pdf_content: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """Analyze a PDF file."""
+        # Extract text from PDF, unless the caller already did
+        if pdf_content is None:
+            pdf_content = extract_text_from_pdf(pdf_file)
+        
+        # Get response from LLM
+        messages = self._pdf_review_messages(
+            pdf_content, review_type, detail_level, include_suggestions
+        )
+        response = self.llm.invoke(messages)
+        
+        # Parse response
+        return self._parse_review_response(response.content, include_suggestions)
+    
+    def _image_review_messages(
+        self, 
+        image_url: str, 
+        review_type: str, 
+        detail_level: int, 
+        include_suggestions: bool
+    ) -> List[Any]:
+        """Build the review messages for an image data URL."""
         # Get appropriate prompt
         system_prompt = self.prompts.get_review_prompt(
             review_type, detail_level, include_suggestions
         )
         
-        # Create messages
-        messages = [
+        return [
             SystemMessage(content=system_prompt),
             HumanMessage(content=[
                 {
@@ -93,36 +439,26 @@ class DesignReviewAgent:
                 {
                     "type": "image_url",
                     "image_url": {
-                        "url": f"data:image/jpeg;base64,{image_data}"
+                        "url": image_url
                     }
                 }
             ])
         ]
-        
-        # Get response from LLM
-        response = self.llm.invoke(messages)
-        
-        # Parse response
-        return self._parse_review_response(response.content, include_suggestions)
     
-    def _analyze_pdf(
+    def _pdf_review_messages(
         self, 
-        pdf_file, 
+        pdf_content: str, 
         review_type: str, 
         detail_level: int, 
         include_suggestions: bool
-    ) -> Dict[str, Any]:
-        """Analyze a PDF file."""
-        # Extract text from PDF
-        pdf_content = extract_text_from_pdf(pdf_file)
-        
+    ) -> List[Any]:
+        """Build the review messages for extracted PDF text."""
         # Get appropriate prompt
         system_prompt = self.prompts.get_review_prompt(
             review_type, detail_level, include_suggestions
         )
         
-        # Create messages
-        messages = [
+        return [
             SystemMessage(content=system_prompt),
             HumanMessage(content=f"""
             Please analyze this {review_type.lower()} document and provide feedback.
@@ -131,12 +467,6 @@ class DesignReviewAgent:
             {pdf_content}
             """)
         ]
-        
-        # Get response from LLM
-        response = self.llm.invoke(messages)
-        
-        # Parse response
-        return self._parse_review_response(response.content, include_suggestions)
     
     def _parse_review_response(self, response: str, include_suggestions: bool) -> Dict[str, Any]:
         """Parse the LLM response into structured format."""
@@ -425,7 +755,8 @@ Please evaluate this design according to Roku's standards:
         """Extract content from uploaded file for Roku evaluation."""
         if file.type.startswith('image'):
             # For images, we'll use the vision model to describe the design
-            image_data = encode_image(file)
+            image_url = encode_image_data_url(file.read())
+            file.seek(0)
             
             describe_prompt = """Describe this TV interface design in detail, including:
 - Layout and screen organization
@@ -443,7 +774,7 @@ Be specific about elements that would be relevant for TV remote control navigati
                 SystemMessage(content=describe_prompt),
                 HumanMessage(content=[
                     {"type": "text", "text": "Please describe this TV interface design:"},
-                    {"type": "image_url", "image_url": {"url": f"data:image/jpeg;base64,{image_data}"}}
+                    {"type": "image_url", "image_url": {"url": image_url}}
                 ])
             ]
             
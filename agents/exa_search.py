@@ -7,7 +7,7 @@ best practices, and reference materials using the Exa AI search API.
 
 import os
 from typing import List, Dict, Optional, Any
-from exa_py import Exa
+from exa_py import AsyncExa, Exa
 from langchain.schema import Document
 
 
@@ -28,6 +28,9 @@ class ExaSearchAgent:
             raise ValueError("Exa API key is required. Set EXA_API_KEY environment variable or pass api_key parameter.")
         
         self.exa = Exa(api_key=self.api_key)
+        
+        # Async client is created on first use; it keeps one pooled HTTP connection set
+        self._async_exa: Optional[AsyncExa] = None
     
     def search_design_best_practices(self, query: str, num_results: int = 5) -> List[Document]:
         """
@@ -40,35 +43,64 @@ class ExaSearchAgent:
         Returns:
             List of LangChain Documents with search results
         """
-        enhanced_query = f"design best practices UI UX guidelines {query}"
-        
         try:
-            results = self.exa.search(
-                query=enhanced_query,
-                num_results=num_results,
-                include_domains=["nngroup.com", "smashingmagazine.com", "uxplanet.org", "medium.com", "designsystem.digital.gov"],
-                type="neural"
-            )
-            
-            documents = []
-            for result in results.results:
-                doc = Document(
-                    page_content=result.title + "\n" + (result.text or ""),
-                    metadata={
-                        "source": result.url,
-                        "title": result.title,
-                        "score": result.score,
-                        "search_type": "design_best_practices"
-                    }
-                )
-                documents.append(doc)
-            
-            return documents
+            results = self.exa.search(**self._best_practices_search_args(query, num_results))
+            return self._best_practices_documents(results)
             
         except Exception as e:
             print(f"Error searching for design best practices: {e}")
             return []
     
+    async def asearch_design_best_practices(self, query: str, num_results: int = 5) -> List[Document]:
+        """
+        Async variant of search_design_best_practices.
+        
+        Requests share one keep-alive connection pool for the life of the agent;
+        call aclose() when done. Unlike the sync method, request failures are
+        raised (httpx.HTTPError, or ValueError for API errors) so callers can
+        apply their own timeout and fallback policy.
+        """
+        if self._async_exa is None:
+            self._async_exa = AsyncExa(api_key=self.api_key)
+        
+        results = await self._async_exa.search(**self._best_practices_search_args(query, num_results))
+        return self._best_practices_documents(results)
+    
+    async def aclose(self):
+        """Close the async client's connection pool, if one was opened."""
+        if self._async_exa is not None:
+            if self._async_exa._client is not None:
+                await self._async_exa._client.aclose()
+            self._async_exa = None
+    
+    @staticmethod
+    def _best_practices_search_args(query: str, num_results: int) -> Dict[str, Any]:
+        """Exa search arguments for a design best-practices query."""
+        return {
+            "query": f"design best practices UI UX guidelines {query}",
+            "num_results": num_results,
+            "include_domains": ["nngroup.com", "smashingmagazine.com", "uxplanet.org", "medium.com", "designsystem.digital.gov"],
+            "type": "neural"
+        }
+    
+    @staticmethod
+    def _best_practices_documents(results) -> List[Document]:
+        """Convert Exa best-practices results to LangChain Documents."""
+        documents = []
+        for result in results.results:
+            doc = Document(
+                page_content=result.title + "\n" + (result.text or ""),
+                metadata={
+                    "source": result.url,
+                    "title": result.title,
+                    "score": result.score,
+                    "search_type": "design_best_practices"
+                }
+            )
+            documents.append(doc)
+        
+        return documents
+    
     def search_roku_specific_content(self, query: str, num_results: int = 3) -> List[Document]:
         """
         Search for Roku-specific design content and guidelines.
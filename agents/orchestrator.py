@@ -7,8 +7,10 @@ a coordinated approach.
 """
 
 import asyncio
+import hashlib
 import json
 import logging
+from collections import OrderedDict
 from datetime import datetime
 from typing import Dict, List, Any, Optional, Tuple
 from dataclasses import dataclass, asdict
@@ -19,6 +21,11 @@ from langchain.memory import ConversationBufferMemory
 from agents.exa_search import ExaSearchAgent
 
 
+# Initial analysis depends only on the image and design type, so a design
+# reviewed twice (e.g. screening, then escalation) reuses it
+ANALYSIS_CACHE_SIZE = 256
+
+
 class ReviewPhase(Enum):
     """Phases of the design review process."""
     ANALYSIS = "analysis"
@@ -94,6 +101,9 @@ class ReviewOrchestrator:
         self.learning_memory = ConversationBufferMemory(return_messages=True)
         self.review_history = []
         
+        # Analysis phase results by image/design type, LRU-evicted
+        self._analysis_cache: "OrderedDict[str, List[ReviewResult]]" = OrderedDict()
+        
         # Configuration
         self.config = {
             "parallel_reviews": True,
@@ -130,7 +140,7 @@ class ReviewOrchestrator:
         self.logger.info(f"Starting orchestrated review {review_id}")
         
         # Phase 1: Initial Analysis
-        analysis_results = await self._conduct_analysis_phase(image_data, design_type, context)
+        analysis_results = await self._get_analysis_results(image_data, design_type, context)
         
         # Phase 2: Parallel Specialized Reviews
         if self.config["parallel_reviews"]:
@@ -169,6 +179,32 @@ class ReviewOrchestrator:
         
         return orchestrated_review
     
+    async def _get_analysis_results(self, 
+                                  image_data: str,
+                                  design_type: str,
+                                  context: Dict[str, Any]) -> List[ReviewResult]:
+        """Return the analysis phase for this image, reusing an earlier run when possible."""
+        if not image_data:
+            return await self._conduct_analysis_phase(image_data, design_type, context)
+        
+        digest = hashlib.blake2b(image_data.encode("utf-8"), digest_size=16).hexdigest()
+        key = f"{design_type}:{digest}"
+        
+        cached = self._analysis_cache.get(key)
+        if cached is not None:
+            self._analysis_cache.move_to_end(key)
+            return list(cached)
+        
+        analysis_results = await self._conduct_analysis_phase(image_data, design_type, context)
+        
+        # An empty list means the analysis call failed; retry next time
+        if analysis_results:
+            self._analysis_cache[key] = list(analysis_results)
+            if len(self._analysis_cache) > ANALYSIS_CACHE_SIZE:
+                self._analysis_cache.popitem(last=False)
+        
+        return analysis_results
+    
     async def _conduct_analysis_phase(self, 
                                     image_data: str,
                                     design_type: str,
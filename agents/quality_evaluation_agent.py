@@ -21,6 +21,10 @@ from agents.exa_search import ExaSearchAgent
 from agents.confluence_utils import ConfluenceURLParser
 
 
+# Risk levels indexed by severity bucket (see _assess_risk_level)
+_RISK_LEVELS = ('Low', 'Medium', 'High')
+
+
 @dataclass
 class QualityCheckItem:
     """A quality check item with validation status."""
@@ -847,12 +851,8 @@ class QualityEvaluationAgent:
     
     def _assess_risk_level(self, quality_score: float, critical_issues: List[str]) -> str:
         """Assess overall risk level."""
-        if len(critical_issues) > 2 or quality_score < 5:
-            return 'High'
-        elif len(critical_issues) > 0 or quality_score < 7:
-            return 'Medium'
-        else:
-            return 'Low'
+        n = len(critical_issues)
+        return _RISK_LEVELS[2 if (n > 2 or quality_score < 5) else 1 if (n or quality_score < 7) else 0]
     
     def _calculate_quality_confidence(self, quality_analysis: Dict[str, Any], feature_validations: List[FeatureGuideValidation]) -> float:
         """Calculate confidence in quality evaluation."""
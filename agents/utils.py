@@ -1,9 +1,21 @@
 import base64
 import io
-from typing import Any
+from typing import Any, Dict, Optional, Tuple
 from PIL import Image
 import PyPDF2
 
+try:
+    import numpy as np
+    from turbojpeg import TurboJPEG, TJPF_RGB, TJSAMP_420
+    _turbo_jpeg = TurboJPEG()  # also fails when libturbojpeg itself is missing
+    TURBOJPEG_AVAILABLE = True
+except (ImportError, OSError, RuntimeError):
+    _turbo_jpeg = None
+    TURBOJPEG_AVAILABLE = False
+
+# extract_text_from_pdf returns its error as text starting with this
+PDF_EXTRACTION_ERROR = "Error extracting PDF content"
+
 def encode_image(image_file) -> str:
     """
     Encode an image file to base64 string.
@@ -20,8 +32,97 @@ def encode_image(image_file) -> str:
     # Reset file pointer
     image_file.seek(0)
     
-    # Encode to base64
-    return base64.b64encode(image_data).decode('utf-8')
+    return encode_image_bytes(image_data)
+
+def encode_image_bytes(image_data: bytes) -> str:
+    """
+    Encode raw image bytes to a base64 string for the vision API.
+    
+    Args:
+        image_data: Raw image file bytes
+        
+    Returns:
+        Base64 encoded string
+    """
+    # Base64 output is pure ASCII, so skip the UTF-8 codec
+    return base64.b64encode(prepare_image_bytes(image_data)).decode('ascii')
+
+# Formats the vision API accepts as they are, with their MIME types
+_PASSTHROUGH_MIME_TYPES = {'JPEG': 'image/jpeg', 'PNG': 'image/png', 'WEBP': 'image/webp'}
+
+def encode_image_data_url(image_data: bytes, max_size: int = 1024) -> str:
+    """
+    Encode raw image bytes as a data URL for the vision API.
+    
+    JPEG, PNG and WebP images that already fit are sent as they are, with
+    their own MIME type; anything else is downscaled to JPEG.
+    
+    Args:
+        image_data: Raw image file bytes
+        max_size: Maximum dimension size
+        
+    Returns:
+        A data: URL with the base64 encoded image
+    """
+    image_data, mime_type = _prepare_image(image_data, max_size, _PASSTHROUGH_MIME_TYPES)
+    return f"data:{mime_type};base64,{base64.b64encode(image_data).decode('ascii')}"
+
+def prepare_image_bytes(image_data: bytes, max_size: int = 1024) -> bytes:
+    """
+    Downscale an image to fit the vision API and return it as JPEG bytes.
+    
+    JPEGs that already fit are returned untouched. Larger JPEGs are decoded
+    at reduced scale via draft(), so libjpeg skips most of the full-size work.
+    
+    Args:
+        image_data: Raw image file bytes
+        max_size: Maximum dimension size
+        
+    Returns:
+        JPEG bytes, or the original bytes if they can't be decoded
+    """
+    return _prepare_image(image_data, max_size, {'JPEG': 'image/jpeg'})[0]
+
+def _prepare_image(image_data: bytes, max_size: int, passthrough: Dict[str, str]) -> Tuple[bytes, str]:
+    """Downscale to JPEG unless the format is in passthrough and already fits."""
+    try:
+        image = Image.open(io.BytesIO(image_data))  # reads the header only
+        if image.format in passthrough and max(image.size) <= max_size:
+            return image_data, passthrough[image.format]
+        
+        if image.format == 'JPEG':
+            if TURBOJPEG_AVAILABLE:
+                resized = _downscale_jpeg_turbo(image_data, image.size, max_size)
+                if resized is not None:
+                    return resized, 'image/jpeg'
+            image.draft('RGB', (max_size, max_size))
+        if image.mode != 'RGB':
+            image = image.convert('RGB')
+        image.thumbnail((max_size, max_size), Image.Resampling.LANCZOS)
+        
+        output = io.BytesIO()
+        image.save(output, format='JPEG', quality=85)
+        return output.getvalue(), 'image/jpeg'
+    except Exception:
+        return image_data, 'image/jpeg'
+
+def _downscale_jpeg_turbo(image_data: bytes, size: Tuple[int, int], max_size: int) -> Optional[bytes]:
+    """Downscale a JPEG with libjpeg-turbo; None if it can't handle the image."""
+    # Decode at the smallest DCT scale that still covers max_size, as draft() does
+    scale = 1
+    while scale < 8 and max(size) // (scale * 2) >= max_size:
+        scale *= 2
+    try:
+        pixels = _turbo_jpeg.decode(
+            image_data, pixel_format=TJPF_RGB, scaling_factor=(1, scale) if scale > 1 else None
+        )
+        image = Image.fromarray(pixels)
+        image.thumbnail((max_size, max_size), Image.Resampling.LANCZOS)
+        return _turbo_jpeg.encode(
+            np.asarray(image), quality=85, pixel_format=TJPF_RGB, jpeg_subsample=TJSAMP_420
+        )
+    except Exception:
+        return None
 
 def extract_text_from_pdf(pdf_file) -> str:
     """
@@ -48,7 +149,7 @@ def extract_text_from_pdf(pdf_file) -> str:
         return text_content.strip()
         
     except Exception as e:
-        return f"Error extracting PDF content: {str(e)}"
+        return f"{PDF_EXTRACTION_ERROR}: {str(e)}"
 
 def resize_image_if_needed(image: Image.Image, max_size: int = 1024) -> Image.Image:
     """
@@ -5,6 +5,7 @@ Allows VPs to customize evaluation criteria, add new requirements, and track rat
 
 import json
 import os
+from collections import Counter
 from datetime import datetime
 from typing import Dict, List, Any, Optional
 from dataclasses import dataclass, asdict
@@ -94,19 +95,22 @@ class VPPreferenceManager:
     def _save_data(self):
         """Save preferences and memory to files."""
         try:
-            with open(self.rules_file, 'w') as f:
-                json.dump([asdict(rule) for rule in self.custom_rules], f, indent=2)
-            
-            with open(self.memory_file, 'w') as f:
-                json.dump([asdict(mem) for mem in self.evaluation_memory], f, indent=2)
+            self._atomic_write(self.rules_file, [asdict(rule) for rule in self.custom_rules])
+            self._atomic_write(self.memory_file, [asdict(mem) for mem in self.evaluation_memory])
             
             if self.vp_profile:
-                with open(self.profile_file, 'w') as f:
-                    json.dump(asdict(self.vp_profile), f, indent=2)
+                self._atomic_write(self.profile_file, asdict(self.vp_profile))
                     
         except Exception as e:
             print(f"Error saving VP preferences: {e}")
     
+    @staticmethod
+    def _atomic_write(path: Path, data: Any):
+        """Write JSON to a temp file and rename it over the target so readers never see a partial file."""
+        tmp = path.with_name(path.name + '.tmp')
+        tmp.write_text(json.dumps(data, indent=2))
+        os.replace(tmp, path)
+    
     def add_custom_rule(
         self, 
         title: str, 
@@ -192,17 +196,18 @@ class VPPreferenceManager:
         relevant_memories = self.evaluation_memory
         
         if context_type:
+            context_key = context_type.lower()
             relevant_memories = [
                 mem for mem in self.evaluation_memory 
-                if context_type.lower() in mem.context.lower()
+                if context_key in mem.context.lower()
             ]
         
         if not relevant_memories:
             return {"message": "No evaluation history found"}
         
         # Analyze patterns
-        common_issues = {}
-        grade_distribution = {}
+        common_issues = Counter()
+        grade_distribution = Counter()
         avg_vp_rating = 0
         rated_evaluations = 0
         
@@ -210,11 +215,11 @@ class VPPreferenceManager:
             # Count common issues
             for issue in memory.issues_found:
                 issue_type = issue.get('type', 'unknown')
-                common_issues[issue_type] = common_issues.get(issue_type, 0) + 1
+                common_issues[issue_type] += 1
             
             # Grade distribution
             grade = memory.grade_assigned
-            grade_distribution[grade] = grade_distribution.get(grade, 0) + 1
+            grade_distribution[grade] += 1
             
             # VP ratings
             if memory.vp_rating:
@@ -225,8 +230,8 @@ class VPPreferenceManager:
         
         return {
             "total_evaluations": len(relevant_memories),
-            "most_common_issues": sorted(common_issues.items(), key=lambda x: x[1], reverse=True)[:5],
-            "grade_distribution": grade_distribution,
+            "most_common_issues": common_issues.most_common(5),
+            "grade_distribution": dict(grade_distribution),
             "average_vp_rating": round(avg_vp_rating, 2),
             "recent_feedback": [
                 mem.vp_feedback for mem in relevant_memories[-3:] 
@@ -7,17 +7,236 @@ Serves as the senior "tollgate" for all design decisions.
 """
 
 import asyncio
+import base64
+import binascii
+import hashlib
 import json
 import re
+import time
+import warnings
+from bisect import bisect_right
+from collections import Counter, OrderedDict, deque
 from datetime import datetime
+from itertools import chain
 from typing import Dict, List, Any, Optional, Tuple
+import httpx
 from langchain_openai import ChatOpenAI
 from langchain_core.messages import HumanMessage, SystemMessage
-from langchain.memory import ConversationBufferMemory
 from dataclasses import dataclass
+from pathlib import Path
 
 from agents.orchestrator import ReviewResult
 from agents.exa_search import ExaSearchAgent
+from core.persistent_cache import PersistentCache
+
+try:
+    from blake3 import blake3
+    BLAKE3_AVAILABLE = True
+except ImportError:
+    blake3 = None
+    BLAKE3_AVAILABLE = False
+
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    ahocorasick = None
+    AHOCORASICK_AVAILABLE = False
+
+try:
+    import h2  # noqa: F401 - enables HTTP/2 in httpx
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+# One pooled HTTP client per OpenAI credential and event loop. Pooled connections
+# belong to the loop that opened them, so a client is never shared across loops.
+_HTTP_CLIENTS: Dict[Tuple[str, int], Tuple[asyncio.AbstractEventLoop, httpx.AsyncClient]] = {}
+
+
+def _get_shared_http_client(api_key: Optional[str]) -> Optional[httpx.AsyncClient]:
+    """Fetch or create the async HTTP client for an API key on the running loop; None outside a loop."""
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        return None
+    
+    # Clients whose loop has shut down hold dead connections; drop them
+    for stale in [k for k, (client_loop, _) in _HTTP_CLIENTS.items() if client_loop.is_closed()]:
+        del _HTTP_CLIENTS[stale]
+    
+    key = (hashlib.sha256((api_key or "").encode()).hexdigest()[:16], id(loop))
+    entry = _HTTP_CLIENTS.get(key)
+    if entry is None or entry[0] is not loop or entry[1].is_closed:
+        entry = (loop, httpx.AsyncClient(
+            limits=httpx.Limits(max_keepalive_connections=20, max_connections=40),
+            http2=HTTP2_AVAILABLE,
+            timeout=30
+        ))
+        _HTTP_CLIENTS[key] = entry
+    return entry[1]
+
+
+async def _close_loop_http_clients() -> None:
+    """Close the pooled clients opened on the running loop, before the loop ends."""
+    loop = asyncio.get_running_loop()
+    for key, (client_loop, client) in list(_HTTP_CLIENTS.items()):
+        if client_loop is loop:
+            del _HTTP_CLIENTS[key]
+            await client.aclose()
+
+
+async def _run_closing_http_clients(coro):
+    """Await a coroutine, then close the clients it opened on this loop."""
+    try:
+        return await coro
+    finally:
+        await _close_loop_http_clients()
+
+
+# Competitive research changes on the order of days, so cache it per design type
+RESEARCH_CACHE_TTL = 24 * 60 * 60  # 24 hours
+RESEARCH_CACHE_SIZE = 64
+
+# Identical (image, prompt) pairs produce effectively identical reviews
+RESPONSE_CACHE_TTL = 7 * 24 * 60 * 60  # 7 days
+RESPONSE_CACHE_SIZE = 256
+RESPONSE_CACHE_PATH = Path.home() / ".margo" / "cache.db"
+
+# Bounds on the in-memory learning state kept by long-running agents
+REVIEW_HISTORY_LIMIT = 500
+STRATEGIC_INSIGHTS_LIMIT = 20
+
+# Response parsing patterns and keyword tables, compiled once at import
+_SCORE_PATTERNS = (
+    re.compile(r'(\d+(?:\.\d+)?)/10'),
+    re.compile(r'score.*?(\d+(?:\.\d+)?)'),
+    re.compile(r'rating.*?(\d+(?:\.\d+)?)'),
+)
+_CLEAN_PREFIX_RE = re.compile(r'^[-•*]\s*|\d+\.\s*')
+
+_BUSINESS_KEYWORDS = frozenset({
+    "user", "engagement", "conversion", "retention", "churn",
+    "revenue", "adoption", "satisfaction", "usability", "accessibility"
+})
+_POSITIVE_INDICATORS = frozenset({
+    "strong business case", "clear value", "competitive advantage",
+    "aligns with strategy", "high impact", "excellent roi"
+})
+_NEGATIVE_INDICATORS = frozenset({
+    "business risk", "unclear value", "low impact", "poor roi",
+    "competitive disadvantage", "strategic misalignment"
+})
+_BUSINESS_ISSUE_KEYWORDS = frozenset({
+    "business risk", "competitive threat", "user confusion",
+    "low engagement", "poor conversion", "strategic misalignment",
+    "unclear value", "implementation cost", "technical debt"
+})
+_RECOMMENDATION_SECTION_KEYWORDS = ("recommendation", "action", "next step")
+_STRATEGIC_KEYWORDS = frozenset({
+    "recommend", "suggest", "should", "consider", "prioritize",
+    "focus on", "optimize", "improve", "enhance", "implement"
+})
+_BUSINESS_METRICS = frozenset({"engagement", "conversion", "retention", "revenue", "roi", "kpi"})
+_COMPETITIVE_TERMS = frozenset({"competitor", "competitive", "market", "industry", "benchmark"})
+_STRATEGIC_TERMS = frozenset({"strategy", "vision", "roadmap", "long-term", "strategic"})
+
+# Keywords counted once per response vs. keywords that classify individual lines
+_CONTENT_KEYWORDS = {
+    "positive": _POSITIVE_INDICATORS,
+    "negative": _NEGATIVE_INDICATORS,
+    "metric": _BUSINESS_METRICS,
+    "competitive": _COMPETITIVE_TERMS,
+    "strategic": _STRATEGIC_TERMS,
+}
+_LINE_KEYWORDS = {
+    "issue": _BUSINESS_ISSUE_KEYWORDS,
+    "section": _RECOMMENDATION_SECTION_KEYWORDS,
+    "recommendation": _STRATEGIC_KEYWORDS,
+}
+
+
+def _build_keyword_automaton(tables: Dict[str, Any]):
+    """Build one Aho-Corasick automaton tagging every keyword with its categories."""
+    if not AHOCORASICK_AVAILABLE:
+        return None
+    
+    tags_by_keyword: Dict[str, List[str]] = {}
+    for tag, keywords in tables.items():
+        for keyword in keywords:
+            tags_by_keyword.setdefault(keyword, []).append(tag)
+    
+    automaton = ahocorasick.Automaton()
+    for keyword, tags in tags_by_keyword.items():
+        automaton.add_word(keyword, (keyword, tuple(tags)))
+    automaton.make_automaton()
+    return automaton
+
+
+_KEYWORD_AUTOMATON = _build_keyword_automaton({**_CONTENT_KEYWORDS, **_LINE_KEYWORDS})
+_BUSINESS_KEYWORD_AUTOMATON = _build_keyword_automaton({"business": _BUSINESS_KEYWORDS})
+
+
+def _business_sentences(feedback: str, limit: int = 2) -> List[str]:
+    """Return the first `limit` '.'-delimited sentences mentioning a business keyword."""
+    lower_feedback = feedback.lower()
+    
+    # Offsets only line up when lowercasing kept the length (true for almost all text)
+    if _BUSINESS_KEYWORD_AUTOMATON is None or len(lower_feedback) != len(feedback):
+        sentences = []
+        for sentence in feedback.split('.'):
+            low = sentence.lower()
+            if any(keyword in low for keyword in _BUSINESS_KEYWORDS):
+                sentences.append(sentence.strip())
+                if len(sentences) == limit:
+                    break
+        return sentences
+    
+    sentences = []
+    last_start = -1
+    for end, _ in _BUSINESS_KEYWORD_AUTOMATON.iter(lower_feedback):
+        start = feedback.rfind('.', 0, end) + 1
+        if start == last_start:
+            continue  # Another keyword in the same sentence
+        last_start = start
+        stop = feedback.find('.', end)
+        sentences.append(feedback[start:stop if stop != -1 else len(feedback)].strip())
+        if len(sentences) == limit:
+            break
+    return sentences
+
+
+def _scan_keywords(lower_content: str, lower_lines: List[str]) -> Tuple[Dict[str, set], Dict[str, set]]:
+    """
+    Find keyword hits in a lowercased response and its lines.
+    
+    Returns the distinct keywords found per content tag and the indices of the
+    lines that matched each line tag.
+    """
+    found = {tag: set() for tag in _CONTENT_KEYWORDS}
+    line_hits = {tag: set() for tag in _LINE_KEYWORDS}
+    
+    if _KEYWORD_AUTOMATON is not None:
+        # One linear pass over the whole text; map match offsets back to lines
+        line_starts = [0]
+        for line in lower_lines[:-1]:
+            line_starts.append(line_starts[-1] + len(line) + 1)
+        
+        for end, (keyword, tags) in _KEYWORD_AUTOMATON.iter(lower_content):
+            for tag in tags:
+                if tag in found:
+                    found[tag].add(keyword)
+                else:
+                    line_hits[tag].add(bisect_right(line_starts, end) - 1)
+    else:
+        for tag, keywords in _CONTENT_KEYWORDS.items():
+            found[tag] = {keyword for keyword in keywords if keyword in lower_content}
+        for i, low in enumerate(lower_lines):
+            for tag, keywords in _LINE_KEYWORDS.items():
+                if any(keyword in low for keyword in keywords):
+                    line_hits[tag].add(i)
+    
+    return found, line_hits
 
 
 @dataclass
@@ -29,6 +248,19 @@ class DesignCriteria:
     target_range: Tuple[float, float]  # (min, max) acceptable values
 
 
+@dataclass
+class ParsedResponse:
+    """Everything extracted from a single VP review response."""
+    recommendation: str
+    score: float
+    issues: List[str]
+    recommendations: List[str]
+    metrics_mentioned: int
+    competitive_analysis: int
+    strategic_thinking: int
+    word_count: int
+
+
 class MargoVPDesignAgent:
     """
     Margo - VP of Design agent that provides final strategic design approval.
@@ -50,11 +282,12 @@ class MargoVPDesignAgent:
             design_priorities: Current design priorities and initiatives
             exa_api_key: Optional Exa API key for design trend research
         """
-        self.llm = ChatOpenAI(
-            model="gpt-4",
-            temperature=0.2,  # More conservative, business-focused
-            max_tokens=2000
-        )
+        # The LLM and research clients are built on first use (see properties below)
+        self._openai_api_key = openai_api_key
+        self._exa_api_key = exa_api_key
+        self._llm: Optional[ChatOpenAI] = None
+        self._llm_http_client: Optional[httpx.AsyncClient] = None
+        self._exa_agent: Optional[ExaSearchAgent] = None
         
         # Design leadership context
         self.design_vision = design_vision or {
@@ -73,21 +306,26 @@ class MargoVPDesignAgent:
             "Drive design system adoption"
         ]
         
-        # Also store as business_priorities for backward compatibility
+        # Also store as business_priorities / company_context for backward compatibility
         self.business_priorities = self.design_priorities
+        self.company_context = self.design_vision
+        
+        # Built on first review and reset whenever the context/priorities change
+        self._static_prompt_prefix: Optional[str] = None
         
         # Memory for design leadership insights
-        self.memory = ConversationBufferMemory(return_messages=True)
-        self.review_history = []
-        self.design_insights = []
+        self.review_history: deque = deque(maxlen=REVIEW_HISTORY_LIMIT)
+        self.design_insights: deque = deque(maxlen=STRATEGIC_INSIGHTS_LIMIT)
+        self.strategic_insights = self.design_insights  # Same deque, older name
         
-        # Research capability for design trends and best practices
-        self.exa_agent = None
-        if exa_api_key:
-            try:
-                self.exa_agent = ExaSearchAgent(exa_api_key)
-            except Exception as e:
-                print(f"Warning: Could not initialize design research: {e}")
+        # Research results for design trends and best practices
+        self._research_cache: "OrderedDict[str, Tuple[float, str]]" = OrderedDict()
+        
+        # LLM response cache (memory, backed by SQLite so hits survive restarts)
+        self._response_cache = PersistentCache(
+            RESPONSE_CACHE_PATH, "responses", RESPONSE_CACHE_TTL, RESPONSE_CACHE_SIZE
+        )
+        self._last_image_key: Optional[Tuple[str, str]] = None
         
         # Design evaluation criteria from Margo's perspective
         self.design_criteria = [
@@ -107,6 +345,32 @@ class MargoVPDesignAgent:
             "competitive_insights": []
         }
     
+    @property
+    def llm(self) -> ChatOpenAI:
+        """Chat model, created on first use."""
+        # Rebuilt when the running loop (and so its pooled client) changes
+        http_client = _get_shared_http_client(self._openai_api_key)
+        if self._llm is None or self._llm_http_client is not http_client:
+            self._llm = ChatOpenAI(
+                model="gpt-4o",
+                temperature=0.2,  # More conservative, business-focused
+                max_tokens=2000,
+                http_async_client=http_client
+            )
+            self._llm_http_client = http_client
+        return self._llm
+    
+    @property
+    def exa_agent(self) -> Optional[ExaSearchAgent]:
+        """Research agent for design trends, created on first use; None if unavailable."""
+        if self._exa_agent is None and self._exa_api_key:
+            try:
+                self._exa_agent = ExaSearchAgent(self._exa_api_key)
+            except Exception as e:
+                print(f"Warning: Could not initialize design research: {e}")
+                self._exa_api_key = None  # Don't retry on every review
+        return self._exa_agent
+    
     async def async_review(self, 
                           image_data: str,
                           design_type: str,
@@ -144,10 +408,17 @@ class MargoVPDesignAgent:
                 ])
             ]
             
-            response = await self.llm.ainvoke(messages)
+            cache_key = self._response_cache_key(image_data, prompt)
+            response_content = None
+            if not (context or {}).get("cache_bypass"):
+                response_content = self._response_cache.get(cache_key)
+            
+            if response_content is None:
+                response_content = (await self.llm.ainvoke(messages)).content
+                self._response_cache.set(cache_key, response_content)
             
             # Parse the response into structured business feedback
-            review_result = self._parse_vp_response(response.content, design_type, context)
+            review_result = self._parse_vp_response(response_content, design_type, context)
             
             # Store for strategic learning
             self.review_history.append(review_result)
@@ -159,6 +430,32 @@ class MargoVPDesignAgent:
             print(f"VP Product review failed: {e}")
             return []
     
+    def _response_cache_key(self, image_data: str, prompt: str) -> str:
+        """Content-addressed key for an LLM review request."""
+        digest = hashlib.blake2b(digest_size=32)
+        digest.update(self._image_key(image_data).encode())
+        digest.update(b"\0")
+        digest.update(prompt.encode())
+        return digest.hexdigest()
+    
+    def _image_key(self, image_data: str) -> str:
+        """Hash the decoded image bytes, reusing the last digest for the same image object."""
+        if self._last_image_key is not None and self._last_image_key[0] is image_data:
+            return self._last_image_key[1]
+        
+        try:
+            raw = base64.b64decode(image_data)
+        except (binascii.Error, ValueError):
+            raw = image_data.encode()
+        
+        if BLAKE3_AVAILABLE:
+            key = blake3(raw).hexdigest()
+        else:
+            key = hashlib.blake2b(raw, digest_size=32).hexdigest()
+        
+        self._last_image_key = (image_data, key)
+        return key
+    
     def review(self, 
                image_data: str,
                design_type: str,
@@ -166,14 +463,50 @@ class MargoVPDesignAgent:
                analysis_results: List[ReviewResult]) -> List[ReviewResult]:
         """
         Synchronous version of review method.
+        
+        Deprecated: it starts a new event loop per call and fails inside a running
+        loop. Await async_review, or use review_many for a batch of designs.
         """
-        return asyncio.run(self.async_review(image_data, design_type, context, analysis_results))
+        warnings.warn(
+            "MargoVPDesignAgent.review is deprecated; await async_review or use review_many",
+            DeprecationWarning,
+            stacklevel=2
+        )
+        return asyncio.run(_run_closing_http_clients(
+            self.async_review(image_data, design_type, context, analysis_results)
+        ))
+    
+    async def review_batch(self, 
+                           items: List[Tuple[str, str, Dict[str, Any], List[ReviewResult]]]) -> List[List[ReviewResult]]:
+        """
+        Review several designs concurrently on the shared LLM client.
+        
+        Args:
+            items: (image_data, design_type, context, analysis_results) tuples
+            
+        Returns:
+            One list of review results per item, in input order
+        """
+        return list(await asyncio.gather(*[self.async_review(*item) for item in items]))
+    
+    def review_many(self, 
+                    items: List[Tuple[str, str, Dict[str, Any], List[ReviewResult]]]) -> List[List[ReviewResult]]:
+        """
+        Synchronous version of review_batch using a single event loop for the whole batch.
+        """
+        return asyncio.run(_run_closing_http_clients(self.review_batch(items)))
     
     async def _get_competitive_research(self, design_type: str) -> str:
         """Get competitive research and market context."""
         if not self.exa_agent:
             return ""
         
+        cache_key = design_type.strip().lower()
+        cached = self._research_cache.get(cache_key)
+        if cached and time.time() - cached[0] < RESEARCH_CACHE_TTL:
+            self._research_cache.move_to_end(cache_key)
+            return cached[1]
+        
         try:
             # Search for competitive analysis and market trends
             research_queries = [
@@ -182,24 +515,41 @@ class MargoVPDesignAgent:
                 f"user engagement {design_type} video platforms"
             ]
             
-            all_context = []
-            for query in research_queries:
-                results = self.exa_agent.search_design_best_practices(query, 2)
-                if results:
-                    for doc in results:
-                        title = doc.metadata.get('title', 'Unknown')
-                        content_preview = doc.page_content[:150] + "..." if len(doc.page_content) > 150 else doc.page_content
-                        all_context.append(f"📊 {title}: {content_preview}")
+            # Run the blocking Exa searches concurrently so latency is the slowest
+            # round trip rather than the sum of all of them
+            tasks = [
+                asyncio.to_thread(self.exa_agent.search_design_best_practices, query, 2)
+                for query in research_queries
+            ]
+            tasks.append(asyncio.to_thread(
+                self.exa_agent.search_roku_specific_content, f"{design_type} competitive features", 1
+            ))
+            results = await asyncio.gather(*tasks, return_exceptions=True)
             
-            # Add Roku-specific competitive context
-            roku_results = self.exa_agent.search_roku_specific_content(f"{design_type} competitive features", 1)
-            if roku_results:
-                for doc in roku_results:
+            all_context = []
+            failed = False
+            for i, docs in enumerate(results):
+                if isinstance(docs, Exception):
+                    print(f"Competitive research query failed: {docs}")
+                    failed = True
+                    continue
+                # The last task is the Roku-specific competitive context
+                prefix = "🏢 Roku Context - " if i == len(research_queries) else "📊 "
+                for doc in docs or []:
                     title = doc.metadata.get('title', 'Unknown')
                     content_preview = doc.page_content[:150] + "..." if len(doc.page_content) > 150 else doc.page_content
-                    all_context.append(f"🏢 Roku Context - {title}: {content_preview}")
+                    all_context.append(f"{prefix}{title}: {content_preview}")
             
-            return "\n".join(all_context) if all_context else ""
+            research = "\n".join(all_context) if all_context else ""
+            
+            # Don't pin partial results from a failed query for a whole TTL
+            if not failed:
+                self._research_cache[cache_key] = (time.time(), research)
+                self._research_cache.move_to_end(cache_key)
+                if len(self._research_cache) > RESEARCH_CACHE_SIZE:
+                    self._research_cache.popitem(last=False)
+            
+            return research
             
         except Exception as e:
             print(f"Competitive research failed: {e}")
@@ -213,20 +563,11 @@ class MargoVPDesignAgent:
         implications = []
         
         for result in analysis_results:
-            # Extract business-relevant insights
-            business_keywords = [
-                "user", "engagement", "conversion", "retention", "churn",
-                "revenue", "adoption", "satisfaction", "usability", "accessibility"
-            ]
-            
             # Find business-relevant feedback
-            business_feedback = []
-            for line in result.feedback.split('.'):
-                if any(keyword in line.lower() for keyword in business_keywords):
-                    business_feedback.append(line.strip())
+            business_feedback = _business_sentences(result.feedback)
             
             if business_feedback:
-                implications.append(f"From {result.agent_name}: {' '.join(business_feedback[:2])}")
+                implications.append(f"From {result.agent_name}: {' '.join(business_feedback)}")
         
         return "\n".join(implications) if implications else ""
     
@@ -237,14 +578,31 @@ class MargoVPDesignAgent:
                                context: Dict[str, Any]) -> str:
         """Create the VP Product review prompt."""
         
+        # Per-review content goes after the static prefix so the provider's
+        # prefix-based prompt caching can match across reviews
+        return self._get_static_prompt_prefix() + f"""
+Design Under Review: {design_type}
+
+Competitive Intelligence:
+{competitive_context}
+
+Business Implications from Technical Reviews:
+{business_implications}
+"""
+    
+    def _get_static_prompt_prefix(self) -> str:
+        """Build (once) the part of the review prompt that is identical across reviews."""
+        if self._static_prompt_prefix is not None:
+            return self._static_prompt_prefix
+        
         # Get current business priorities as context
         priorities_context = "\n".join([f"• {priority}" for priority in self.business_priorities])
         
         # Company context
         company_info = "\n".join([f"• {key}: {value}" for key, value in self.company_context.items()])
         
-        prompt = f"""
-You are a VP of Product conducting a strategic review of a {design_type} design.
+        self._static_prompt_prefix = f"""
+You are a VP of Product conducting a strategic review of a design.
 
 Your Role & Perspective:
 - Strategic business leader responsible for product success
@@ -258,12 +616,6 @@ Company Context:
 Current Business Priorities:
 {priorities_context}
 
-Competitive Intelligence:
-{competitive_context}
-
-Business Implications from Technical Reviews:
-{business_implications}
-
 Evaluation Framework - Rate each area (1-10):
 
 1. **Business Goal Alignment** (Weight: 1.5x)
@@ -301,47 +653,27 @@ Provide your review in this structure:
 Be decisive, business-focused, and provide clear strategic direction.
 Include an overall business recommendation (Approve/Approve with Changes/Reject/Needs More Research).
 """
-        
-        return prompt
+        return self._static_prompt_prefix
     
     def _parse_vp_response(self, response_content: str, design_type: str, context: Dict[str, Any]) -> ReviewResult:
         """Parse the VP review response into structured business format."""
         
-        # Extract business recommendation
-        recommendation = "Approve with Changes"  # Default
-        if "approve" in response_content.lower():
-            if "reject" in response_content.lower():
-                recommendation = "Reject"
-            elif "changes" in response_content.lower() or "modification" in response_content.lower():
-                recommendation = "Approve with Changes"
-            else:
-                recommendation = "Approve"
-        elif "reject" in response_content.lower():
-            recommendation = "Reject"
-        elif "research" in response_content.lower():
-            recommendation = "Needs More Research"
-        
-        # Calculate business score based on criteria
-        business_score = self._calculate_business_score(response_content)
-        
-        # Extract strategic issues and recommendations
-        issues = self._extract_business_issues(response_content)
-        recommendations = self._extract_strategic_recommendations(response_content)
+        parsed = self._parse_all(response_content)
         
         # Calculate confidence based on competitive context and strategic clarity
-        confidence = self._calculate_strategic_confidence(response_content, context)
+        confidence = self._calculate_strategic_confidence(parsed, context)
         
         return ReviewResult(
             agent_type="vp_review",
             agent_name="VP of Product",
-            score=business_score,
+            score=parsed.score,
             feedback=response_content,
-            specific_issues=issues,
-            recommendations=recommendations,
+            specific_issues=parsed.issues,
+            recommendations=parsed.recommendations,
             confidence=confidence,
             review_time=datetime.now(),
             metadata={
-                "business_recommendation": recommendation,
+                "business_recommendation": parsed.recommendation,
                 "company_context": self.company_context,
                 "business_priorities": self.business_priorities,
                 "competitive_research_available": bool(self.exa_agent),
@@ -350,21 +682,71 @@ Include an overall business recommendation (Approve/Approve with Changes/Reject/
             }
         )
     
-    def _calculate_business_score(self, response_content: str) -> float:
-        """Calculate business score based on multiple criteria."""
-        scores = []
+    def _parse_all(self, response_content: str) -> ParsedResponse:
+        """Extract recommendation, score, issues, recommendations and confidence features in one pass."""
+        lower_content = response_content.lower()
         
-        # Look for numerical scores in response
-        import re
-        score_patterns = [
-            r'(\d+(?:\.\d+)?)/10',
-            r'score.*?(\d+(?:\.\d+)?)',
-            r'rating.*?(\d+(?:\.\d+)?)'
-        ]
+        # Extract business recommendation
+        recommendation = "Approve with Changes"  # Default
+        if "approve" in lower_content:
+            if "reject" in lower_content:
+                recommendation = "Reject"
+            elif "changes" in lower_content or "modification" in lower_content:
+                recommendation = "Approve with Changes"
+            else:
+                recommendation = "Approve"
+        elif "reject" in lower_content:
+            recommendation = "Reject"
+        elif "research" in lower_content:
+            recommendation = "Needs More Research"
         
+        # Lowercase and split once; every extractor below reads these
+        lower_lines = lower_content.split('\n')
+        lines = response_content.split('\n')
+        found, line_hits = _scan_keywords(lower_content, lower_lines)
+        
+        # Only visit lines the keyword scan flagged, stopping once we have enough
+        issues = []
+        for i in sorted(line_hits["issue"]):
+            clean_line = _CLEAN_PREFIX_RE.sub('', lines[i].strip())
+            if clean_line and len(clean_line) > 10:
+                issues.append(clean_line)
+                if len(issues) == 5:  # Limit to top 5 business issues
+                    break
+        
+        # Section header lines are skipped; after the first one every line is a candidate
+        section_lines = line_hits["section"]
+        section_start = min(section_lines, default=len(lines))
+        candidates = chain(
+            sorted(i for i in line_hits["recommendation"] if i < section_start),
+            (i for i in range(section_start + 1, len(lines)) if i not in section_lines)
+        )
+        
+        recommendations = []
+        for i in candidates:
+            clean_line = _CLEAN_PREFIX_RE.sub('', lines[i].strip())
+            if clean_line and len(clean_line) > 15:
+                recommendations.append(clean_line)
+                if len(recommendations) == 5:  # Limit to top 5 strategic recommendations
+                    break
+        
+        return ParsedResponse(
+            recommendation=recommendation,
+            score=self._calculate_business_score(lower_content, found),
+            issues=issues,
+            recommendations=recommendations,
+            metrics_mentioned=len(found["metric"]),
+            competitive_analysis=len(found["competitive"]),
+            strategic_thinking=len(found["strategic"]),
+            word_count=len(response_content.split())
+        )
+    
+    def _calculate_business_score(self, lower_content: str, found: Dict[str, set]) -> float:
+        """Calculate business score from already-lowercased response content."""
+        # Look for numerical scores in response
         found_scores = []
-        for pattern in score_patterns:
-            matches = re.findall(pattern, response_content.lower())
+        for pattern in _SCORE_PATTERNS:
+            matches = pattern.findall(lower_content)
             for match in matches:
                 try:
                     score = float(match)
@@ -377,18 +759,8 @@ Include an overall business recommendation (Approve/Approve with Changes/Reject/
             return sum(found_scores) / len(found_scores)
         
         # Fallback: analyze sentiment and business keywords
-        positive_indicators = [
-            "strong business case", "clear value", "competitive advantage",
-            "aligns with strategy", "high impact", "excellent roi"
-        ]
-        
-        negative_indicators = [
-            "business risk", "unclear value", "low impact", "poor roi",
-            "competitive disadvantage", "strategic misalignment"
-        ]
-        
-        positive_count = sum(1 for indicator in positive_indicators if indicator in response_content.lower())
-        negative_count = sum(1 for indicator in negative_indicators if indicator in response_content.lower())
+        positive_count = len(found["positive"])
+        negative_count = len(found["negative"])
         
         # Base score with adjustments
         base_score = 7.0
@@ -396,82 +768,14 @@ Include an overall business recommendation (Approve/Approve with Changes/Reject/
         
         return max(1.0, min(10.0, base_score + adjustment))
     
-    def _extract_business_issues(self, response_content: str) -> List[str]:
-        """Extract business-focused issues from response."""
-        issues = []
-        
-        business_issue_keywords = [
-            "business risk", "competitive threat", "user confusion",
-            "low engagement", "poor conversion", "strategic misalignment",
-            "unclear value", "implementation cost", "technical debt"
-        ]
-        
-        lines = response_content.split('\n')
-        for line in lines:
-            line = line.strip()
-            if any(keyword in line.lower() for keyword in business_issue_keywords):
-                # Clean up the line
-                clean_line = re.sub(r'^[-•*]\s*|\d+\.\s*', '', line)
-                if clean_line and len(clean_line) > 10:
-                    issues.append(clean_line)
-        
-        return issues[:5]  # Limit to top 5 business issues
-    
-    def _extract_strategic_recommendations(self, response_content: str) -> List[str]:
-        """Extract strategic recommendations from response."""
-        recommendations = []
-        
-        strategic_keywords = [
-            "recommend", "suggest", "should", "consider", "prioritize",
-            "focus on", "optimize", "improve", "enhance", "implement"
-        ]
-        
-        lines = response_content.split('\n')
-        in_recommendations_section = False
-        
-        for line in lines:
-            line = line.strip()
-            
-            # Check if we're in recommendations section
-            if any(keyword in line.lower() for keyword in ["recommendation", "action", "next step"]):
-                in_recommendations_section = True
-                continue
-            
-            # Extract recommendations
-            if (in_recommendations_section or 
-                any(keyword in line.lower() for keyword in strategic_keywords)):
-                
-                # Clean up the line
-                clean_line = re.sub(r'^[-•*]\s*|\d+\.\s*', '', line)
-                if clean_line and len(clean_line) > 15:
-                    recommendations.append(clean_line)
-        
-        return recommendations[:5]  # Limit to top 5 strategic recommendations
-    
-    def _calculate_strategic_confidence(self, response_content: str, context: Dict[str, Any]) -> float:
+    def _calculate_strategic_confidence(self, parsed: ParsedResponse, context: Dict[str, Any]) -> float:
         """Calculate confidence based on strategic analysis depth."""
-        
-        confidence_factors = []
-        
-        # Check for business metrics mention
-        business_metrics = ["engagement", "conversion", "retention", "revenue", "roi", "kpi"]
-        metrics_mentioned = sum(1 for metric in business_metrics if metric in response_content.lower())
-        confidence_factors.append(min(1.0, metrics_mentioned / 3))  # Normalize to 0-1
-        
-        # Check for competitive analysis
-        competitive_terms = ["competitor", "competitive", "market", "industry", "benchmark"]
-        competitive_analysis = sum(1 for term in competitive_terms if term in response_content.lower())
-        confidence_factors.append(min(1.0, competitive_analysis / 2))
-        
-        # Check for strategic thinking
-        strategic_terms = ["strategy", "vision", "roadmap", "long-term", "strategic"]
-        strategic_thinking = sum(1 for term in strategic_terms if term in response_content.lower())
-        confidence_factors.append(min(1.0, strategic_thinking / 2))
-        
-        # Check response length and depth
-        word_count = len(response_content.split())
-        depth_factor = min(1.0, word_count / 500)  # Assume 500+ words indicates thorough analysis
-        confidence_factors.append(depth_factor)
+        confidence_factors = [
+            min(1.0, parsed.metrics_mentioned / 3),  # Business metrics, normalized to 0-1
+            min(1.0, parsed.competitive_analysis / 2),  # Competitive analysis
+            min(1.0, parsed.strategic_thinking / 2),  # Strategic thinking
+            min(1.0, parsed.word_count / 500)  # Assume 500+ words indicates thorough analysis
+        ]
         
         return sum(confidence_factors) / len(confidence_factors)
     
@@ -488,45 +792,29 @@ Include an overall business recommendation (Approve/Approve with Changes/Reject/
             "strategic_recommendations": review_result.recommendations[:3]
         }
         
+        # Bounded deque keeps only the most recent insights
         self.strategic_insights.append(insights)
-        
-        # Keep only recent insights (last 20 reviews)
-        if len(self.strategic_insights) > 20:
-            self.strategic_insights = self.strategic_insights[-20:]
     
     def get_strategic_summary(self) -> Dict[str, Any]:
         """Get strategic summary and insights from all reviews."""
         if not self.review_history:
             return {"message": "No review history available for strategic analysis."}
         
-        # Calculate strategic metrics
-        scores = [r.score for r in self.review_history]
-        recommendations = [r.metadata.get("business_recommendation", "Unknown") for r in self.review_history]
-        
-        # Count recommendation types
-        recommendation_counts = {}
-        for rec in recommendations:
-            recommendation_counts[rec] = recommendation_counts.get(rec, 0) + 1
-        
-        # Extract common strategic themes
+        # Collect strategic metrics and themes in one pass over the history
+        scores = []
+        recommendations = []
         all_issues = []
         all_recommendations = []
         for review in self.review_history:
+            scores.append(review.score)
+            recommendations.append(review.metadata.get("business_recommendation", "Unknown"))
             all_issues.extend(review.specific_issues)
             all_recommendations.extend(review.recommendations)
         
-        # Find most common issues and recommendations
-        issue_counts = {}
-        rec_counts = {}
-        
-        for issue in all_issues:
-            issue_counts[issue] = issue_counts.get(issue, 0) + 1
-        
-        for rec in all_recommendations:
-            rec_counts[rec] = rec_counts.get(rec, 0) + 1
-        
-        top_issues = sorted(issue_counts.items(), key=lambda x: x[1], reverse=True)[:3]
-        top_recommendations = sorted(rec_counts.items(), key=lambda x: x[1], reverse=True)[:3]
+        # Count recommendation types and find most common issues and recommendations
+        recommendation_counts = dict(Counter(recommendations))
+        top_issues = Counter(all_issues).most_common(3)
+        top_recommendations = Counter(all_recommendations).most_common(3)
         
         return {
             "total_reviews": len(self.review_history),
@@ -542,10 +830,12 @@ Include an overall business recommendation (Approve/Approve with Changes/Reject/
     def update_business_context(self, new_context: Dict[str, Any]):
         """Update business context and priorities."""
         self.company_context.update(new_context)
+        self._static_prompt_prefix = None
     
     def update_business_priorities(self, new_priorities: List[str]):
         """Update current business priorities."""
         self.business_priorities = new_priorities
+        self._static_prompt_prefix = None
 
 
 # Example usage
@@ -573,21 +863,25 @@ if __name__ == "__main__":
             "Strengthen platform ecosystem"
         ]
         
-        vp_agent = VPProductReviewAgent(
+        vp_agent = MargoVPDesignAgent(
             openai_api_key=openai_key,
-            company_context=roku_context,
-            business_priorities=roku_priorities,
+            design_vision=roku_context,
+            design_priorities=roku_priorities,
             exa_api_key=exa_key
         )
         
-        print("✅ VP of Product Review Agent created successfully")
+        print("✅ Margo VP of Design Review Agent created successfully")
         print(f"🏢 Company Context: {vp_agent.company_context['industry']}")
         print(f"🎯 Business Priorities: {len(vp_agent.business_priorities)} priorities set")
         print(f"🔍 Competitive Research: {'enabled' if exa_key else 'disabled'}")
         
-        # Show business criteria
-        print("\n📊 Business Evaluation Criteria:")
-        for criteria in vp_agent.business_criteria:
-            print(f"  - {criteria.metric_name} (Weight: {criteria.weight}x)")
+        # Show design criteria
+        print("\n📊 Design Evaluation Criteria:")
+        for criteria in vp_agent.design_criteria:
+            print(f"  - {criteria.criteria_name} (Weight: {criteria.weight}x)")
+        
+        # Reviews are async; run one with:
+        #   results = asyncio.run(vp_agent.async_review(image_b64, "home screen", {}, []))
+        # or several at once with vp_agent.review_many([...]).
     else:
         print("❌ OPENAI_API_KEY required")
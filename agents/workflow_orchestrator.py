@@ -18,18 +18,175 @@ Key Features:
 """
 
 import asyncio
+import hashlib
+import itertools
 import json
 import logging
+import secrets
 from datetime import datetime, timedelta
-from typing import Dict, List, Any, Optional, Tuple, Union, TYPE_CHECKING
-from dataclasses import dataclass, asdict
+from typing import Dict, List, Any, Callable, NamedTuple, Optional, Tuple, Union, TYPE_CHECKING
+from collections import OrderedDict
+from dataclasses import dataclass, fields, is_dataclass
 from enum import Enum
-import uuid
+from pathlib import Path
+
+import httpx
 
 from agents.exa_search import ExaSearchAgent
+from core.persistent_cache import PersistentCache
+from core.resilience import CircuitBreaker, CircuitBreakerConfig, CircuitBreakerError
+
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    ahocorasick = None
+    AHOCORASICK_AVAILABLE = False
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    orjson = None
+    ORJSON_AVAILABLE = False
 
 if TYPE_CHECKING:
     from agents.enhanced_system import EnhancedDesignReviewSystem
+    from agents.orchestrator import OrchestratedReview, ReviewResult
+
+
+logger = logging.getLogger(__name__)
+
+# Workflow, gap, ticket and study IDs only need to be unique, not unpredictable:
+# a random per-process prefix plus a counter avoids a CSPRNG read per ID
+_ID_PREFIX = secrets.token_hex(3)
+_ID_COUNTER = itertools.count()
+
+
+def _next_id() -> str:
+    """Return a short ID unique within this process and unlikely to clash across processes."""
+    return f"{_ID_PREFIX}{next(_ID_COUNTER):05x}"
+
+
+# Research and feature-guide lookups repeat across submissions; cache them on disk
+LOOKUP_CACHE_TTL = 7 * 24 * 60 * 60  # 7 days
+LOOKUP_CACHE_PATH = Path.home() / ".margo" / "cache.db"
+LOOKUP_CACHE_SIZE = 512
+
+# Research searches give up after this long; repeated failures pause Exa for a while
+EXA_SEARCH_TIMEOUT = 5.0
+EXA_FAILURE_THRESHOLD = 3
+EXA_COOLDOWN_SECONDS = 60
+
+# Tracking stores keep the most recent entries in memory and archive the rest
+TRACKING_STORE_SIZE = 10_000
+TRACKING_ARCHIVE_DIR = Path.home() / ".margo" / "archive"
+TRACKING_ARCHIVE_BUFFER = 64 * 1024
+
+
+# Feedback indicators, scanned against lowercased agent feedback
+_UNCERTAINTY_INDICATORS = (
+    "unclear", "uncertain", "need more information",
+    "would require", "depends on", "not specified",
+    "unclear requirements", "missing context"
+)
+_COMPLEX_INDICATORS = (
+    "strategic alignment", "business impact", "competitive analysis",
+    "market positioning", "roi analysis", "user acquisition"
+)
+_CRITICAL_INDICATORS = ("critical", "essential", "required", "must")
+
+# Design areas that need user research before review
+_HIGH_IMPACT_AREAS = frozenset({"user_onboarding", "payment_flow", "core_navigation"})
+
+# Who can resolve a knowledge gap raised by each agent type
+_GAP_STAKEHOLDERS = {
+    "ui_specialist": ("design_lead", "ux_team"),
+    "ux_researcher": ("research_team", "product_manager"),
+    "accessibility": ("accessibility_lead", "qa_team"),
+    "vp_product": ("product_leadership", "strategy_team")
+}
+_DEFAULT_GAP_STAKEHOLDERS = ("design_team",)
+
+# Resolution steps that follow the agent-specific consultation step
+_GAP_RESOLUTION_STEPS = (
+    "Gather additional requirements",
+    "Schedule stakeholder meeting",
+    "Research industry best practices"
+)
+
+
+def _build_indicator_automaton(indicators: Tuple[str, ...]):
+    """Build an Aho-Corasick automaton over the indicators, or None without pyahocorasick."""
+    if not AHOCORASICK_AVAILABLE:
+        return None
+    automaton = ahocorasick.Automaton()
+    for indicator in indicators:
+        automaton.add_word(indicator, indicator)
+    automaton.make_automaton()
+    return automaton
+
+
+# One automaton over every table, so each feedback string is scanned once
+_INDICATOR_AC = _build_indicator_automaton(
+    tuple(dict.fromkeys(_UNCERTAINTY_INDICATORS + _COMPLEX_INDICATORS + _CRITICAL_INDICATORS))
+)
+
+
+class _FeedbackScan(NamedTuple):
+    """Indicators found in one agent result's feedback."""
+    result: 'ReviewResult'
+    uncertainty: List[str]  # in table order
+    critical: bool
+    complex: bool
+
+
+class _ScanSummary(NamedTuple):
+    """What the screening rules need from a single pass over a review's agent results."""
+    critical_issues: List[Dict[str, Any]]
+    gap_seeds: List[_FeedbackScan]
+    has_complex_indicator: bool
+
+
+def _scan_feedback(result: 'ReviewResult') -> _FeedbackScan:
+    """Find uncertainty, critical and complex indicators in one result's feedback."""
+    text_lower = result.feedback.lower()
+    if _INDICATOR_AC is None:
+        return _FeedbackScan(
+            result,
+            [indicator for indicator in _UNCERTAINTY_INDICATORS if indicator in text_lower],
+            any(indicator in text_lower for indicator in _CRITICAL_INDICATORS),
+            any(indicator in text_lower for indicator in _COMPLEX_INDICATORS)
+        )
+    
+    found = {indicator for _, indicator in _INDICATOR_AC.iter(text_lower)}
+    return _FeedbackScan(
+        result,
+        [indicator for indicator in _UNCERTAINTY_INDICATORS if indicator in found],
+        not found.isdisjoint(_CRITICAL_INDICATORS),
+        not found.isdisjoint(_COMPLEX_INDICATORS)
+    )
+
+
+def _shallow_asdict(obj) -> Dict[str, Any]:
+    """Top-level dataclass fields as a dict, without asdict's recursive copying."""
+    return {f.name: getattr(obj, f.name) for f in fields(obj)}
+
+
+def _review_phase_results(review_result: 'OrchestratedReview') -> Dict[str, List['ReviewResult']]:
+    """Per-phase agent results of a review, or {} for reviews without them."""
+    try:
+        return review_result.phase_results
+    except AttributeError:
+        return {}
+
+
+def _review_overall_score(review_result: 'OrchestratedReview') -> Optional[float]:
+    """Overall score of a review, or None for reviews without one."""
+    try:
+        return review_result.overall_score
+    except AttributeError:
+        return None
 
 
 class WorkflowType(Enum):
@@ -59,7 +216,11 @@ class WorkflowStatus(Enum):
     FAILED = "failed"
 
 
-@dataclass
+# Tracked workflows and studies in these states can be archived
+_TERMINAL_STATUSES = frozenset({WorkflowStatus.COMPLETED, WorkflowStatus.FAILED})
+
+
+@dataclass(slots=True)
 class KnowledgeGap:
     """Represents a knowledge gap identified by an agent."""
     gap_id: str
@@ -72,7 +233,7 @@ class KnowledgeGap:
     suggested_next_steps: List[str]
 
 
-@dataclass
+@dataclass(slots=True)
 class JIRATicket:
     """JIRA ticket creation request."""
     ticket_id: str
@@ -86,7 +247,7 @@ class JIRATicket:
     related_workflow_id: str
 
 
-@dataclass
+@dataclass(slots=True)
 class QAValidationRequest:
     """QA validation workflow request."""
     validation_id: str
@@ -98,7 +259,7 @@ class QAValidationRequest:
     accessibility_checks: bool = True
 
 
-@dataclass
+@dataclass(slots=True)
 class ResearchStudy:
     """Research study definition and management."""
     study_id: str
@@ -112,7 +273,7 @@ class ResearchStudy:
     findings: Optional[Dict[str, Any]] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class WorkflowExecution:
     """Complete workflow execution tracking."""
     workflow_id: str
@@ -127,6 +288,201 @@ class WorkflowExecution:
     stakeholders: List[str]
 
 
+@dataclass(slots=True, frozen=True)
+class StrategicAssessment:
+    """Strategic assessment attached to a Margo review."""
+    business_impact: str
+    competitive_advantage: str
+    risk_assessment: str
+    roi_projection: str
+
+
+@dataclass(slots=True, frozen=True)
+class MargoRecommendation:
+    """Final recommendation from a Margo review."""
+    decision: str
+    conditions: Tuple[str, ...]
+    timeline: str
+
+
+@dataclass(slots=True, frozen=True)
+class MeetingMaterials:
+    """Materials for a face-to-face Margo meeting."""
+    agenda: Tuple[str, ...]
+    key_decisions: Tuple[str, ...]
+    supporting_docs: Tuple[str, ...]
+
+
+# The Margo review outputs don't vary yet, so every workflow shares one instance
+_DEFAULT_STRATEGIC_ASSESSMENT = StrategicAssessment(
+    business_impact="High",
+    competitive_advantage="Medium",
+    risk_assessment="Low",
+    roi_projection="Positive"
+)
+_DEFAULT_MARGO_RECOMMENDATION = MargoRecommendation(
+    decision="Approve with conditions",
+    conditions=("Address accessibility concerns", "Update feature guide"),
+    timeline="2 week implementation window"
+)
+_DEFAULT_MEETING_MATERIALS = MeetingMaterials(
+    agenda=("Strategic alignment", "Risk assessment", "Implementation plan"),
+    key_decisions=("Feature scope", "Launch timeline", "Success metrics"),
+    supporting_docs=("Design specs", "Research findings", "Technical requirements")
+)
+
+
+def _dumps(obj: Any, default=None) -> bytes:
+    """Serialize to UTF-8 JSON bytes, with orjson when it is installed."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, default=default, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj, default=default).encode("utf-8")
+
+
+def _loads(data: Union[str, bytes]) -> Any:
+    """Parse JSON text or bytes, with orjson when it is installed."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _is_open(tracked: Any) -> bool:
+    """Whether a tracked workflow or study has not reached a terminal status."""
+    return tracked.status not in _TERMINAL_STATUSES
+
+
+def _archive_default(obj: Any) -> Any:
+    """JSON fallback for archived tracking records."""
+    if isinstance(obj, Enum):
+        return obj.value
+    if isinstance(obj, datetime):
+        return obj.isoformat()
+    if is_dataclass(obj):
+        return _shallow_asdict(obj)
+    return str(obj)
+
+
+class BoundedStore(OrderedDict):
+    """
+    Dict that keeps at most maxsize entries, evicting the least recently written.
+    
+    Entries for which is_live returns True are never evicted, so the store may
+    exceed maxsize while they are outstanding. Evicted entries are appended as
+    JSON lines to archive_path when one is given; the archive is buffered, so
+    call flush() or close() before reading it.
+    """
+    
+    def __init__(self, 
+                 maxsize: int = TRACKING_STORE_SIZE,
+                 archive_path: Optional[Path] = None,
+                 is_live: Optional[Callable[[Any], bool]] = None):
+        super().__init__()
+        self.maxsize = maxsize
+        self.archive_path = archive_path
+        self.is_live = is_live
+        self.evictions = 0
+        self.hits = 0
+        self.misses = 0
+        # Eviction candidates in write order, and keys found live when they
+        # reached the front; live entries are set aside once rather than
+        # rescanned on every insert
+        self._order: "OrderedDict[Any, None]" = OrderedDict()
+        self._parked: "OrderedDict[Any, None]" = OrderedDict()
+        self._archive_file = None
+    
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of lookups that found an entry; 0.0 before any lookup."""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+    
+    def __getitem__(self, key):
+        try:
+            value = super().__getitem__(key)
+        except KeyError:
+            self.misses += 1
+            raise
+        self.hits += 1
+        return value
+    
+    def get(self, key, default=None):
+        if key in self:
+            return self[key]
+        self.misses += 1
+        return default
+    
+    def __setitem__(self, key, value):
+        super().__setitem__(key, value)
+        self.move_to_end(key)
+        self._parked.pop(key, None)
+        self._order[key] = None
+        self._order.move_to_end(key)
+        if len(self) > self.maxsize:
+            self._evict()
+    
+    def __delitem__(self, key):
+        super().__delitem__(key)
+        self._order.pop(key, None)
+        self._parked.pop(key, None)
+    
+    def pop(self, key, *default):
+        self._order.pop(key, None)
+        self._parked.pop(key, None)
+        return super().pop(key, *default)
+    
+    def clear(self):
+        super().clear()
+        self._order.clear()
+        self._parked.clear()
+    
+    def _evict(self):
+        """Archive and drop the least recently written entry that is no longer live."""
+        while self._order:
+            key, _ = self._order.popitem(last=False)
+            if self._drop_unless_live(key):
+                return
+        # Every candidate is live; recheck one parked entry per insert so
+        # closed ones are still evicted in time
+        if self._parked:
+            key, _ = self._parked.popitem(last=False)
+            self._drop_unless_live(key)
+    
+    def _drop_unless_live(self, key) -> bool:
+        """Evict key unless it is still live, in which case park it; True if evicted."""
+        value = super().__getitem__(key)
+        if self.is_live is not None and self.is_live(value):
+            self._parked[key] = None
+            return False
+        super().__delitem__(key)
+        self._archive(key, value)
+        return True
+    
+    def _archive(self, key: str, value: Any):
+        """Record an evicted entry in the buffered archive, if archiving is enabled."""
+        self.evictions += 1
+        if self.archive_path is None:
+            return
+        try:
+            if self._archive_file is None:
+                self.archive_path.parent.mkdir(parents=True, exist_ok=True)
+                # Buffered, so an eviction inside an async path rarely touches the disk
+                self._archive_file = self.archive_path.open("ab", buffering=TRACKING_ARCHIVE_BUFFER)
+            self._archive_file.write(_dumps({"key": key, "value": value}, default=_archive_default) + b"\n")
+        except (OSError, TypeError, ValueError) as e:
+            logger.warning("Failed to archive %s: %s", key, e)
+    
+    def flush(self):
+        """Write buffered archive lines to disk."""
+        if self._archive_file is not None:
+            self._archive_file.flush()
+    
+    def close(self):
+        """Flush and close the archive; it is reopened on the next eviction."""
+        if self._archive_file is not None:
+            self._archive_file.close()
+            self._archive_file = None
+
+
 class WorkflowOrchestrator:
     """
     Advanced workflow orchestrator for design review automation.
@@ -136,7 +492,8 @@ class WorkflowOrchestrator:
                  enhanced_system: 'EnhancedDesignReviewSystem',
                  exa_api_key: Optional[str] = None,
                  jira_config: Optional[Dict[str, str]] = None,
-                 playwright_config: Optional[Dict[str, Any]] = None):
+                 playwright_config: Optional[Dict[str, Any]] = None,
+                 verbose: bool = False):
         """
         Initialize the workflow orchestrator.
         
@@ -145,6 +502,7 @@ class WorkflowOrchestrator:
             exa_api_key: Exa API key for research
             jira_config: JIRA integration configuration
             playwright_config: Playwright testing configuration
+            verbose: Print the startup banner to stdout
         """
         self.enhanced_system = enhanced_system
         
@@ -153,12 +511,34 @@ class WorkflowOrchestrator:
         
         # Initialize research agent
         self.research_agent = ExaSearchAgent(exa_api_key) if exa_api_key else None
+        self._research_breaker = CircuitBreaker(
+            "exa_research",
+            CircuitBreakerConfig(
+                failure_threshold=EXA_FAILURE_THRESHOLD,
+                timeout_seconds=EXA_COOLDOWN_SECONDS
+            )
+        )
         
         # Workflow tracking
-        self.active_workflows: Dict[str, WorkflowExecution] = {}
-        self.knowledge_gaps: Dict[str, KnowledgeGap] = {}
-        self.pending_tickets: Dict[str, JIRATicket] = {}
-        self.research_studies: Dict[str, ResearchStudy] = {}
+        # Workflows, gaps and studies that are still open are never evicted
+        self.active_workflows: Dict[str, WorkflowExecution] = BoundedStore(
+            archive_path=TRACKING_ARCHIVE_DIR / "workflows.jsonl",
+            is_live=_is_open)
+        self.knowledge_gaps: Dict[str, KnowledgeGap] = BoundedStore(
+            archive_path=TRACKING_ARCHIVE_DIR / "knowledge_gaps.jsonl",
+            is_live=lambda gap: f"intervention_{gap.gap_id}" in self.active_workflows)
+        self.pending_tickets: Dict[str, JIRATicket] = BoundedStore(
+            archive_path=TRACKING_ARCHIVE_DIR / "tickets.jsonl")
+        self.research_studies: Dict[str, ResearchStudy] = BoundedStore(
+            archive_path=TRACKING_ARCHIVE_DIR / "research_studies.jsonl",
+            is_live=_is_open)
+        
+        # Persistent lookup cache for research searches and feature-guide checks
+        self._lookup_cache = PersistentCache(
+            LOOKUP_CACHE_PATH, "lookups", LOOKUP_CACHE_TTL, LOOKUP_CACHE_SIZE
+        )
+        self._lookup_hits = 0
+        self._lookup_misses = 0
         
         # Margo agent threshold settings
         self.margo_threshold = {
@@ -168,13 +548,52 @@ class WorkflowOrchestrator:
             "accessibility_score_min": 8.0
         }
         
-        # Set up logging
-        logging.basicConfig(level=logging.INFO)
-        self.logger = logging.getLogger(__name__)
+        # Escalation decisions already made, by workflow ID
+        self._escalation_decisions: Dict[str, bool] = BoundedStore()
+        
+        # Logging is configured by the entrypoint, not per instance
+        self.logger = logger
         
-        print("🔄 Workflow Orchestrator initialized")
-        print(f"🎫 JIRA integration: {'enabled' if jira_config else 'disabled'}")
-        print(f"🧪 Playwright testing: {'enabled' if playwright_config else 'disabled'}")
+        self.logger.info("Workflow Orchestrator initialized (jira=%s, playwright=%s)",
+                         bool(jira_config), bool(playwright_config))
+        if verbose:
+            print("🔄 Workflow Orchestrator initialized")
+            print(f"🎫 JIRA integration: {'enabled' if jira_config else 'disabled'}")
+            print(f"🧪 Playwright testing: {'enabled' if playwright_config else 'disabled'}")
+    
+    async def aclose(self):
+        """Release network and database resources held by the orchestrator."""
+        if self.research_agent:
+            await self.research_agent.aclose()
+        self._lookup_cache.close()
+        for store in (self.active_workflows, self.knowledge_gaps,
+                      self.pending_tickets, self.research_studies):
+            store.close()
+    
+    async def __aenter__(self) -> 'WorkflowOrchestrator':
+        return self
+    
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.aclose()
+    
+    @staticmethod
+    def install_fast_loop() -> bool:
+        """
+        Use uvloop as the asyncio event loop policy, if it is installed.
+        
+        Call before asyncio.run() in entrypoints that drive the orchestrator.
+        uvloop does not support Windows; there the default loop is kept.
+        
+        Returns:
+            True if uvloop was installed
+        """
+        try:
+            import uvloop
+        except ImportError:
+            return False
+        
+        uvloop.install()
+        return True
     
     async def process_design_submission(self, 
                                       design_data: Dict[str, Any],
@@ -189,9 +608,9 @@ class WorkflowOrchestrator:
         Returns:
             Complete workflow results
         """
-        workflow_id = f"design_review_{uuid.uuid4().hex[:8]}"
+        workflow_id = f"design_review_{_next_id()}"
         
-        self.logger.info(f"Processing design submission: {workflow_id}")
+        self.logger.info("Processing design submission: %s", workflow_id)
         
         # Phase 1: Pre-Margo Agent Screening
         screening_result = await self._pre_margo_screening(design_data, designer_info, workflow_id)
@@ -200,6 +619,13 @@ class WorkflowOrchestrator:
             # Phase 2: Margo Agent Review (Full Review)
             margo_result = await self._conduct_margo_review(design_data, screening_result, workflow_id)
             final_result = margo_result
+            
+            # The gaps went to Margo with the screening result, so their interventions are done
+            for gap in screening_result["knowledge_gaps"]:
+                self.complete_workflow(
+                    f"intervention_{gap.gap_id}",
+                    {"resolved_by": "margo_review", "review_workflow_id": workflow_id}
+                )
         else:
             # Handle through automated agents only
             final_result = screening_result
@@ -215,6 +641,49 @@ class WorkflowOrchestrator:
             "escalations": final_result.get("escalations", [])
         }
     
+    def complete_workflow(self, 
+                          workflow_id: str,
+                          results: Optional[Dict[str, Any]] = None,
+                          status: WorkflowStatus = WorkflowStatus.COMPLETED) -> Optional[WorkflowExecution]:
+        """
+        Close out a tracked workflow and release it from active tracking.
+        
+        Args:
+            workflow_id: ID of the workflow in active_workflows
+            results: Final results to record on the workflow
+            status: Terminal status to record
+            
+        Returns:
+            The closed workflow, or None if it was not active
+        """
+        workflow = self.active_workflows.pop(workflow_id, None)
+        if workflow is None:
+            return None
+        
+        workflow.status = status
+        workflow.updated_at = datetime.now()
+        if results:
+            workflow.results.update(results)
+        
+        # A resolved intervention no longer needs its gap kept around
+        if workflow.workflow_type is WorkflowType.KNOWLEDGE_GAP:
+            self.knowledge_gaps.pop(workflow_id[len("intervention_"):], None)
+        
+        return workflow
+    
+    def resolve_knowledge_gap(self, gap_id: str, resolution: str) -> Optional[WorkflowExecution]:
+        """
+        Record a stakeholder's answer to a knowledge gap and close its intervention.
+        
+        Args:
+            gap_id: ID of the gap in knowledge_gaps
+            resolution: The answer or decision that resolves the gap
+            
+        Returns:
+            The closed intervention workflow, or None if it was not active
+        """
+        return self.complete_workflow(f"intervention_{gap_id}", {"resolution": resolution})
+    
     async def _pre_margo_screening(self, 
                                  design_data: Dict[str, Any],
                                  designer_info: Dict[str, str],
@@ -222,30 +691,38 @@ class WorkflowOrchestrator:
         """
         Pre-Margo screening to filter common issues and validate readiness.
         """
-        self.logger.info(f"Starting pre-Margo screening for {workflow_id}")
-        
-        # 1. Feature Guide Validation
-        feature_validation = await self._validate_feature_guide_alignment(design_data)
-        
-        # 2. Research History Check
-        research_status = await self._check_research_history(design_data, designer_info)
-        
-        # 3. Basic Design Review
-        basic_review = await self.enhanced_system.conduct_comprehensive_review(
-            image_data=design_data.get("image_data"),
-            design_type=design_data.get("type", "ui_design"),
-            context={"phase": "pre_screening", "workflow_id": workflow_id}
+        self.logger.info("Starting pre-Margo screening for %s", workflow_id)
+        
+        # 1-3. Feature guide validation, research history check and basic design
+        # review are independent, so run them concurrently
+        phase_outcomes = await asyncio.gather(
+            self._validate_feature_guide_alignment(design_data),
+            self._check_research_history(design_data, designer_info),
+            self.enhanced_system.conduct_comprehensive_review(
+                image_data=design_data.get("image_data"),
+                design_type=design_data.get("type", "ui_design"),
+                context={"phase": "pre_screening", "workflow_id": workflow_id}
+            ),
+            return_exceptions=True
         )
+        for outcome in phase_outcomes:
+            if isinstance(outcome, Exception):
+                raise outcome
+        feature_validation, research_status, basic_review = phase_outcomes
         
         # 4. Knowledge Gap Detection
-        knowledge_gaps = await self._detect_knowledge_gaps(basic_review, design_data)
+        # One pass over the agent feedback feeds steps 4-6
+        scan = self._scan_phase_results(basic_review)
+        now = datetime.now()
+        knowledge_gaps = await self._detect_knowledge_gaps(basic_review, design_data, now=now, scan=scan)
         
         # 5. Issue Analysis
-        critical_issues = self._analyze_critical_issues(basic_review)
+        critical_issues = self._analyze_critical_issues(basic_review, scan=scan)
         
         # 6. Decision Logic
         requires_margo = self._should_escalate_to_margo(
-            basic_review, critical_issues, feature_validation, research_status
+            basic_review, critical_issues, feature_validation, research_status,
+            workflow_id=workflow_id, scan=scan
         )
         
         screening_result = {
@@ -263,8 +740,7 @@ class WorkflowOrchestrator:
         }
         
         # Log knowledge gaps for follow-up
-        for gap in knowledge_gaps:
-            await self._log_knowledge_gap(gap, workflow_id)
+        await asyncio.gather(*[self._log_knowledge_gap(gap, workflow_id, now=now) for gap in knowledge_gaps])
         
         return screening_result
     
@@ -281,12 +757,18 @@ class WorkflowOrchestrator:
                 "action": "request_feature_guide"
             }
         
+        description = design_data.get('description', 'No description provided')
+        cache_key = self._lookup_key("feature_guide", str(feature_guide), str(description))
+        cached = self._get_cached_lookup(cache_key)
+        if cached is not None:
+            return cached
+        
         # Cross-reference design with feature guide
         validation_prompt = f"""
         Analyze this design against the provided feature guide and determine alignment:
         
         Feature Guide: {feature_guide}
-        Design Context: {design_data.get('description', 'No description provided')}
+        Design Context: {description}
         
         Evaluate:
         1. Feature completeness - Are all required features present?
@@ -299,7 +781,7 @@ class WorkflowOrchestrator:
         
         # This would call your LLM for analysis
         # For now, returning a structured response
-        return {
+        validation = {
             "status": "analyzed",
             "alignment_score": 8.5,  # Would be calculated
             "compliant_features": [],
@@ -307,6 +789,8 @@ class WorkflowOrchestrator:
             "alignment_issues": [],
             "recommendations": []
         }
+        self._store_cached_lookup(cache_key, validation)
+        return validation
     
     async def _check_research_history(self, 
                                     design_data: Dict[str, Any],
@@ -348,54 +832,56 @@ class WorkflowOrchestrator:
         }
     
     async def _detect_knowledge_gaps(self, 
-                                   review_result: Any,
-                                   design_data: Dict[str, Any]) -> List[KnowledgeGap]:
+                                   review_result: 'OrchestratedReview',
+                                   design_data: Dict[str, Any],
+                                   now: Optional[datetime] = None,
+                                   scan: Optional[_ScanSummary] = None) -> List[KnowledgeGap]:
         """Detect knowledge gaps from agent responses."""
         
         gaps = []
-        
-        # Analyze agent responses for uncertainty indicators
-        if hasattr(review_result, 'phase_results'):
-            for phase, results in review_result.phase_results.items():
-                for result in results:
-                    # Look for uncertainty indicators in feedback
-                    uncertainty_indicators = [
-                        "unclear", "uncertain", "need more information",
-                        "would require", "depends on", "not specified",
-                        "unclear requirements", "missing context"
-                    ]
-                    
-                    feedback_lower = result.feedback.lower()
-                    for indicator in uncertainty_indicators:
-                        if indicator in feedback_lower:
-                            gap = KnowledgeGap(
-                                gap_id=uuid.uuid4().hex[:8],
-                                agent_name=result.agent_name,
-                                topic=self._extract_topic_from_feedback(result.feedback, indicator),
-                                question=self._formulate_question(result.feedback, indicator),
-                                context={"design_data": design_data, "agent_result": asdict(result)},
-                                severity=self._assess_gap_severity(result.feedback, indicator),
-                                timestamp=datetime.now(),
-                                suggested_next_steps=self._suggest_gap_resolution(indicator, result.agent_type)
-                            )
-                            gaps.append(gap)
+        now = now or datetime.now()
+        scan = scan or self._scan_phase_results(review_result)
+        
+        # One gap per agent result whose feedback shows uncertainty
+        for seed in scan.gap_seeds:
+            result = seed.result
+            indicator = seed.uncertainty[0]
+            gap = KnowledgeGap(
+                gap_id=_next_id(),
+                agent_name=result.agent_name,
+                topic=self._extract_topic_from_feedback(result.feedback, indicator),
+                question=self._formulate_question(result.feedback, indicator),
+                context={
+                    "design_data": design_data,
+                    "agent_result": _shallow_asdict(result),
+                    "indicators": seed.uncertainty
+                },
+                severity=Priority.HIGH if seed.critical else Priority.MEDIUM,
+                timestamp=now,
+                suggested_next_steps=self._suggest_gap_resolution(indicator, result.agent_type)
+            )
+            gaps.append(gap)
         
         return gaps
     
-    async def _log_knowledge_gap(self, gap: KnowledgeGap, workflow_id: str):
+    async def _log_knowledge_gap(self, 
+                               gap: KnowledgeGap,
+                               workflow_id: str,
+                               now: Optional[datetime] = None):
         """Log knowledge gap for appropriate agent intervention."""
         
         self.knowledge_gaps[gap.gap_id] = gap
+        now = now or datetime.now()
         
         # Create intervention workflow
         intervention_workflow = WorkflowExecution(
             workflow_id=f"intervention_{gap.gap_id}",
             workflow_type=WorkflowType.KNOWLEDGE_GAP,
             status=WorkflowStatus.PENDING,
-            created_at=datetime.now(),
-            updated_at=datetime.now(),
+            created_at=now,
+            updated_at=now,
             triggered_by=workflow_id,
-            context={"gap": asdict(gap)},
+            context={"gap": _shallow_asdict(gap)},
             results={},
             next_steps=gap.suggested_next_steps,
             stakeholders=self._identify_gap_stakeholders(gap)
@@ -410,25 +896,40 @@ class WorkflowOrchestrator:
                                 issue_data: Dict[str, Any],
                                 workflow_id: str) -> str:
         """Create JIRA ticket for design issues."""
+        ticket_ids = await self._create_jira_tickets_bulk([issue_data], workflow_id)
+        return ticket_ids[0]
+    
+    async def _create_jira_tickets_bulk(self, 
+                                      issues: List[Dict[str, Any]],
+                                      workflow_id: str) -> List[str]:
+        """Create JIRA tickets for several design issues in one request."""
+        if not issues:
+            return []
         
-        ticket = JIRATicket(
-            ticket_id=f"DESIGN-{uuid.uuid4().hex[:6].upper()}",
-            title=issue_data["title"],
-            description=issue_data["description"],
-            issue_type=issue_data.get("type", "Task"),
-            priority=Priority(issue_data.get("priority", "medium")),
-            assignee=issue_data.get("assignee"),
-            labels=issue_data.get("labels", ["design-review", "automated"]),
-            design_file_url=issue_data.get("design_file"),
-            related_workflow_id=workflow_id
-        )
+        tickets = [
+            JIRATicket(
+                ticket_id=f"DESIGN-{_next_id().upper()}",
+                title=issue_data["title"],
+                description=issue_data["description"],
+                issue_type=issue_data.get("type", "Task"),
+                priority=Priority(issue_data.get("priority", "medium")),
+                assignee=issue_data.get("assignee"),
+                labels=issue_data.get("labels", ["design-review", "automated"]),
+                design_file_url=issue_data.get("design_file"),
+                related_workflow_id=workflow_id
+            )
+            for issue_data in issues
+        ]
         
-        self.pending_tickets[ticket.ticket_id] = ticket
+        for ticket in tickets:
+            self.pending_tickets[ticket.ticket_id] = ticket
         
-        # In real implementation, would use JIRA API
-        self.logger.info(f"JIRA ticket created: {ticket.ticket_id}")
+        # In real implementation, would create these with one JIRA bulk API call
+        if self.logger.isEnabledFor(logging.INFO):
+            self.logger.info("JIRA tickets created (%d): %s", len(tickets),
+                             ", ".join(ticket.ticket_id for ticket in tickets))
         
-        return ticket.ticket_id
+        return [ticket.ticket_id for ticket in tickets]
     
     async def _validate_qa_against_design(self, 
                                         qa_link: str,
@@ -436,7 +937,7 @@ class WorkflowOrchestrator:
                                         workflow_id: str) -> Dict[str, Any]:
         """Use Playwright to validate QA implementation against design spec."""
         
-        validation_id = f"qa_val_{uuid.uuid4().hex[:8]}"
+        validation_id = f"qa_val_{_next_id()}"
         
         validation_request = QAValidationRequest(
             validation_id=validation_id,
@@ -461,14 +962,16 @@ class WorkflowOrchestrator:
         
         if discrepancies:
             # Create tickets for discrepancies
-            for discrepancy in discrepancies:
-                await self._create_jira_ticket({
+            await self._create_jira_tickets_bulk([
+                {
                     "title": f"Design Implementation Discrepancy: {discrepancy['element']}",
                     "description": f"Expected: {discrepancy['expected']}\nActual: {discrepancy['actual']}",
                     "type": "Bug",
                     "priority": discrepancy["severity"],
                     "labels": ["design-discrepancy", "qa-validation"]
-                }, workflow_id)
+                }
+                for discrepancy in discrepancies
+            ], workflow_id)
         
         return {
             "validation_id": validation_id,
@@ -479,19 +982,42 @@ class WorkflowOrchestrator:
         }
     
     def _should_escalate_to_margo(self, 
-                                review_result: Any,
+                                review_result: 'OrchestratedReview',
                                 critical_issues: List[Dict],
                                 feature_validation: Dict,
-                                research_status: Dict) -> bool:
+                                research_status: Dict,
+                                workflow_id: Optional[str] = None,
+                                scan: Optional[_ScanSummary] = None) -> bool:
         """Determine if design should be escalated to Margo agent."""
         
+        # A workflow's decision is fixed once made; don't re-scan its feedback
+        if workflow_id is not None:
+            decision = self._escalation_decisions.get(workflow_id)
+            if decision is not None:
+                return decision
+        
+        decision = self._evaluate_escalation(
+            review_result, critical_issues, feature_validation, research_status, scan
+        )
+        if workflow_id is not None:
+            self._escalation_decisions[workflow_id] = decision
+        return decision
+    
+    def _evaluate_escalation(self, 
+                             review_result: 'OrchestratedReview',
+                             critical_issues: List[Dict],
+                             feature_validation: Dict,
+                             research_status: Dict,
+                             scan: Optional[_ScanSummary] = None) -> bool:
+        """Apply the escalation rules, cheapest checks first."""
+        
         # Check against thresholds
         if len(critical_issues) > self.margo_threshold["critical_issues_max"]:
             return True
         
-        if hasattr(review_result, 'overall_score'):
-            if review_result.overall_score < self.margo_threshold["overall_score_min"]:
-                return True
+        overall_score = _review_overall_score(review_result)
+        if overall_score is not None and overall_score < self.margo_threshold["overall_score_min"]:
+            return True
         
         # Check feature guide alignment
         if feature_validation.get("alignment_score", 0) < 7.0:
@@ -501,20 +1027,10 @@ class WorkflowOrchestrator:
         if research_status.get("status") == "research_required":
             return False  # Don't escalate until research is done
         
-        # Check for complex strategic decisions
-        complex_indicators = [
-            "strategic alignment", "business impact", "competitive analysis",
-            "market positioning", "roi analysis", "user acquisition"
-        ]
-        
-        if hasattr(review_result, 'phase_results'):
-            for phase, results in review_result.phase_results.items():
-                for result in results:
-                    feedback_lower = result.feedback.lower()
-                    if any(indicator in feedback_lower for indicator in complex_indicators):
-                        return True
-        
-        return False
+        # Check for complex strategic decisions; the feedback scan is the
+        # most expensive rule, so it only runs when nothing above decided
+        scan = scan or self._scan_phase_results(review_result)
+        return scan.has_complex_indicator
     
     async def _conduct_margo_review(self, 
                                   design_data: Dict[str, Any],
@@ -522,7 +1038,7 @@ class WorkflowOrchestrator:
                                   workflow_id: str) -> Dict[str, Any]:
         """Conduct full Margo agent review for complex/strategic decisions."""
         
-        self.logger.info(f"Escalating to Margo agent: {workflow_id}")
+        self.logger.info("Escalating to Margo agent: %s", workflow_id)
         
         # Prepare enhanced context for Margo
         margo_context = {
@@ -555,14 +1071,16 @@ class WorkflowOrchestrator:
         
         # Create JIRA tickets for issues
         if "critical_issues" in review_result:
-            for issue in review_result["critical_issues"]:
-                ticket_id = await self._create_jira_ticket({
+            ticket_ids = await self._create_jira_tickets_bulk([
+                {
                     "title": f"Design Issue: {issue['title']}",
                     "description": issue["description"],
                     "type": "Task",
                     "priority": issue.get("priority", "medium")
-                }, workflow_id)
-                actions.append(f"Created JIRA ticket: {ticket_id}")
+                }
+                for issue in review_result["critical_issues"]
+            ], workflow_id)
+            actions.extend(f"Created JIRA ticket: {ticket_id}" for ticket_id in ticket_ids)
         
         # Schedule research if needed
         if review_result.get("research_status", {}).get("study_created"):
@@ -577,31 +1095,46 @@ class WorkflowOrchestrator:
         return actions
     
     # Utility methods
-    def _analyze_critical_issues(self, review_result: Any) -> List[Dict]:
-        """Analyze review results for critical issues."""
+    def _scan_phase_results(self, review_result: 'OrchestratedReview') -> _ScanSummary:
+        """Collect low-score issues and feedback indicators in one pass over all agent results."""
         critical_issues = []
-        
-        if hasattr(review_result, 'phase_results'):
-            for phase, results in review_result.phase_results.items():
-                for result in results:
-                    if hasattr(result, 'score') and result.score < 5.0:
-                        critical_issues.append({
-                            "title": f"Low score in {result.agent_name}",
-                            "description": result.feedback[:200] + "...",
-                            "score": result.score,
-                            "agent": result.agent_name,
-                            "priority": "high" if result.score < 3.0 else "medium"
-                        })
-        
-        return critical_issues
+        gap_seeds = []
+        has_complex_indicator = False
+        
+        for phase, results in _review_phase_results(review_result).items():
+            for result in results:
+                if result.score < 5.0:
+                    critical_issues.append({
+                        "title": f"Low score in {result.agent_name}",
+                        "description": result.feedback[:200] + "..." if len(result.feedback) > 200 else result.feedback,
+                        "score": result.score,
+                        "agent": result.agent_name,
+                        "priority": "high" if result.score < 3.0 else "medium"
+                    })
+                
+                feedback_scan = _scan_feedback(result)
+                if feedback_scan.uncertainty:
+                    gap_seeds.append(feedback_scan)
+                has_complex_indicator = has_complex_indicator or feedback_scan.complex
+        
+        return _ScanSummary(critical_issues, gap_seeds, has_complex_indicator)
+    
+    def _analyze_critical_issues(self, 
+                                 review_result: 'OrchestratedReview',
+                                 scan: Optional[_ScanSummary] = None) -> List[Dict]:
+        """Analyze review results for critical issues."""
+        scan = scan or self._scan_phase_results(review_result)
+        return scan.critical_issues
     
     def _calculate_readiness_score(self, 
-                                 review_result: Any,
+                                 review_result: 'OrchestratedReview',
                                  feature_validation: Dict,
                                  research_status: Dict) -> float:
         """Calculate overall readiness score for Margo review."""
         
-        base_score = getattr(review_result, 'overall_score', 5.0)
+        base_score = _review_overall_score(review_result)
+        if base_score is None:
+            base_score = 5.0
         feature_score = feature_validation.get("alignment_score", 5.0)
         research_score = 10.0 if research_status.get("status") != "research_required" else 5.0
         
@@ -609,54 +1142,46 @@ class WorkflowOrchestrator:
     
     def _extract_topic_from_feedback(self, feedback: str, indicator: str) -> str:
         """Extract topic from feedback containing uncertainty."""
-        # Simple extraction - would be more sophisticated in practice
-        sentences = feedback.split('.')
-        for sentence in sentences:
-            if indicator in sentence.lower():
-                return sentence.strip()[:50]
-        return "General uncertainty"
+        # Simple extraction - would be more sophisticated in practice.
+        # Locate the indicator and cut out only its sentence rather than
+        # splitting the whole feedback.
+        feedback_lower = feedback.lower()
+        if len(feedback_lower) != len(feedback):
+            # Lowercasing changed the length, so offsets would not line up
+            for sentence in feedback.split('.'):
+                if indicator in sentence.lower():
+                    return sentence.strip()[:50]
+            return "General uncertainty"
+        
+        idx = feedback_lower.find(indicator)
+        if idx < 0:
+            return "General uncertainty"
+        start = feedback.rfind('.', 0, idx) + 1
+        end = feedback.find('.', idx)
+        return feedback[start:end if end >= 0 else len(feedback)].strip()[:50]
     
     def _formulate_question(self, feedback: str, indicator: str) -> str:
         """Formulate specific question from uncertain feedback."""
         # Would use NLP to extract proper questions
         return f"Question about: {indicator} in context of {feedback[:100]}..."
     
-    def _assess_gap_severity(self, feedback: str, indicator: str) -> Priority:
-        """Assess severity of knowledge gap."""
-        critical_indicators = ["critical", "essential", "required", "must"]
-        if any(word in feedback.lower() for word in critical_indicators):
-            return Priority.HIGH
-        return Priority.MEDIUM
-    
     def _suggest_gap_resolution(self, indicator: str, agent_type: str) -> List[str]:
         """Suggest resolution steps for knowledge gap."""
-        return [
-            f"Consult with {agent_type} specialist",
-            "Gather additional requirements",
-            "Schedule stakeholder meeting",
-            "Research industry best practices"
-        ]
+        return [f"Consult with {agent_type} specialist", *_GAP_RESOLUTION_STEPS]
     
     def _identify_gap_stakeholders(self, gap: KnowledgeGap) -> List[str]:
         """Identify stakeholders who can resolve knowledge gap."""
-        stakeholder_map = {
-            "ui_specialist": ["design_lead", "ux_team"],
-            "ux_researcher": ["research_team", "product_manager"],
-            "accessibility": ["accessibility_lead", "qa_team"],
-            "vp_product": ["product_leadership", "strategy_team"]
-        }
-        
         agent_type = gap.context.get("agent_result", {}).get("agent_type", "general")
-        return stakeholder_map.get(agent_type, ["design_team"])
+        return list(_GAP_STAKEHOLDERS.get(agent_type, _DEFAULT_GAP_STAKEHOLDERS))
     
     async def _notify_stakeholders(self, workflow: WorkflowExecution):
         """Notify stakeholders of workflow status."""
         # Would integrate with notification systems (Slack, email, etc.)
-        self.logger.info(f"Notifying stakeholders for workflow: {workflow.workflow_id}")
+        self.logger.info("Notifying stakeholders for workflow: %s", workflow.workflow_id)
     
     async def _notify_stakeholders_of_results(self, results: Dict, stakeholders: List[str]):
         """Notify stakeholders of review results."""
-        self.logger.info(f"Notifying {len(stakeholders)} stakeholders of results")
+        self.logger.info("Notifying %d stakeholders of results", len(stakeholders))
     
     def _identify_result_stakeholders(self, results: Dict) -> List[str]:
         """Identify stakeholders based on review results."""
@@ -667,11 +1192,66 @@ class WorkflowOrchestrator:
         if not self.research_agent:
             return []
         
+        cache_key = self._lookup_key("research", " ".join(query.lower().split()))
+        cached = self._get_cached_lookup(cache_key)
+        if cached is not None:
+            return cached
+        
+        async def search():
+            return await asyncio.wait_for(
+                self.research_agent.asearch_design_best_practices(query, num_results=5),
+                timeout=EXA_SEARCH_TIMEOUT
+            )
+        
         try:
-            results = self.research_agent.search_design_best_practices(query, num_results=5)
-            return [{"title": doc.metadata.get("title", ""), "content": doc.page_content[:200]} for doc in results]
-        except:
+            results = await self._research_breaker.call(search)
+            research = [{"title": doc.metadata.get("title", ""), "content": doc.page_content[:200]} for doc in results]
+        except CircuitBreakerError:
+            return []
+        except (asyncio.TimeoutError, httpx.HTTPError, ValueError) as e:
+            self.logger.warning("Exa research search failed: %s", e)
             return []
+        except Exception as e:
+            # Research is optional context; never let it abort the submission
+            self.logger.warning("Exa research search failed unexpectedly: %s", e, exc_info=True)
+            return []
+        
+        self._store_cached_lookup(cache_key, research)
+        return research
+    
+    @staticmethod
+    def _lookup_key(namespace: str, *parts: str) -> str:
+        """Build a stable cache key from a namespace and its inputs."""
+        digest = hashlib.sha256()
+        for part in parts:
+            digest.update(part.encode("utf-8"))
+            digest.update(b"\0")
+        return f"{namespace}:{digest.hexdigest()}"
+    
+    def _get_cached_lookup(self, key: str) -> Optional[Any]:
+        """Return a cached lookup result if one exists and is within the TTL."""
+        cached = self._lookup_cache.get(key)
+        if cached is not None:
+            self._lookup_hits += 1
+            self._log_lookup_hit_rate()
+            return _loads(cached)
+        
+        self._lookup_misses += 1
+        return None
+    
+    def _store_cached_lookup(self, key: str, value: Any):
+        """Store a lookup result in memory and, when available, on disk."""
+        try:
+            self._lookup_cache.set(key, _dumps(value).decode("utf-8"))
+        except (TypeError, ValueError) as e:
+            self.logger.warning("Lookup cache write failed: %s", e)
+    
+    def _log_lookup_hit_rate(self):
+        """Log the lookup cache hit rate."""
+        if self.logger.isEnabledFor(logging.DEBUG):
+            total = self._lookup_hits + self._lookup_misses
+            self.logger.debug("Lookup cache hit rate: %.0f%% (%d lookups)",
+                              100 * self._lookup_hits / total, total)
     
     def _identify_research_gaps(self, existing_research: List[Dict], design_data: Dict) -> List[str]:
         """Identify gaps in existing research."""
@@ -681,9 +1261,7 @@ class WorkflowOrchestrator:
     def _assess_research_need(self, design_data: Dict) -> Dict[str, Any]:
         """Assess if research is needed for this design."""
         # Complex logic to determine research requirements
-        high_impact_areas = ["user_onboarding", "payment_flow", "core_navigation"]
-        
-        if design_data.get("area") in high_impact_areas:
+        if design_data.get("area") in _HIGH_IMPACT_AREAS:
             return {
                 "required": True,
                 "type": "User Interview",
@@ -693,10 +1271,14 @@ class WorkflowOrchestrator:
         
         return {"required": False}
     
-    async def _create_research_study(self, design_data: Dict, research_need: Dict) -> ResearchStudy:
+    async def _create_research_study(self, 
+                                   design_data: Dict,
+                                   research_need: Dict,
+                                   now: Optional[datetime] = None) -> ResearchStudy:
         """Create and schedule research study."""
+        now = now or datetime.now()
         study = ResearchStudy(
-            study_id=f"study_{uuid.uuid4().hex[:8]}",
+            study_id=f"study_{_next_id()}",
             title=f"Research for {design_data.get('title', 'Design Feature')}",
             research_type=research_need["type"],
             objectives=[
@@ -709,8 +1291,8 @@ class WorkflowOrchestrator:
                 "criteria": "Regular platform users"
             },
             timeline={
-                "start": datetime.now() + timedelta(days=3),
-                "end": datetime.now() + timedelta(days=14)
+                "start": now + timedelta(days=3),
+                "end": now + timedelta(days=14)
             },
             deliverables=[
                 "Research findings report",
@@ -755,30 +1337,17 @@ class WorkflowOrchestrator:
             return "Multiple critical issues"
         return "Strategic complexity"
     
-    async def _conduct_strategic_assessment(self, review: Any, design_data: Dict) -> Dict:
+    async def _conduct_strategic_assessment(self, review: Any, design_data: Dict) -> StrategicAssessment:
         """Conduct strategic assessment for Margo review."""
-        return {
-            "business_impact": "High",
-            "competitive_advantage": "Medium", 
-            "risk_assessment": "Low",
-            "roi_projection": "Positive"
-        }
+        return _DEFAULT_STRATEGIC_ASSESSMENT
     
-    def _generate_margo_recommendation(self, review: Any) -> Dict:
+    def _generate_margo_recommendation(self, review: Any) -> MargoRecommendation:
         """Generate final recommendation from Margo review."""
-        return {
-            "decision": "Approve with conditions",
-            "conditions": ["Address accessibility concerns", "Update feature guide"],
-            "timeline": "2 week implementation window"
-        }
+        return _DEFAULT_MARGO_RECOMMENDATION
     
-    def _prepare_meeting_materials(self, review: Any, screening: Dict) -> Dict:
+    def _prepare_meeting_materials(self, review: Any, screening: Dict) -> MeetingMaterials:
         """Prepare materials for face-to-face Margo meeting."""
-        return {
-            "agenda": ["Strategic alignment", "Risk assessment", "Implementation plan"],
-            "key_decisions": ["Feature scope", "Launch timeline", "Success metrics"],
-            "supporting_docs": ["Design specs", "Research findings", "Technical requirements"]
-        }
+        return _DEFAULT_MEETING_MATERIALS
 
 
 # Factory function for easy integration
@@ -801,6 +1370,8 @@ def create_workflow_orchestrator(
 if __name__ == "__main__":
     import os
     
+    logging.basicConfig(level=logging.INFO)
+    
     # Initialize orchestrator
     orchestrator = create_workflow_orchestrator(
         openai_api_key=os.getenv('OPENAI_API_KEY'),
@@ -2,213 +2,354 @@
 Serverless API endpoint for Vercel deployment
 Mimics the Streamlit app functionality but works on serverless
 """
-from http.server import BaseHTTPRequestHandler
+import gzip
+import hashlib
 import json
-import urllib.parse
-
-class handler(BaseHTTPRequestHandler):
-    def do_GET(self):
-        self.send_response(200)
-        self.send_header('Content-type', 'text/html')
-        self.send_header('Access-Control-Allow-Origin', '*')
-        self.end_headers()
+
+from core.web_assets import select_encoding
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    orjson = None
+    ORJSON_AVAILABLE = False
+
+try:
+    import brotli
+    BROTLI_AVAILABLE = True
+except ImportError:
+    brotli = None
+    BROTLI_AVAILABLE = False
+
+try:
+    import minify_html
+    MINIFY_HTML_AVAILABLE = True
+except ImportError:
+    minify_html = None
+    MINIFY_HTML_AVAILABLE = False
+
+# The page is static, so minify, encode it and compute its ETag once at import
+_HTML = """
+<!DOCTYPE html>
+<html>
+<head>
+    <title>🎨 Design Review Chat</title>
+    <meta charset="utf-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1">
+    <style>
+        * { margin: 0; padding: 0; box-sizing: border-box; }
+        body { 
+            font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif;
+            background: #f8f9fa;
+            min-height: 100vh;
+            display: flex;
+            flex-direction: column;
+        }
+        .header {
+            background: white;
+            padding: 1rem 2rem;
+            border-bottom: 1px solid #e1e5e9;
+            text-align: center;
+        }
+        .header h1 {
+            color: #1f2937;
+            font-size: 1.5rem;
+            margin-bottom: 0.5rem;
+        }
+        .header p {
+            color: #6b7280;
+            font-size: 0.9rem;
+        }
+        .chat-container {
+            flex: 1;
+            max-width: 800px;
+            margin: 0 auto;
+            padding: 2rem;
+            width: 100%;
+        }
+        .message {
+            margin-bottom: 1rem;
+            padding: 1rem;
+            border-radius: 8px;
+            max-width: 80%;
+        }
+        .message.assistant {
+            background: #e5f3ff;
+            margin-right: auto;
+            border-left: 4px solid #3b82f6;
+        }
+        .message.user {
+            background: #f0f9ff;
+            margin-left: auto;
+            text-align: right;
+            border-right: 4px solid #06b6d4;
+        }
+        .input-area {
+            background: white;
+            padding: 1rem 2rem;
+            border-top: 1px solid #e1e5e9;
+            display: flex;
+            gap: 1rem;
+            align-items: center;
+        }
+        input[type="text"] {
+            flex: 1;
+            padding: 0.75rem;
+            border: 1px solid #d1d5db;
+            border-radius: 6px;
+            font-size: 1rem;
+        }
+        button {
+            padding: 0.75rem 1.5rem;
+            background: #3b82f6;
+            color: white;
+            border: none;
+            border-radius: 6px;
+            cursor: pointer;
+            font-size: 1rem;
+        }
+        button:hover { background: #2563eb; }
+        .upload-area {
+            margin-bottom: 1rem;
+            padding: 1rem;
+            background: white;
+            border-radius: 8px;
+            border: 2px dashed #d1d5db;
+            text-align: center;
+        }
+        .chat-messages {
+            min-height: 400px;
+            margin-bottom: 1rem;
+        }
+    </style>
+</head>
+<body>
+    <div class="header">
+        <h1>🎨 Design Review Chat</h1>
+        <p>Upload a design, ask questions, get feedback - just like the local Streamlit app!</p>
+    </div>
+    
+    <div class="chat-container">
+        <div class="upload-area">
+            <input type="file" id="fileUpload" accept=".png,.jpg,.jpeg,.pdf" style="margin-bottom: 0.5rem;">
+            <p>Optional: Upload a design for specific feedback</p>
+        </div>
         
-        html = """
-        <!DOCTYPE html>
-        <html>
-        <head>
-            <title>🎨 Design Review Chat</title>
-            <meta charset="utf-8">
-            <meta name="viewport" content="width=device-width, initial-scale=1">
-            <style>
-                * { margin: 0; padding: 0; box-sizing: border-box; }
-                body { 
-                    font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif;
-                    background: #f8f9fa;
-                    min-height: 100vh;
-                    display: flex;
-                    flex-direction: column;
-                }
-                .header {
-                    background: white;
-                    padding: 1rem 2rem;
-                    border-bottom: 1px solid #e1e5e9;
-                    text-align: center;
-                }
-                .header h1 {
-                    color: #1f2937;
-                    font-size: 1.5rem;
-                    margin-bottom: 0.5rem;
-                }
-                .header p {
-                    color: #6b7280;
-                    font-size: 0.9rem;
-                }
-                .chat-container {
-                    flex: 1;
-                    max-width: 800px;
-                    margin: 0 auto;
-                    padding: 2rem;
-                    width: 100%;
-                }
-                .message {
-                    margin-bottom: 1rem;
-                    padding: 1rem;
-                    border-radius: 8px;
-                    max-width: 80%;
-                }
-                .message.assistant {
-                    background: #e5f3ff;
-                    margin-right: auto;
-                    border-left: 4px solid #3b82f6;
-                }
-                .message.user {
-                    background: #f0f9ff;
-                    margin-left: auto;
-                    text-align: right;
-                    border-right: 4px solid #06b6d4;
-                }
-                .input-area {
-                    background: white;
-                    padding: 1rem 2rem;
-                    border-top: 1px solid #e1e5e9;
-                    display: flex;
-                    gap: 1rem;
-                    align-items: center;
-                }
-                input[type="text"] {
-                    flex: 1;
-                    padding: 0.75rem;
-                    border: 1px solid #d1d5db;
-                    border-radius: 6px;
-                    font-size: 1rem;
-                }
-                button {
-                    padding: 0.75rem 1.5rem;
-                    background: #3b82f6;
-                    color: white;
-                    border: none;
-                    border-radius: 6px;
-                    cursor: pointer;
-                    font-size: 1rem;
-                }
-                button:hover { background: #2563eb; }
-                .upload-area {
-                    margin-bottom: 1rem;
-                    padding: 1rem;
-                    background: white;
-                    border-radius: 8px;
-                    border: 2px dashed #d1d5db;
-                    text-align: center;
-                }
-                .chat-messages {
-                    min-height: 400px;
-                    margin-bottom: 1rem;
-                }
-            </style>
-        </head>
-        <body>
-            <div class="header">
-                <h1>🎨 Design Review Chat</h1>
-                <p>Upload a design, ask questions, get feedback - just like the local Streamlit app!</p>
-            </div>
-            
-            <div class="chat-container">
-                <div class="upload-area">
-                    <input type="file" id="fileUpload" accept=".png,.jpg,.jpeg,.pdf" style="margin-bottom: 0.5rem;">
-                    <p>Optional: Upload a design for specific feedback</p>
-                </div>
-                
-                <div class="chat-messages" id="chatMessages">
-                    <div class="message assistant">
-                        Hi! I'm your design assistant. Ask me about colors, typography, layout, accessibility, or upload a design for specific feedback!
-                    </div>
-                </div>
-            </div>
-            
-            <div class="input-area">
-                <input type="text" id="messageInput" placeholder="Ask me anything about design..." onkeypress="if(event.key==='Enter') sendMessage()">
-                <button onclick="sendMessage()">Send</button>
+        <div class="chat-messages" id="chatMessages">
+            <div class="message assistant">
+                Hi! I'm your design assistant. Ask me about colors, typography, layout, accessibility, or upload a design for specific feedback!
             </div>
+        </div>
+    </div>
+    
+    <div class="input-area">
+        <input type="text" id="messageInput" placeholder="Ask me anything about design..." onkeypress="if(event.key==='Enter') sendMessage()">
+        <button onclick="sendMessage()">Send</button>
+    </div>
 
-            <script>
-                let uploadedFile = null;
-                
-                document.getElementById('fileUpload').addEventListener('change', function(e) {
-                    if (e.target.files[0]) {
-                        uploadedFile = e.target.files[0];
-                        addMessage('user', `Uploaded: ${uploadedFile.name}`);
-                        addMessage('assistant', `Great! I can see you've uploaded "${uploadedFile.name}". Now ask me specific questions about your design!`);
-                    }
-                });
-                
-                function addMessage(role, content) {
-                    const messagesDiv = document.getElementById('chatMessages');
-                    const messageDiv = document.createElement('div');
-                    messageDiv.className = `message ${role}`;
-                    messageDiv.textContent = content;
-                    messagesDiv.appendChild(messageDiv);
+    <script>
+        let uploadedFile = null;
+        const messagesDiv = document.getElementById('chatMessages');
+        let scrollPending = false;
+        
+        // Keyword groups checked in order; the first group with a match answers
+        const KEYWORD_RESPONSES = [
+            [['color', 'colour', 'palette'], "Great question about colors! For effective color choices, consider contrast ratios (aim for 4.5:1), your brand palette, and accessibility. What specific color challenge are you facing?"],
+            [['font', 'typography', 'text'], "Typography is crucial! Consider hierarchy (use 2-3 font sizes max), readability (16px+ for body text), and consistency. What typography question do you have?"],
+            [['layout', 'spacing', 'grid'], "Good layout makes or breaks design! Use consistent spacing (try 8px grid system), clear hierarchy, and whitespace effectively. What layout challenge can I help with?"],
+            [['accessibility', 'a11y'], "Accessibility is essential! Key areas: color contrast, keyboard navigation, alt text, and semantic HTML. What accessibility aspect interests you?"],
+            [['hello', 'hi', 'hey'], "Hello! I'm here to help with design questions. Ask me about colors, typography, layout, accessibility, or upload a design for specific feedback!"]
+        ];
+        
+        document.getElementById('fileUpload').addEventListener('change', function(e) {
+            if (e.target.files[0]) {
+                uploadedFile = e.target.files[0];
+                addMessages(
+                    ['user', `Uploaded: ${uploadedFile.name}`],
+                    ['assistant', `Great! I can see you've uploaded "${uploadedFile.name}". Now ask me specific questions about your design!`]
+                );
+            }
+        });
+        
+        function addMessage(role, content) {
+            addMessages([role, content]);
+        }
+        
+        function addMessages(...messages) {
+            // Insert all messages at once, then scroll on the next frame so
+            // the layout is only recalculated once
+            const fragment = document.createDocumentFragment();
+            for (const [role, content] of messages) {
+                const messageDiv = document.createElement('div');
+                messageDiv.className = `message ${role}`;
+                messageDiv.textContent = content;
+                fragment.appendChild(messageDiv);
+            }
+            messagesDiv.appendChild(fragment);
+            
+            if (!scrollPending) {
+                scrollPending = true;
+                requestAnimationFrame(() => {
+                    scrollPending = false;
                     messagesDiv.scrollTop = messagesDiv.scrollHeight;
-                }
-                
-                function getSmartResponse(prompt) {
-                    const promptLower = prompt.toLowerCase();
-                    
-                    if (uploadedFile) {
-                        return `Looking at your design "${uploadedFile.name}", here's my feedback: ${prompt}`;
-                    }
-                    
-                    if (promptLower.includes('color') || promptLower.includes('colour') || promptLower.includes('palette')) {
-                        return "Great question about colors! For effective color choices, consider contrast ratios (aim for 4.5:1), your brand palette, and accessibility. What specific color challenge are you facing?";
-                    }
-                    
-                    if (promptLower.includes('font') || promptLower.includes('typography') || promptLower.includes('text')) {
-                        return "Typography is crucial! Consider hierarchy (use 2-3 font sizes max), readability (16px+ for body text), and consistency. What typography question do you have?";
-                    }
-                    
-                    if (promptLower.includes('layout') || promptLower.includes('spacing') || promptLower.includes('grid')) {
-                        return "Good layout makes or breaks design! Use consistent spacing (try 8px grid system), clear hierarchy, and whitespace effectively. What layout challenge can I help with?";
-                    }
-                    
-                    if (promptLower.includes('accessibility') || promptLower.includes('a11y')) {
-                        return "Accessibility is essential! Key areas: color contrast, keyboard navigation, alt text, and semantic HTML. What accessibility aspect interests you?";
-                    }
-                    
-                    if (promptLower.includes('hello') || promptLower.includes('hi') || promptLower.includes('hey')) {
-                        return "Hello! I'm here to help with design questions. Ask me about colors, typography, layout, accessibility, or upload a design for specific feedback!";
-                    }
-                    
-                    return `Interesting question about "${prompt}"! I can help with design principles, best practices, color theory, typography, layout, accessibility, and more. Want to dive deeper into any specific area?`;
-                }
-                
-                function sendMessage() {
-                    const input = document.getElementById('messageInput');
-                    const message = input.value.trim();
-                    
-                    if (!message) return;
-                    
-                    addMessage('user', message);
-                    input.value = '';
-                    
-                    // Simulate thinking
-                    setTimeout(() => {
-                        const response = getSmartResponse(message);
-                        addMessage('assistant', response);
-                    }, 500);
-                }
-            </script>
-        </body>
-        </html>
-        """
+                });
+            }
+        }
         
-        self.wfile.write(html.encode())
-
-    def do_POST(self):
-        # Handle any POST requests (for future API functionality)
-        self.send_response(200)
-        self.send_header('Content-type', 'application/json')
-        self.send_header('Access-Control-Allow-Origin', '*')
-        self.end_headers()
+        function getSmartResponse(prompt) {
+            if (uploadedFile) {
+                return `Looking at your design "${uploadedFile.name}", here's my feedback: ${prompt}`;
+            }
+            
+            const promptLower = prompt.toLowerCase();
+            for (const [keywords, response] of KEYWORD_RESPONSES) {
+                if (keywords.some(keyword => promptLower.includes(keyword))) {
+                    return response;
+                }
+            }
+            
+            return `Interesting question about "${prompt}"! I can help with design principles, best practices, color theory, typography, layout, accessibility, and more. Want to dive deeper into any specific area?`;
+        }
         
-        response = {"status": "success", "message": "Design review API"}
-        self.wfile.write(json.dumps(response).encode())
+        function sendMessage() {
+            const input = document.getElementById('messageInput');
+            const message = input.value.trim();
+            
+            if (!message) return;
+            
+            addMessage('user', message);
+            input.value = '';
+            
+            // Simulate thinking
+            setTimeout(() => {
+                const response = getSmartResponse(message);
+                addMessage('assistant', response);
+            }, 500);
+        }
+    </script>
+</body>
+</html>
+"""
+if MINIFY_HTML_AVAILABLE:
+    _HTML = minify_html.minify(_HTML, minify_js=True, minify_css=True)
+_HTML_BYTES = _HTML.encode()
+_HTML_DIGEST = hashlib.md5(_HTML_BYTES).hexdigest()
+_HTML_CACHE_CONTROL = 'public, max-age=600'
+
+# Compressed once at import, best encoding first: encoding -> (encoding, body, ETag)
+_HTML_VARIANTS = {}
+if BROTLI_AVAILABLE:
+    _HTML_VARIANTS['br'] = ('br', brotli.compress(_HTML_BYTES, quality=11), f'"{_HTML_DIGEST}-br"')
+_HTML_VARIANTS['gzip'] = ('gzip', gzip.compress(_HTML_BYTES, compresslevel=9, mtime=0), f'"{_HTML_DIGEST}-gz"')
+_HTML_IDENTITY = (None, _HTML_BYTES, f'"{_HTML_DIGEST}"')
+
+
+def _select_html_variant(accept_encoding: str):
+    """Pick the precompressed page the client accepts, or the plain one."""
+    return _HTML_VARIANTS.get(select_encoding(accept_encoding, _HTML_VARIANTS), _HTML_IDENTITY)
+
+
+def _dumps(obj) -> bytes:
+    """Serialize to UTF-8 JSON bytes, with orjson when it is installed."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(',', ':')).encode('utf-8')
+
+
+_POST_RESPONSE = _dumps({"status": "success", "message": "Design review API"})
+
+
+def _header(scope, name: bytes) -> str:
+    """Value of a request header, or '' when it is absent."""
+    for key, value in scope['headers']:
+        if key == name:
+            return value.decode('latin-1')
+    return ''
+
+
+async def _respond(send, status: int, headers, body: bytes = b''):
+    """Send a complete HTTP response."""
+    await send({'type': 'http.response.start', 'status': status, 'headers': headers})
+    await send({'type': 'http.response.body', 'body': body})
+
+
+async def _get(scope, send):
+    """Serve the chat page, precompressed when the client allows it."""
+    encoding, body, etag = _select_html_variant(_header(scope, b'accept-encoding'))
+    headers = [
+        (b'etag', etag.encode()),
+        (b'cache-control', _HTML_CACHE_CONTROL.encode()),
+        (b'vary', b'Accept-Encoding'),
+    ]
+    
+    if etag in _header(scope, b'if-none-match'):
+        await _respond(send, 304, headers)
+        return
+    
+    headers += [
+        (b'content-type', b'text/html; charset=utf-8'),
+        (b'content-length', str(len(body)).encode()),
+        (b'access-control-allow-origin', b'*'),
+    ]
+    if encoding:
+        headers.append((b'content-encoding', encoding.encode()))
+    await _respond(send, 200, headers, body)
+
+
+async def _post(scope, send):
+    """Handle any POST requests (for future API functionality)."""
+    await _respond(send, 200, _POST_HEADERS, _POST_RESPONSE)
+
+
+async def _options(scope, send):
+    """Answer CORS preflight requests."""
+    await _respond(send, 200, _OPTIONS_HEADERS)
+
+
+async def _unsupported(scope, send):
+    """Reject methods this endpoint doesn't serve."""
+    await _respond(send, 501, [(b'content-type', b'text/plain')], b'Unsupported method')
+
+
+_POST_HEADERS = [
+    (b'content-type', b'application/json'),
+    (b'content-length', str(len(_POST_RESPONSE)).encode()),
+    (b'access-control-allow-origin', b'*'),
+]
+# Preflight answers never change, so they are built once
+_OPTIONS_HEADERS = [
+    (b'access-control-allow-origin', b'*'),
+    (b'access-control-allow-methods', b'GET, POST, OPTIONS'),
+    (b'access-control-allow-headers', b'Content-Type, Authorization'),
+    (b'access-control-max-age', b'86400'),
+    (b'content-length', b'0'),
+]
+_METHOD_HANDLERS = {'GET': _get, 'POST': _post, 'OPTIONS': _options}
+
+
+async def app(scope, receive, send):
+    """ASGI entry point, served directly by the Vercel Python runtime."""
+    if scope['type'] == 'lifespan':
+        while True:
+            message = await receive()
+            if message['type'] == 'lifespan.startup':
+                await send({'type': 'lifespan.startup.complete'})
+            elif message['type'] == 'lifespan.shutdown':
+                await send({'type': 'lifespan.shutdown.complete'})
+                return
+    
+    if scope['type'] == 'websocket':
+        # No WebSocket routes; closing before accept rejects the handshake
+        await send({'type': 'websocket.close'})
+        return
+    if scope['type'] != 'http':
+        raise ValueError(f"Unsupported ASGI scope type: {scope['type']}")
+    
+    await _METHOD_HANDLERS.get(scope['method'], _unsupported)(scope, send)
+
+
+if __name__ == "__main__":
+    # Self-hosted: uvicorn[standard] picks uvloop and httptools when they are installed
+    import uvicorn
+    uvicorn.run(app, host="0.0.0.0", port=8000)
@@ -0,0 +1,125 @@
+"""
+Persistent Cache
+
+Small key/value cache for expensive model and research results: a bounded
+in-memory LRU in front of a SQLite table, so hits survive restarts.
+"""
+
+import logging
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Optional, Tuple, Union
+
+logger = logging.getLogger(__name__)
+
+
+class PersistentCache:
+    """
+    String values by string key, expiring after a TTL.
+
+    The SQLite database is opened on first use. If it can't be opened the
+    cache keeps working in memory only.
+    """
+
+    def __init__(self, path: Union[str, Path], table: str, ttl: float, maxsize: int):
+        self.path = Path(path)
+        self.table = table
+        self.ttl = ttl
+        self.maxsize = maxsize
+
+        self._memory: "OrderedDict[str, Tuple[float, str]]" = OrderedDict()
+        self._db: Optional[sqlite3.Connection] = None
+        self._db_failed = False
+        # Guards both levels, so one cache can be shared across threads
+        self._lock = threading.Lock()
+
+    def _get_db(self) -> Optional[sqlite3.Connection]:
+        """Open the database on first use; None if unavailable. Call with _lock held."""
+        if self._db is None and not self._db_failed:
+            try:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                self._db = sqlite3.connect(str(self.path), check_same_thread=False)
+                self._db.execute(
+                    f"CREATE TABLE IF NOT EXISTS {self.table} "
+                    "(key TEXT PRIMARY KEY, created REAL NOT NULL, content TEXT NOT NULL)"
+                )
+                # Drop rows that expired while no one was reading them
+                with self._db:
+                    self._db.execute(
+                        f"DELETE FROM {self.table} WHERE created < ?", (time.time() - self.ttl,)
+                    )
+            except Exception as e:
+                logger.warning("Cache persistence disabled for %s: %s", self.table, e)
+                self._db = None
+                self._db_failed = True
+        return self._db
+
+    def get(self, key: str) -> Optional[str]:
+        """Return the cached value if one exists and is within the TTL."""
+        now = time.time()
+        with self._lock:
+            cached = self._memory.get(key)
+            if cached is not None:
+                if now - cached[0] < self.ttl:
+                    self._memory.move_to_end(key)
+                    return cached[1]
+                del self._memory[key]
+
+            db = self._get_db()
+            if db is None:
+                return None
+            try:
+                row = db.execute(
+                    f"SELECT created, content FROM {self.table} WHERE key = ?", (key,)
+                ).fetchone()
+            except sqlite3.Error as e:
+                logger.warning("Cache lookup failed for %s: %s", self.table, e)
+                return None
+            if row is None:
+                return None
+            if now - row[0] < self.ttl:
+                self._remember(key, row[0], row[1])
+                return row[1]
+            try:
+                with db:
+                    db.execute(f"DELETE FROM {self.table} WHERE key = ?", (key,))
+            except sqlite3.Error as e:
+                logger.warning("Cache cleanup failed for %s: %s", self.table, e)
+        return None
+
+    def set(self, key: str, content: str):
+        """Store a value in memory and, when available, on disk."""
+        created = time.time()
+        with self._lock:
+            self._remember(key, created, content)
+
+            db = self._get_db()
+            if db is not None:
+                try:
+                    with db:
+                        db.execute(
+                            f"INSERT OR REPLACE INTO {self.table} (key, created, content) VALUES (?, ?, ?)",
+                            (key, created, content)
+                        )
+                except sqlite3.Error as e:
+                    logger.warning("Cache write failed for %s: %s", self.table, e)
+
+    def close(self):
+        """Close the database; it is reopened on next use."""
+        with self._lock:
+            if self._db is not None:
+                self._db.close()
+                self._db = None
+
+    def __len__(self) -> int:
+        return len(self._memory)
+
+    def _remember(self, key: str, created: float, content: str):
+        """Insert into the in-memory LRU, evicting the oldest entry when full."""
+        self._memory[key] = (created, content)
+        self._memory.move_to_end(key)
+        if len(self._memory) > self.maxsize:
+            self._memory.popitem(last=False)
@@ -0,0 +1,64 @@
+"""
+Web assets shared by the FastAPI entrypoints
+
+main.py, main_working.py and debug_main.py serve the same templates and
+static files; the paths and the chat script version live here so the three
+servers always render the same page.
+"""
+
+import hashlib
+import os
+from typing import Optional
+
+# Asset directories are resolved once, relative to the repo rather than the CWD
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.realpath(__file__)))
+STATIC_DIR = os.path.join(BASE_DIR, "static")
+TEMPLATES_DIR = os.path.join(BASE_DIR, "templates")
+
+
+def asset_version(*parts: str) -> str:
+    """Short content hash of a static file, or "0" if it is missing"""
+    try:
+        with open(os.path.join(STATIC_DIR, *parts), "rb") as f:
+            return hashlib.md5(f.read()).hexdigest()[:12]
+    except OSError:
+        return "0"
+
+
+# The chat script is referenced by content hash, so browsers fetch it once per deploy
+CHAT_JS_VERSION = asset_version("js", "chat.js")
+
+# Template context for every page that loads the chat script
+CHAT_PAGE_CONTEXT = {"chat_js_version": CHAT_JS_VERSION}
+
+
+def select_encoding(accept_encoding: str, available) -> Optional[str]:
+    """Content coding to send for an Accept-Encoding header, or None for identity
+
+    `available` lists the server's codings in order of preference; the client's
+    q-values decide first. Codings with q=0 are refused, and "*" covers any
+    coding the header doesn't name.
+    """
+    qualities = {}
+    for part in accept_encoding.split(','):
+        name, _, params = part.partition(';')
+        name = name.strip().lower()
+        if not name:
+            continue
+        quality = 1.0
+        for param in params.split(';'):
+            key, _, value = param.strip().partition('=')
+            if key.strip().lower() == 'q':
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        qualities[name] = quality
+    
+    default = qualities.get('*', 0.0)
+    best, best_quality = None, 0.0
+    for encoding in available:
+        quality = qualities.get(encoding, default)
+        if quality > best_quality:
+            best, best_quality = encoding, quality
+    return best
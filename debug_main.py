@@ -4,15 +4,20 @@ Simple FastAPI test to debug the blank page issue
 
 from fastapi import FastAPI, Request
 from fastapi.responses import HTMLResponse
+from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
 import os
 
+from core.web_assets import CHAT_PAGE_CONTEXT, STATIC_DIR, TEMPLATES_DIR
+
 app = FastAPI(title="Design Review API - Debug", version="1.0.0")
 
 # Create directories if they don't exist
-os.makedirs("templates", exist_ok=True)
+os.makedirs(STATIC_DIR, exist_ok=True)
+os.makedirs(TEMPLATES_DIR, exist_ok=True)
 
-templates = Jinja2Templates(directory="templates")
+app.mount("/static", StaticFiles(directory=STATIC_DIR), name="static")
+templates = Jinja2Templates(directory=TEMPLATES_DIR)
 
 @app.get("/")
 async def root():
@@ -23,7 +28,7 @@ async def root():
 async def test_template(request: Request):
     """Test template rendering"""
     try:
-        return templates.TemplateResponse(request, "index.html")
+        return templates.TemplateResponse(request, "index.html", {**CHAT_PAGE_CONTEXT})
     except Exception as e:
         return HTMLResponse(content=f"""
         <!DOCTYPE html>
@@ -32,8 +37,8 @@ async def test_template(request: Request):
         <body>
             <h1>Template Test</h1>
             <p>Error: {str(e)}</p>
-            <p>Looking for template at: {os.path.abspath('templates/index.html')}</p>
-            <p>Template exists: {os.path.exists('templates/index.html')}</p>
+            <p>Looking for template at: {os.path.join(TEMPLATES_DIR, 'index.html')}</p>
+            <p>Template exists: {os.path.exists(os.path.join(TEMPLATES_DIR, 'index.html'))}</p>
         </body>
         </html>
         """)
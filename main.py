@@ -6,53 +6,150 @@ FastAPI Design Review App
 """
 
 from fastapi import FastAPI, File, UploadFile, Form, Request
-from fastapi.responses import HTMLResponse, JSONResponse
+from fastapi.responses import HTMLResponse, Response, StreamingResponse
 from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
 from pydantic import BaseModel
-import base64
+import gzip
+import hashlib
+import io
+import json
 import os
 from typing import Optional
+from urllib.parse import parse_qs
 from dotenv import load_dotenv
+from contextlib import asynccontextmanager
 import asyncio
+import threading
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    orjson = None
+    ORJSON_AVAILABLE = False
+
+try:
+    from markupsafe import escape as markupsafe_escape
+    MARKUPSAFE_AVAILABLE = True
+except ImportError:
+    import html
+    markupsafe_escape = None
+    MARKUPSAFE_AVAILABLE = False
+
+try:
+    import minify_html
+    MINIFY_HTML_AVAILABLE = True
+except ImportError:
+    minify_html = None
+    MINIFY_HTML_AVAILABLE = False
 
 # Import your existing enhanced system
 from agents.enhanced_system import EnhancedDesignReviewSystem
+from core.web_assets import CHAT_PAGE_CONTEXT, STATIC_DIR, TEMPLATES_DIR, select_encoding
 
 # Load environment
 load_dotenv()
 
-app = FastAPI(title="Design Review API", version="1.0.0")
+# Shared HTTP session for MCP calls, so each chat request reuses pooled
+# keep-alive connections instead of opening a new TLS connection per call
+mcp_session = None
+mcp_session_loop = None
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Close the shared MCP session on shutdown"""
+    yield
+    if mcp_session is not None and not mcp_session.closed:
+        await mcp_session.close()
+
+app = FastAPI(title="Design Review API", version="1.0.0", lifespan=lifespan)
 
 # Create directories if they don't exist
-os.makedirs("static", exist_ok=True)
-os.makedirs("templates", exist_ok=True)
+os.makedirs(STATIC_DIR, exist_ok=True)
+os.makedirs(TEMPLATES_DIR, exist_ok=True)
+
+class VersionedStaticFiles(StaticFiles):
+    """Static files; URLs pinned to a content version are cached as immutable"""
+    
+    def file_response(self, full_path, stat_result, scope, status_code=200):
+        response = super().file_response(full_path, stat_result, scope, status_code)
+        if parse_qs(scope["query_string"]).get(b"v"):
+            response.headers["Cache-Control"] = "public, max-age=31536000, immutable"
+        return response
 
 # Mount static files and templates
-app.mount("/static", StaticFiles(directory="static"), name="static")
-templates = Jinja2Templates(directory="templates")
+app.mount("/static", VersionedStaticFiles(directory=STATIC_DIR), name="static")
+templates = Jinja2Templates(directory=TEMPLATES_DIR)
 
 # Initialize your existing enhanced system
 enhanced_system = None
+enhanced_system_lock = threading.Lock()
 
 def get_enhanced_system():
     """Get or initialize the enhanced system"""
     global enhanced_system
-    if enhanced_system is None:
-        enhanced_system = EnhancedDesignReviewSystem(
-            openai_api_key=os.getenv('OPENAI_API_KEY'),
-            exa_api_key=os.getenv('EXA_API_KEY'),
-            learning_enabled=True,
-            company_context={
-                "industry": "Streaming/Entertainment",
-                "company_stage": "Growth", 
-                "primary_metrics": ["User Engagement", "Content Discovery", "Revenue"],
-                "target_audience": "TV viewers, families, cord-cutters",
-                "competitive_position": "Premium streaming platform"
-            }
-        )
+    if enhanced_system is not None:
+        return enhanced_system
+    with enhanced_system_lock:
+        if enhanced_system is None:
+            enhanced_system = EnhancedDesignReviewSystem(
+                openai_api_key=os.getenv('OPENAI_API_KEY'),
+                exa_api_key=os.getenv('EXA_API_KEY'),
+                learning_enabled=True,
+                company_context={
+                    "industry": "Streaming/Entertainment",
+                    "company_stage": "Growth", 
+                    "primary_metrics": ["User Engagement", "Content Discovery", "Revenue"],
+                    "target_audience": "TV viewers, families, cord-cutters",
+                    "competitive_position": "Premium streaming platform"
+                }
+            )
     return enhanced_system
 
+# Single-file design reviewer, for streamed reviews
+design_reviewer = None
+
+def get_design_reviewer():
+    """Get or initialize the design reviewer"""
+    from agents.design_reviewer import DesignReviewAgent
+    
+    global design_reviewer
+    if design_reviewer is None:
+        design_reviewer = DesignReviewAgent()
+    return design_reviewer
+
+# Rendered chat page variants, plain and gzipped; the page has no per-request
+# state, so one render and one compression serve every hit
+home_page = None
+
+def get_home_page():
+    """Get or render the chat page as (plain, gzip) variants of (body, ETag, headers)"""
+    global home_page
+    if home_page is None:
+        page = templates.get_template("index.html").render(CHAT_PAGE_CONTEXT)
+        if MINIFY_HTML_AVAILABLE:
+            page = minify_html.minify(page, minify_js=True, minify_css=True)
+        body = page.encode()
+        digest = hashlib.blake2b(body, digest_size=16).hexdigest()
+        etag, gzip_etag = f'"{digest}"', f'"{digest}-gz"'
+        home_page = (
+            (body, etag, {**HOME_PAGE_HEADERS, "ETag": etag}),
+            (
+                gzip.compress(body, compresslevel=9, mtime=0),
+                gzip_etag,
+                {**HOME_PAGE_HEADERS, "ETag": gzip_etag, "Content-Encoding": "gzip"},
+            ),
+        )
+    return home_page
+
+async def get_enhanced_system_async():
+    """Get the enhanced system without blocking the event loop on first use"""
+    if enhanced_system is not None:
+        return enhanced_system
+    # Building the agents and loading learning data is slow, synchronous work
+    return await asyncio.to_thread(get_enhanced_system)
+
 # Pydantic models for request/response
 class ChatMessage(BaseModel):
     message: str
@@ -73,11 +170,39 @@ class ChatResponse(BaseModel):
     response: str
     type: str = "assistant"
 
+class UploadResponse(BaseModel):
+    filename: str
+    content_type: str
+    size: int
+    message: str
+
+class HealthResponse(BaseModel):
+    status: str
+    service: str
+
+SUPPORTED_UPLOAD_TYPES = ("image/png", "image/jpeg", "image/jpg", "application/pdf")
+# The rejection is identical every time, so it is encoded once
+UNSUPPORTED_UPLOAD_BODY = json.dumps(
+    {"error": "Only PNG, JPG, and PDF files are supported"}, separators=(",", ":")
+).encode()
+
+def get_mcp_session():
+    """Get the shared MCP session, creating it for the running event loop"""
+    import aiohttp
+    
+    global mcp_session, mcp_session_loop
+    loop = asyncio.get_running_loop()
+    if mcp_session is None or mcp_session.closed or mcp_session_loop is not loop:
+        mcp_session_loop = loop
+        mcp_session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit=32, keepalive_timeout=60),
+            timeout=aiohttp.ClientTimeout(total=30)
+        )
+    return mcp_session
+
 # MCP Integration for Knowledge Graph
 async def call_mcp_tool(tool_name: str, parameters: dict, needs_auth: bool = False):
     """Call your Knowledge Graph MCP"""
-    import aiohttp
-    
     url = "https://cloudflare-mcp-server.madetoenvy-llc.workers.dev/execute"
     headers = {"Content-Type": "application/json"}
     
@@ -90,21 +215,26 @@ async def call_mcp_tool(tool_name: str, parameters: dict, needs_auth: bool = Fal
     }
     
     try:
-        async with aiohttp.ClientSession() as session:
-            async with session.post(url, json=payload, headers=headers) as response:
-                if response.status == 200:
-                    return await response.json()
-                else:
-                    return {"error": f"MCP call failed with status {response.status}"}
+        async with get_mcp_session().post(url, json=payload, headers=headers) as response:
+            if response.status == 200:
+                return await response.json()
+            else:
+                return {"error": f"MCP call failed with status {response.status}"}
     except Exception as e:
         return {"error": f"MCP call failed: {str(e)}"}
 
 # Smart response function using existing enhanced system + MCP
+def escape_html(text: str) -> str:
+    """Escape user text before it is spliced into a reply rendered as HTML"""
+    if MARKUPSAFE_AVAILABLE:
+        return str(markupsafe_escape(text))
+    return html.escape(text)
+
 async def get_smart_response(prompt: str, has_file: bool = False, filename: str = None) -> str:
     """Generate intelligent response using enhanced system + MCP knowledge"""
     
     # Get the enhanced system
-    system = get_enhanced_system()
+    system = await get_enhanced_system_async()
     
     # First, search existing knowledge in MCP
     knowledge_search = await call_mcp_tool("search_knowledge", {
@@ -114,6 +244,9 @@ async def get_smart_response(prompt: str, has_file: bool = False, filename: str
     
     # Check if this is a file analysis request
     if has_file and filename:
+        # The chat page renders replies as HTML, so the name is escaped for display
+        display_name = escape_html(filename)
+        
         # Store the design asset in knowledge graph
         store_result = await call_mcp_tool("store_design_asset", {
             "title": f"Design Analysis: {filename}",
@@ -134,7 +267,7 @@ async def get_smart_response(prompt: str, has_file: bool = False, filename: str
             if 'orchestrated_review' in review_result:
                 orchestrated = review_result['orchestrated_review']
                 
-                response = f"""🔍 **Analyzing '{filename}' with multi-agent review system...**
+                response = f"""🔍 **Analyzing '{display_name}' with multi-agent review system...**
 
 **🤖 Agent Analysis Results:**
 - **Overall Score:** {orchestrated.overall_score}/10
@@ -161,9 +294,9 @@ async def get_smart_response(prompt: str, has_file: bool = False, filename: str
         except Exception as e:
             print(f"Enhanced system error: {e}")
             # Fallback response
-            return f"""🔍 **Analyzing '{filename}'...**
+            return f"""🔍 **Analyzing '{display_name}'...**
 
-**File processed successfully!** I can see this is a {filename.split('.')[-1].upper()} file.
+**File processed successfully!** I can see this is a {escape_html(filename.split('.')[-1].upper())} file.
 
 **🧠 What I'm checking:**
 - Design principles and composition
@@ -305,34 +438,48 @@ All insights are automatically stored in your knowledge base!"""
 
 *Building smarter responses through team-specific knowledge...*"""
 
-# Routes
-@app.get("/", response_class=HTMLResponse)
-async def home(request: Request):
-    """Serve the main chat interface"""
-    try:
-        response = templates.TemplateResponse(request, "index.html")
-        # Add cache-busting headers
-        response.headers["Cache-Control"] = "no-cache, no-store, must-revalidate"
-        response.headers["Pragma"] = "no-cache"
-        response.headers["Expires"] = "0"
-        return response
-    except Exception as e:
-        # Enhanced fallback if template fails
-        print(f"Template error: {e}")
-        return HTMLResponse(content="""
+# The chat page is revalidated on every visit; its ETag lets unchanged copies
+# be answered with 304 Not Modified
+HOME_PAGE_HEADERS = {
+    "Cache-Control": "no-cache",
+    "Pragma": "no-cache",
+    "Vary": "Accept-Encoding",
+}
+
+# Page shown while the chat template can't be rendered; it reloads itself until it can
+FALLBACK_PAGE = """
         <!DOCTYPE html>
         <html>
         <head><title>Design Review Chat - Loading...</title></head>
         <body>
             <h1>🎨 Design Review Chat</h1>
-            <p>System initializing... Template error: """ + str(e) + """</p>
+            <p>System initializing... Template error: __ERROR__</p>
             <p><a href="/docs">API Documentation</a></p>
             <script>
                 setTimeout(() => window.location.reload(), 2000);
             </script>
         </body>
         </html>
-        """, status_code=200)
+        """.encode()
+
+# Routes
+@app.get("/", response_class=HTMLResponse)
+async def home(request: Request):
+    """Serve the main chat interface"""
+    try:
+        plain, gzipped = get_home_page()
+        accept_encoding = request.headers.get("accept-encoding", "")
+        body, etag, headers = gzipped if select_encoding(accept_encoding, ("gzip",)) else plain
+        if etag in request.headers.get("if-none-match", ""):
+            return Response(status_code=304, headers={**HOME_PAGE_HEADERS, "ETag": etag})
+        return HTMLResponse(content=body, headers=headers)
+    except Exception as e:
+        # Enhanced fallback if template fails
+        print(f"Template error: {e}")
+        return HTMLResponse(
+            content=FALLBACK_PAGE.replace(b"__ERROR__", escape_html(str(e)).encode()),
+            headers=HOME_PAGE_HEADERS,
+        )
 
 @app.post("/api/chat", response_model=ChatResponse)
 async def chat_endpoint(chat_message: ChatMessage):
@@ -344,18 +491,16 @@ async def chat_endpoint(chat_message: ChatMessage):
     )
     return ChatResponse(response=response)
 
-@app.post("/api/upload")
+@app.post("/api/upload", response_model=UploadResponse)
 async def upload_file(file: UploadFile = File(...)):
     """Handle file uploads"""
-    if file.content_type not in ["image/png", "image/jpeg", "image/jpg", "application/pdf"]:
-        return JSONResponse(
-            status_code=400, 
-            content={"error": "Only PNG, JPG, and PDF files are supported"}
+    if file.content_type not in SUPPORTED_UPLOAD_TYPES:
+        return Response(
+            content=UNSUPPORTED_UPLOAD_BODY, status_code=400, media_type="application/json"
         )
     
-    # Process the file (convert to base64 for future use)
+    # Nothing consumes the content yet, so only its size is reported
     contents = await file.read()
-    base64_content = base64.b64encode(contents).decode()
     
     return {
         "filename": file.filename,
@@ -364,10 +509,67 @@ async def upload_file(file: UploadFile = File(...)):
         "message": f"Successfully uploaded {file.filename}"
     }
 
-@app.get("/health")
+def sse_event(payload: dict) -> bytes:
+    """Encode one server-sent event carrying a JSON payload"""
+    if ORJSON_AVAILABLE:
+        return b"data: " + orjson.dumps(payload) + b"\n\n"
+    return f"data: {json.dumps(payload, separators=(',', ':'))}\n\n".encode()
+
+# Failed reviews share one event skeleton; only the message is escaped per error
+SSE_REVIEW_ERROR = b'data: {"error":"Failed to analyze design: __MSG__"}\n\n'
+
+def sse_review_error(error: Exception) -> bytes:
+    """Encode a review failure event by splicing the escaped message into the skeleton"""
+    if ORJSON_AVAILABLE:
+        message = orjson.dumps(str(error))[1:-1]
+    else:
+        message = json.dumps(str(error))[1:-1].encode()
+    return SSE_REVIEW_ERROR.replace(b"__MSG__", message)
+
+@app.post("/api/review/stream")
+async def stream_review(
+    file: UploadFile = File(...),
+    review_type: str = Form("General Design"),
+    detail_level: int = Form(3),
+    include_suggestions: bool = Form(True)
+):
+    """Review an uploaded design, streaming the review as server-sent events"""
+    if file.content_type not in SUPPORTED_UPLOAD_TYPES:
+        return Response(
+            content=UNSUPPORTED_UPLOAD_BODY, status_code=400, media_type="application/json"
+        )
+    
+    upload = io.BytesIO(await file.read())
+    upload.name = file.filename
+    upload.type = file.content_type
+    # Importing and building the reviewer is slow on first use
+    reviewer = design_reviewer or await asyncio.to_thread(get_design_reviewer)
+    
+    def events():
+        # Each piece of review text goes out as soon as the model produces it
+        try:
+            for delta in reviewer.stream_review_design(
+                upload, review_type, detail_level, include_suggestions
+            ):
+                yield sse_event({"delta": delta})
+        except Exception as e:
+            yield sse_review_error(e)
+        yield b"data: [DONE]\n\n"
+    
+    # A sync generator is iterated in the threadpool, keeping the loop free
+    return StreamingResponse(
+        events(), 
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+# The health payload never changes, so it is serialized once
+HEALTH_RESPONSE_BODY = HealthResponse(status="healthy", service="design-review-api").model_dump_json().encode()
+
+@app.get("/health", response_model=HealthResponse)
 async def health_check():
     """Health check endpoint"""
-    return {"status": "healthy", "service": "design-review-api"}
+    return Response(content=HEALTH_RESPONSE_BODY, media_type="application/json")
 
 if __name__ == "__main__":
     import uvicorn
@@ -6,28 +6,32 @@ FastAPI Design Review App - Working Version
 """
 
 from fastapi import FastAPI, File, UploadFile, Form, Request
-from fastapi.responses import HTMLResponse, JSONResponse
+from fastapi.responses import HTMLResponse, Response
 from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
 from pydantic import BaseModel
 import base64
+import json
 import os
 from typing import Optional
 from dotenv import load_dotenv
 import asyncio
 
+from core.web_assets import CHAT_PAGE_CONTEXT, STATIC_DIR, TEMPLATES_DIR
+
 # Load environment
 load_dotenv()
 
 app = FastAPI(title="Design Review API", version="1.0.0")
 
 # Create directories if they don't exist
-os.makedirs("static", exist_ok=True)
-os.makedirs("templates", exist_ok=True)
+os.makedirs(STATIC_DIR, exist_ok=True)
+os.makedirs(TEMPLATES_DIR, exist_ok=True)
 
 # Mount static files and templates
-app.mount("/static", StaticFiles(directory="static"), name="static")
-templates = Jinja2Templates(directory="templates")
+app.mount("/static", StaticFiles(directory=STATIC_DIR), name="static")
+templates = Jinja2Templates(directory=TEMPLATES_DIR)
+TEMPLATE_PATH = os.path.join(TEMPLATES_DIR, "index.html")
 
 # Pydantic models for request/response
 class ChatMessage(BaseModel):
@@ -241,9 +245,7 @@ Help us learn more about your team's needs in this area. The more context you pr
 async def home():
     """Serve the main chat interface"""
     try:
-        # Read template file directly to avoid Jinja2 issues
-        with open("templates/index.html", "r", encoding="utf-8") as f:
-            html_content = f.read()
+        html_content = templates.get_template("index.html").render(CHAT_PAGE_CONTEXT)
         
         response = HTMLResponse(content=html_content)
         # Add cache-busting headers
@@ -261,8 +263,8 @@ async def home():
         <body>
             <h1>🎨 Design Review Agent System</h1>
             <p>Template error: {str(e)}</p>
-            <p>Template path: {os.path.abspath('templates/index.html')}</p>
-            <p>Template exists: {os.path.exists('templates/index.html')}</p>
+            <p>Template path: {TEMPLATE_PATH}</p>
+            <p>Template exists: {os.path.exists(TEMPLATE_PATH)}</p>
             <p><a href="/docs">API Documentation</a></p>
         </body>
         </html>
@@ -278,13 +280,17 @@ async def chat_endpoint(chat_message: ChatMessage):
     )
     return ChatResponse(response=response)
 
+# The rejection is identical every time, so it is encoded once
+UNSUPPORTED_UPLOAD_BODY = json.dumps(
+    {"error": "Only PNG, JPG, and PDF files are supported"}, separators=(",", ":")
+).encode()
+
 @app.post("/api/upload")
 async def upload_file(file: UploadFile = File(...)):
     """Handle file uploads"""
     if file.content_type not in ["image/png", "image/jpeg", "image/jpg", "application/pdf"]:
-        return JSONResponse(
-            status_code=400, 
-            content={"error": "Only PNG, JPG, and PDF files are supported"}
+        return Response(
+            content=UNSUPPORTED_UPLOAD_BODY, status_code=400, media_type="application/json"
         )
     
     # Process the file (convert to base64 for future use)
@@ -305,10 +311,14 @@ async def upload_file(file: UploadFile = File(...)):
         "message": f"Successfully uploaded {file.filename} and stored in knowledge base"
     }
 
+HEALTH_RESPONSE_BODY = json.dumps(
+    {"status": "healthy", "service": "design-review-api"}, separators=(",", ":")
+).encode()
+
 @app.get("/health")
 async def health_check():
     """Health check endpoint"""
-    return {"status": "healthy", "service": "design-review-api"}
+    return Response(content=HEALTH_RESPONSE_BODY, media_type="application/json")
 
 if __name__ == "__main__":
     import uvicorn
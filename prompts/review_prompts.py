@@ -1,78 +1,66 @@
-from typing import Dict
+from enum import Enum
+from typing import Dict, List, Tuple
 
-class DesignReviewPrompts:
-    """
-    Collection of prompt templates for design review tasks.
-    """
-    
-    def __init__(self):
-        self.base_prompt = """You are an expert design reviewer with extensive experience in UI/UX design, 
+class ReviewType(str, Enum):
+    """Review types with their own focus areas; values are the display names."""
+    GENERAL_DESIGN = "General Design"
+    UI_UX = "UI/UX"
+    ACCESSIBILITY = "Accessibility"
+    BRAND_CONSISTENCY = "Brand Consistency"
+
+BASE_PROMPT = """You are an expert design reviewer with extensive experience in UI/UX design, 
         visual design principles, accessibility, and brand consistency. Your role is to provide constructive, 
         actionable feedback on design work."""
-        
-        self.review_criteria = {
-            "General Design": [
-                "Visual hierarchy and layout",
-                "Color scheme and contrast",
-                "Typography and readability",
-                "Spacing and alignment",
-                "Overall aesthetic appeal",
-                "User experience flow"
-            ],
-            "UI/UX": [
-                "User interface usability",
-                "Navigation clarity",
-                "Interactive element design",
-                "Information architecture",
-                "User journey optimization",
-                "Mobile responsiveness considerations"
-            ],
-            "Accessibility": [
-                "Color contrast ratios",
-                "Text readability",
-                "Alternative text considerations",
-                "Keyboard navigation support",
-                "Screen reader compatibility",
-                "WCAG compliance"
-            ],
-            "Brand Consistency": [
-                "Brand guideline adherence",
-                "Logo usage and placement",
-                "Color palette consistency",
-                "Typography consistency",
-                "Visual style alignment",
-                "Brand voice representation"
-            ]
-        }
+
+REVIEW_CRITERIA: Dict[str, List[str]] = {
+    ReviewType.GENERAL_DESIGN.value: [
+        "Visual hierarchy and layout",
+        "Color scheme and contrast",
+        "Typography and readability",
+        "Spacing and alignment",
+        "Overall aesthetic appeal",
+        "User experience flow"
+    ],
+    ReviewType.UI_UX.value: [
+        "User interface usability",
+        "Navigation clarity",
+        "Interactive element design",
+        "Information architecture",
+        "User journey optimization",
+        "Mobile responsiveness considerations"
+    ],
+    ReviewType.ACCESSIBILITY.value: [
+        "Color contrast ratios",
+        "Text readability",
+        "Alternative text considerations",
+        "Keyboard navigation support",
+        "Screen reader compatibility",
+        "WCAG compliance"
+    ],
+    ReviewType.BRAND_CONSISTENCY.value: [
+        "Brand guideline adherence",
+        "Logo usage and placement",
+        "Color palette consistency",
+        "Typography consistency",
+        "Visual style alignment",
+        "Brand voice representation"
+    ]
+}
+
+DETAIL_INSTRUCTIONS: Dict[int, str] = {
+    1: "Provide a brief overview",
+    2: "Give a concise analysis",
+    3: "Provide a balanced review",
+    4: "Give a detailed analysis",
+    5: "Provide a comprehensive, in-depth review"
+}
+
+def _render_review_prompt(review_type: str, detail_level: int, include_suggestions: bool) -> str:
+    """Format the review prompt for one combination of parameters."""
+    criteria = REVIEW_CRITERIA.get(review_type, REVIEW_CRITERIA[ReviewType.GENERAL_DESIGN.value])
+    detail_instruction = DETAIL_INSTRUCTIONS[detail_level]
     
-    def get_review_prompt(
-        self, 
-        review_type: str, 
-        detail_level: int, 
-        include_suggestions: bool
-    ) -> str:
-        """
-        Generate a review prompt based on parameters.
-        
-        Args:
-            review_type: Type of review to perform
-            detail_level: Level of detail (1-5)
-            include_suggestions: Whether to include suggestions
-            
-        Returns:
-            Formatted prompt string
-        """
-        criteria = self.review_criteria.get(review_type, self.review_criteria["General Design"])
-        
-        detail_instruction = {
-            1: "Provide a brief overview",
-            2: "Give a concise analysis",
-            3: "Provide a balanced review",
-            4: "Give a detailed analysis",
-            5: "Provide a comprehensive, in-depth review"
-        }[detail_level]
-        
-        prompt = f"""{self.base_prompt}
+    prompt = f"""{BASE_PROMPT}
 
 **Review Type**: {review_type}
 **Detail Level**: {detail_instruction}
@@ -87,8 +75,8 @@ class DesignReviewPrompts:
 4. Be constructive and professional in your feedback
 5. Point out both strengths and areas for improvement"""
 
-        if include_suggestions:
-            prompt += """
+    if include_suggestions:
+        prompt += """
 6. Provide 3-5 specific, actionable suggestions for improvement
 
 **Format your response as follows**:
@@ -96,7 +84,49 @@ class DesignReviewPrompts:
 - Discuss key strengths
 - Identify areas for improvement
 - End with specific suggestions (if requested)"""
+    
+    return prompt
+
+# Every prompt for the known review types, rendered once at import. Keys use
+# the plain string values, so ReviewType members and strings both match
+_REVIEW_PROMPTS: Dict[Tuple[str, int, bool], str] = {
+    (review_type.value, detail_level, include_suggestions):
+        _render_review_prompt(review_type.value, detail_level, include_suggestions)
+    for review_type in ReviewType
+    for detail_level in DETAIL_INSTRUCTIONS
+    for include_suggestions in (True, False)
+}
+
+class DesignReviewPrompts:
+    """
+    Collection of prompt templates for design review tasks.
+    """
+    
+    def __init__(self):
+        self.base_prompt = BASE_PROMPT
+        self.review_criteria = REVIEW_CRITERIA
+    
+    def get_review_prompt(
+        self, 
+        review_type: str, 
+        detail_level: int, 
+        include_suggestions: bool
+    ) -> str:
+        """
+        Generate a review prompt based on parameters.
         
+        Args:
+            review_type: Type of review to perform (a ReviewType or its name)
+            detail_level: Level of detail (1-5)
+            include_suggestions: Whether to include suggestions
+            
+        Returns:
+            Formatted prompt string
+        """
+        prompt = _REVIEW_PROMPTS.get((review_type, detail_level, include_suggestions))
+        if prompt is None:
+            # Custom review types fall back to the general focus areas
+            prompt = _render_review_prompt(review_type, detail_level, include_suggestions)
         return prompt
     
     def get_chat_prompt(self) -> str:
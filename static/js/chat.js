@@ -0,0 +1,148 @@
+// Sidebar toggle functionality
+document.getElementById('sidebarToggle').addEventListener('click', function() {
+    const sidebar = document.getElementById('sidebar');
+    const content = document.getElementById('content');
+
+    sidebar.classList.toggle('hidden');
+    content.classList.toggle('expanded');
+});
+
+// Chat functionality
+document.getElementById('sendButton').addEventListener('click', sendMessage);
+document.getElementById('chatInput').addEventListener('keypress', function(e) {
+    if (e.key === 'Enter') {
+        sendMessage();
+    }
+});
+
+const thinkingMessages = [
+    "🎯 Margo is assembling the team...",
+    "🔬 UX Researcher analyzing user patterns...",
+    "🎨 Creative Director evaluating visual hierarchy...", 
+    "🚀 Product Strategist considering market impact...",
+    "♿ Accessibility Expert checking compliance standards...",
+    "🔍 Quality Analyst validating design consistency...",
+    "🌐 Research AI gathering latest industry insights...",
+    "🧠 Accessing knowledge graph for relevant patterns...",
+    "💡 Team synthesizing multi-perspective analysis...",
+    "📝 Preparing comprehensive design intelligence report..."
+];
+
+async function sendMessage() {
+    const input = document.getElementById('chatInput');
+    const message = input.value.trim();
+
+    if (!message) return;
+
+    // Add user message
+    addMessage(message, 'user');
+    input.value = '';
+
+    // Show enhanced thinking process
+    showEnhancedThinking();
+
+    try {
+        const response = await fetch('/api/chat', {
+            method: 'POST',
+            headers: {
+                'Content-Type': 'application/json',
+            },
+            body: JSON.stringify({
+                message: message,
+                has_file: false,
+                filename: null
+            })
+        });
+
+        const result = await response.json();
+
+        // Hide thinking indicator
+        hideThinking();
+
+        // Add assistant response with enhanced formatting
+        addMessage(result.response, 'assistant');
+
+        // Show knowledge expansion notification
+        if (Math.random() > 0.7) { // 30% chance
+            setTimeout(() => {
+                addMessage("✨ This conversation has been logged for knowledge base expansion and team learning optimization.", 'thinking');
+            }, 1000);
+        }
+
+    } catch (error) {
+        hideThinking();
+        addMessage(`❌ System Error: ${error.message}`, 'assistant');
+    }
+}
+
+function showEnhancedThinking() {
+    const indicator = document.getElementById('thinkingIndicator');
+    const textElement = document.getElementById('thinkingText');
+
+    let messageIndex = 0;
+    indicator.style.display = 'flex';
+
+    // Cycle through thinking messages
+    const thinkingInterval = setInterval(() => {
+        if (messageIndex < thinkingMessages.length) {
+            textElement.textContent = thinkingMessages[messageIndex];
+            messageIndex++;
+        } else {
+            clearInterval(thinkingInterval);
+        }
+    }, 800);
+
+    // Store interval for cleanup
+    indicator.dataset.interval = thinkingInterval;
+}
+
+// Message headers never change, so build each one once
+const MESSAGE_HEADERS = {
+    'user': '👤 You',
+    'assistant': '🤖 AI Design Team',
+    'thinking': '💭 System Intelligence'
+};
+
+// Agent labels and their highlight colours, matched in a single pass
+const AGENT_COLORS = {
+    '🎯 Margo:': '#667eea',
+    '🎨 Creative Director:': '#764ba2',
+    '🔬 UX Researcher:': '#10b981',
+    '🚀 Product Strategist:': '#f59e0b',
+    '♿ Accessibility Expert:': '#ef4444',
+    '🔍 Quality Analyst:': '#8b5cf6',
+    '🌐 Research AI:': '#06b6d4'
+};
+const AGENT_LABEL_PATTERN = new RegExp(Object.keys(AGENT_COLORS).join('|'), 'gu');
+
+function addMessage(content, type) {
+    const messagesContainer = document.getElementById('chatMessages');
+    const messageDiv = document.createElement('div');
+    messageDiv.className = `message ${type}`;
+
+    // Enhanced content formatting
+    const formattedContent = content
+        .replace(/\*\*(.*?)\*\*/g, '<strong>$1</strong>')
+        .replace(/\*(.*?)\*/g, '<em>$1</em>')
+        .replace(/\n/g, '<br>')
+        .replace(AGENT_LABEL_PATTERN, label => `<strong style="color: ${AGENT_COLORS[label]};">${label}</strong>`);
+
+    messageDiv.innerHTML = `
+        <div class="message-header">
+            ${MESSAGE_HEADERS[type]}
+        </div>
+        <div>${formattedContent}</div>
+    `;
+
+    messagesContainer.appendChild(messageDiv);
+    messagesContainer.scrollTop = messagesContainer.scrollHeight;
+}
+
+function hideThinking() {
+    const indicator = document.getElementById('thinkingIndicator');
+    const interval = indicator.dataset.interval;
+    if (interval) {
+        clearInterval(parseInt(interval));
+    }
+    indicator.style.display = 'none';
+}
@@ -1,57 +1,148 @@
 """
 Simple server for deployment that runs the Streamlit app
 """
-from http.server import BaseHTTPRequestHandler
-import subprocess
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import gzip
 import os
 
-class handler(BaseHTTPRequestHandler):
-    def do_GET(self):
-        self.send_response(200)
-        self.send_header('Content-type', 'text/html')
-        self.end_headers()
+from core.web_assets import select_encoding
+
+try:
+    import minify_html
+    MINIFY_HTML_AVAILABLE = True
+except ImportError:
+    minify_html = None
+    MINIFY_HTML_AVAILABLE = False
+
+# The page is static, so minify and encode it once at import
+_HTML = """
+<!DOCTYPE html>
+<html>
+<head>
+    <title>Design Review App</title>
+    <style>
+        body { 
+            font-family: Arial, sans-serif; 
+            max-width: 800px; 
+            margin: 50px auto; 
+            padding: 20px;
+            text-align: center;
+        }
+        .card {
+            background: #f9f9f9;
+            padding: 30px;
+            border-radius: 10px;
+            margin: 20px 0;
+        }
+    </style>
+</head>
+<body>
+    <h1>🎨 Design Review App</h1>
+    <div class="card">
+        <h2>App is Running!</h2>
+        <p>This is your simplified design review application.</p>
+        <p>Upload designs and get feedback through a clean chat interface.</p>
         
-        html = """
-        <!DOCTYPE html>
-        <html>
-        <head>
-            <title>Design Review App</title>
-            <style>
-                body { 
-                    font-family: Arial, sans-serif; 
-                    max-width: 800px; 
-                    margin: 50px auto; 
-                    padding: 20px;
-                    text-align: center;
-                }
-                .card {
-                    background: #f9f9f9;
-                    padding: 30px;
-                    border-radius: 10px;
-                    margin: 20px 0;
-                }
-            </style>
-        </head>
-        <body>
-            <h1>🎨 Design Review App</h1>
-            <div class="card">
-                <h2>App is Running!</h2>
-                <p>This is your simplified design review application.</p>
-                <p>Upload designs and get feedback through a clean chat interface.</p>
-                
-                <h3>To use locally:</h3>
-                <pre>streamlit run app.py</pre>
-                
-                <h3>Features:</h3>
-                <ul style="text-align: left;">
-                    <li>✅ File upload (PNG, JPG, PDF)</li>
-                    <li>✅ Chat interface</li>
-                    <li>✅ Simple and clean</li>
-                    <li>✅ Works everywhere</li>
-                </ul>
-            </div>
-        </body>
-        </html>
-        """
+        <h3>To use locally:</h3>
+        <pre>streamlit run app.py</pre>
+        
+        <h3>Features:</h3>
+        <ul style="text-align: left;">
+            <li>✅ File upload (PNG, JPG, PDF)</li>
+            <li>✅ Chat interface</li>
+            <li>✅ Simple and clean</li>
+            <li>✅ Works everywhere</li>
+        </ul>
+    </div>
+</body>
+</html>
+"""
+if MINIFY_HTML_AVAILABLE:
+    _HTML = minify_html.minify(_HTML, minify_js=True, minify_css=True)
+_HTML_BYTES = _HTML.encode('utf-8')
+_HTML_GZ = gzip.compress(_HTML_BYTES, compresslevel=9, mtime=0)
+
+# HTTP/1.1 keeps connections open; every response carries Content-Length
+_PROTOCOL_VERSION = 'HTTP/1.1'
+
+def _build_response(body: bytes, content_encoding: str = None):
+    """Pre-build a 200 response around the Date header: (before, after) bytes."""
+    headers = ['Content-type: text/html; charset=utf-8']
+    if content_encoding:
+        headers.append(f'Content-Encoding: {content_encoding}')
+    headers += [f'Content-Length: {len(body)}', 'Vary: Accept-Encoding']
+    before = f'{_PROTOCOL_VERSION} 200 OK\r\nDate: '.encode('ascii')
+    after = ('\r\n' + '\r\n'.join(headers) + '\r\n\r\n').encode('ascii') + body
+    return before, after
+
+# Whole responses are built once, so each request is a single write
+_GET_RESPONSE = _build_response(_HTML_BYTES)
+_GET_RESPONSE_GZ = _build_response(_HTML_GZ, 'gzip')
+_ENCODINGS = ('gzip',)
+
+# Vercel serves the ASGI app below; this stdlib handler is kept for local runs
+class LocalHandler(BaseHTTPRequestHandler):
+    protocol_version = _PROTOCOL_VERSION
+    
+    def do_GET(self):
+        before, after = _GET_RESPONSE_GZ if select_encoding(self.headers.get('Accept-Encoding', ''), _ENCODINGS) else _GET_RESPONSE
         
-        self.wfile.write(html.encode('utf-8'))
+        self.log_request(200)
+        self.wfile.write(before + self.date_time_string().encode('ascii') + after)
+
+
+
+_ASGI_HEADERS = [
+    (b'content-type', b'text/html; charset=utf-8'),
+    (b'content-length', str(len(_HTML_BYTES)).encode()),
+    (b'vary', b'Accept-Encoding'),
+]
+_ASGI_GZIP_HEADERS = [
+    (b'content-type', b'text/html; charset=utf-8'),
+    (b'content-encoding', b'gzip'),
+    (b'content-length', str(len(_HTML_GZ)).encode()),
+    (b'vary', b'Accept-Encoding'),
+]
+
+
+def _accepts_gzip(scope) -> bool:
+    """Whether the request's Accept-Encoding allows gzip."""
+    for key, value in scope['headers']:
+        if key == b'accept-encoding':
+            return select_encoding(value.decode('latin-1'), _ENCODINGS) == 'gzip'
+    return False
+
+
+async def app(scope, receive, send):
+    """ASGI entry point, served directly by the Vercel Python runtime."""
+    if scope['type'] == 'lifespan':
+        while True:
+            message = await receive()
+            if message['type'] == 'lifespan.startup':
+                await send({'type': 'lifespan.startup.complete'})
+            elif message['type'] == 'lifespan.shutdown':
+                await send({'type': 'lifespan.shutdown.complete'})
+                return
+    
+    if scope['type'] == 'websocket':
+        # No WebSocket routes; closing before accept rejects the handshake
+        await send({'type': 'websocket.close'})
+        return
+    if scope['type'] != 'http':
+        raise ValueError(f"Unsupported ASGI scope type: {scope['type']}")
+    
+    if scope['method'] != 'GET':
+        await send({'type': 'http.response.start', 'status': 501, 'headers': [(b'content-type', b'text/plain')]})
+        await send({'type': 'http.response.body', 'body': b'Unsupported method'})
+        return
+    
+    if _accepts_gzip(scope):
+        headers, body = _ASGI_GZIP_HEADERS, _HTML_GZ
+    else:
+        headers, body = _ASGI_HEADERS, _HTML_BYTES
+    await send({'type': 'http.response.start', 'status': 200, 'headers': headers})
+    await send({'type': 'http.response.body', 'body': body})
+
+
+if __name__ == "__main__":
+    ThreadingHTTPServer(('0.0.0.0', int(os.environ.get('PORT', 8000))), LocalHandler).serve_forever()
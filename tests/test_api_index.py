@@ -0,0 +1,115 @@
+"""
+Test suite for the serverless chat page in api/index.py
+Run with: pytest tests/
+"""
+
+import asyncio
+import gzip
+
+import pytest
+
+from api import index
+
+
+def call(app, scope, messages=()):
+    """Run an ASGI app against one scope; return what it sent"""
+    incoming = list(messages)
+    sent = []
+
+    async def receive():
+        return incoming.pop(0)
+
+    async def send(message):
+        sent.append(message)
+
+    asyncio.run(app(scope, receive, send))
+    return sent
+
+
+def get(method="GET", **headers):
+    """Request the page; return (status, headers, body)"""
+    scope = {
+        "type": "http",
+        "method": method,
+        "path": "/",
+        "headers": [(k.replace("_", "-").encode(), v.encode()) for k, v in headers.items()],
+    }
+    start, body = call(index.app, scope)
+    return start["status"], {k.decode(): v.decode() for k, v in start["headers"]}, body["body"]
+
+
+class TestHtmlVariants:
+    def test_gzip_variant(self):
+        """gzip clients get the precompressed page and its own ETag"""
+        encoding, body, etag = index._select_html_variant("gzip, deflate")
+        assert encoding == "gzip"
+        assert etag.endswith('-gz"')
+        assert gzip.decompress(body) == index._HTML_BYTES
+
+    @pytest.mark.skipif(not index.BROTLI_AVAILABLE, reason="brotli is not installed")
+    def test_brotli_preferred(self):
+        """Brotli wins when the client accepts both"""
+        encoding, body, _ = index._select_html_variant("gzip, br")
+        assert encoding == "br"
+        assert index.brotli.decompress(body) == index._HTML_BYTES
+
+    @pytest.mark.parametrize("accept_encoding", ["", "identity", "identity, gzip;q=0, br;q=0"])
+    def test_identity_fallback(self, accept_encoding):
+        """Clients without an accepted coding get the plain page"""
+        encoding, body, etag = index._select_html_variant(accept_encoding)
+        assert encoding is None
+        assert body == index._HTML_BYTES
+        assert etag == f'"{index._HTML_DIGEST}"'
+
+
+class TestApp:
+    def test_lifespan(self):
+        """Startup and shutdown are acknowledged"""
+        sent = call(index.app, {"type": "lifespan"}, [{"type": "lifespan.startup"}, {"type": "lifespan.shutdown"}])
+        assert [m["type"] for m in sent] == ["lifespan.startup.complete", "lifespan.shutdown.complete"]
+
+    def test_websocket_is_closed(self):
+        """WebSocket connections are rejected instead of crashing on scope['method']"""
+        sent = call(index.app, {"type": "websocket", "path": "/", "headers": []}, [{"type": "websocket.connect"}])
+        assert sent == [{"type": "websocket.close"}]
+
+    def test_unknown_scope_type_raises(self):
+        """Scope types the app doesn't speak are refused"""
+        with pytest.raises(ValueError):
+            call(index.app, {"type": "telepathy"})
+
+    def test_get_serves_negotiated_variant(self):
+        """The page goes out with its encoding, length and cache headers"""
+        status, headers, body = get(accept_encoding="gzip")
+        assert status == 200
+        assert headers["content-encoding"] == "gzip"
+        assert headers["content-length"] == str(len(body))
+        assert headers["vary"] == "Accept-Encoding"
+        assert gzip.decompress(body) == index._HTML_BYTES
+
+    def test_matching_etag_gets_304(self):
+        """Revalidation with the current ETag is answered without a body"""
+        _, headers, _ = get(accept_encoding="gzip")
+        status, revalidated, body = get(accept_encoding="gzip", if_none_match=headers["etag"])
+        assert status == 304
+        assert body == b""
+        assert revalidated["etag"] == headers["etag"]
+
+    def test_other_variants_etag_does_not_match(self):
+        """A gzip ETag doesn't validate the plain variant"""
+        _, headers, _ = get(accept_encoding="gzip")
+        status, _, body = get(if_none_match=headers["etag"])
+        assert status == 200
+        assert body == index._HTML_BYTES
+
+    def test_post(self):
+        """POST answers with the JSON status payload"""
+        status, headers, body = get(method="POST")
+        assert status == 200
+        assert headers["content-type"] == "application/json"
+        assert b"success" in body
+
+    def test_unsupported_method(self):
+        """Other methods get 501"""
+        status, _, _ = get(method="DELETE")
+        assert status == 501
@@ -0,0 +1,87 @@
+"""
+Test suite for the SQLite-backed persistent cache
+Run with: pytest tests/
+"""
+
+import sqlite3
+
+import pytest
+
+from core import persistent_cache
+from core.persistent_cache import PersistentCache
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Controllable time.time() for the cache module"""
+    now = [1_000_000.0]
+    monkeypatch.setattr(persistent_cache.time, "time", lambda: now[0])
+    return now
+
+
+@pytest.fixture
+def make_cache(tmp_path):
+    """Build caches sharing one temporary database"""
+    def make(ttl=60, maxsize=8):
+        return PersistentCache(tmp_path / "cache.db", "entries", ttl, maxsize)
+    return make
+
+
+class TestPersistentCache:
+    def test_get_returns_stored_value(self, make_cache):
+        """A stored value is a hit; an unknown key is a miss"""
+        cache = make_cache()
+        cache.set("key", "value")
+        assert cache.get("key") == "value"
+        assert cache.get("other") is None
+
+    def test_values_survive_a_new_instance(self, make_cache):
+        """A fresh cache reads earlier values back from SQLite"""
+        make_cache().set("key", "value")
+        assert make_cache().get("key") == "value"
+
+    def test_entries_expire_after_ttl(self, make_cache, clock):
+        """Values older than the TTL are misses in memory and on disk"""
+        cache = make_cache(ttl=60)
+        cache.set("key", "value")
+
+        clock[0] += 61
+        assert cache.get("key") is None
+        assert make_cache(ttl=60).get("key") is None
+
+    def test_expired_rows_are_deleted(self, make_cache, clock, tmp_path):
+        """Stale rows are purged when the database is opened and when a lookup hits one"""
+        def keys():
+            with sqlite3.connect(str(tmp_path / "cache.db")) as db:
+                return sorted(key for (key,) in db.execute("SELECT key FROM entries"))
+
+        cache = make_cache(ttl=60)
+        cache.set("old", "1")
+        clock[0] += 61
+        cache.set("new", "2")
+        assert cache.get("old") is None
+        assert keys() == ["new"]
+
+        clock[0] += 61
+        make_cache(ttl=60).get("anything")
+        assert keys() == []
+
+    def test_memory_is_bounded_lru(self, make_cache):
+        """The least recently used entry leaves memory first, but stays on disk"""
+        cache = make_cache(maxsize=2)
+        cache.set("a", "1")
+        cache.set("b", "2")
+        cache.get("a")
+        cache.set("c", "3")
+
+        assert list(cache._memory) == ["a", "c"]
+        assert cache.get("b") == "2"
+
+    def test_unwritable_path_falls_back_to_memory(self, tmp_path):
+        """A database that can't be opened leaves an in-memory cache"""
+        blocker = tmp_path / "file"
+        blocker.write_text("")
+        cache = PersistentCache(blocker / "cache.db", "entries", 60, 8)
+        cache.set("key", "value")
+        assert cache.get("key") == "value"
+        assert cache._db_failed
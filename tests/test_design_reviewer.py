@@ -0,0 +1,195 @@
+"""
+Tests for the design review agent's review cache and in-flight review sharing
+Run with: pytest tests/
+"""
+
+import io
+import json
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from types import SimpleNamespace
+import pytest
+from agents import design_reviewer
+from agents.design_reviewer import DesignReviewAgent
+
+class FakeUpload:
+    """Minimal stand-in for a Streamlit upload"""
+
+    def __init__(self, data, type="image/png", name="design.png"):
+        self._buffer = io.BytesIO(data)
+        self.type = type
+        self.name = name
+
+    def read(self):
+        return self._buffer.read()
+
+    def seek(self, offset):
+        self._buffer.seek(offset)
+
+@pytest.fixture
+def make_agent(monkeypatch, tmp_path):
+    """Build agents with a dummy key and a stubbed model call, sharing a review cache in a temporary database"""
+    monkeypatch.setenv("OPENAI_API_KEY", "test-key")
+    monkeypatch.setattr(design_reviewer, "REVIEW_CACHE_PATH", tmp_path / "cache.db")
+
+    def make(calls):
+        agent = DesignReviewAgent(model_name="gpt-4o")
+
+        def analyze(file, review_type, detail_level, include_suggestions, image_bytes=None):
+            calls.append(image_bytes)
+            return {"summary": f"review of {len(image_bytes)} bytes", "score": 7}
+
+        agent._analyze_image = analyze
+        return agent
+
+    return make
+
+class TestReviewCache:
+    def test_repeat_review_is_cached(self, make_agent):
+        """The same file and options are reviewed once"""
+        calls = []
+        agent = make_agent(calls)
+        first = agent.review_design(FakeUpload(b"pixels"))
+        second = agent.review_design(FakeUpload(b"pixels"))
+        assert first == second
+        assert len(calls) == 1
+
+    def test_options_are_part_of_the_key(self, make_agent):
+        """A different review type is a separate review"""
+        calls = []
+        agent = make_agent(calls)
+        agent.review_design(FakeUpload(b"pixels"), review_type="General Design")
+        agent.review_design(FakeUpload(b"pixels"), review_type="Accessibility")
+        assert len(calls) == 2
+
+    def test_unreadable_pdf_reviews_are_not_cached(self, make_agent):
+        """A review of a PDF whose text couldn't be extracted is not stored"""
+        calls = []
+        agent = make_agent(calls)
+        agent._analyze_pdf = lambda file, *args: calls.append(args[-1]) or {"review": args[-1]}
+        upload = FakeUpload(b"not a pdf", type="application/pdf", name="design.pdf")
+        agent.review_design(upload)
+        agent.review_design(upload)
+        assert len(calls) == 2
+        assert calls[0].startswith("Error extracting PDF content")
+
+    def test_unreadable_pdfs_are_keyed_by_their_bytes(self, make_agent):
+        """The file is rewound before hashing, so different broken PDFs get different keys"""
+        agent = make_agent([])
+
+        def key(data):
+            upload = FakeUpload(data, type="application/pdf", name="design.pdf")
+            upload.read()  # left at EOF by an earlier reader
+            return agent._review_inputs(upload, "General Design", 3, True)[2]
+
+        assert key(b"not a pdf") != key(b"also not a pdf")
+
+class FakeBatchClient:
+    """OpenAI client stand-in that keeps the uploaded batch input"""
+
+    def __init__(self):
+        self.uploaded = None
+        self.files = SimpleNamespace(create=self.create_file)
+        self.batches = SimpleNamespace(create=lambda **kwargs: SimpleNamespace(id="batch_1"))
+
+    def create_file(self, file, purpose):
+        self.uploaded = file[1].decode("utf-8")
+        return SimpleNamespace(id="file_1")
+
+class TestReviewBatch:
+    def test_batch_body_matches_interactive_review(self, make_agent):
+        """Batch requests use the same messages and model settings as review_design"""
+        agent = make_agent([])
+        agent._openai_client = client = FakeBatchClient()
+
+        assert agent.review_designs_batch([FakeUpload(b"pixels")], review_type="Accessibility") == "batch_1"
+        (request,) = [json.loads(line) for line in client.uploaded.splitlines()]
+        body = request["body"]
+
+        assert request["custom_id"] == "0:design.png"
+        assert (body["model"], body["temperature"], body["max_tokens"]) == (
+            agent.llm.model_name, agent.llm.temperature, agent.llm.max_tokens
+        )
+        system, user = body["messages"]
+        assert system == {
+            "role": "system",
+            "content": agent.prompts.get_review_prompt("Accessibility", 3, True),
+        }
+        assert user["role"] == "user"
+        assert user["content"][1]["image_url"]["url"].startswith("data:image/")
+
+class ObservedFuture(Future):
+    """Future that records when a caller starts waiting on it"""
+
+    def __init__(self):
+        super().__init__()
+        self.waited_on = threading.Event()
+
+    def result(self, timeout=None):
+        self.waited_on.set()
+        return super().result(timeout)
+
+class TestSingleFlight:
+    def wait_for_leader(self, agent):
+        """Block until one review is in flight; return its observable future"""
+        deadline = time.monotonic() + 5
+        while not agent._pending_reviews:
+            assert time.monotonic() < deadline
+            time.sleep(0.001)
+        with agent._review_lock:
+            (key,) = agent._pending_reviews
+            agent._pending_reviews[key] = pending = ObservedFuture()
+        return pending
+
+    def test_concurrent_identical_reviews_share_one_call(self, make_agent):
+        """Callers arriving mid-review wait for the leader's result"""
+        calls = []
+        agent = make_agent(calls)
+        release = threading.Event()
+        analyze = agent._analyze_image
+
+        def slow_analyze(*args, **kwargs):
+            release.wait(5)
+            return analyze(*args, **kwargs)
+
+        agent._analyze_image = slow_analyze
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            leader = pool.submit(agent.review_design, FakeUpload(b"pixels"))
+            pending = self.wait_for_leader(agent)
+            followers = [pool.submit(agent.review_design, FakeUpload(b"pixels")) for _ in range(3)]
+            assert pending.waited_on.wait(5)
+            release.set()
+            results = [leader.result()] + [f.result() for f in followers]
+
+        assert len(calls) == 1
+        assert all(result == results[0] for result in results)
+        assert not agent._pending_reviews
+
+    def test_failure_reaches_waiters_and_is_not_cached(self, make_agent):
+        """A failed review is reported to every waiter, and the next call retries"""
+        calls = []
+        agent = make_agent(calls)
+        release = threading.Event()
+        analyze = agent._analyze_image
+
+        def failing_analyze(*args, **kwargs):
+            calls.append(None)
+            release.wait(5)
+            raise RuntimeError("model unavailable")
+
+        agent._analyze_image = failing_analyze
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            leader = pool.submit(agent.review_design, FakeUpload(b"pixels"))
+            pending = self.wait_for_leader(agent)
+            follower = pool.submit(agent.review_design, FakeUpload(b"pixels"))
+            assert pending.waited_on.wait(5)
+            release.set()
+            results = [leader.result(), follower.result()]
+
+        assert all("model unavailable" in result["error"] for result in results)
+        assert not agent._pending_reviews
+
+        agent._analyze_image = analyze
+        assert "error" not in agent.review_design(FakeUpload(b"pixels"))
+        assert len(calls) == 2
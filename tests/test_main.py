@@ -6,6 +6,7 @@ Run with: pytest tests/
 import pytest
 from fastapi.testclient import TestClient
 from main import app
+from core.web_assets import CHAT_JS_VERSION
 import json
 import io
 
@@ -111,6 +112,22 @@ class TestMainPage:
         assert response.status_code == 200
         assert "text/html" in response.headers["content-type"]
 
+    def test_gzip_refused_with_zero_quality(self):
+        """The chat page is sent uncompressed when gzip has q=0"""
+        response = client.get("/", headers={"Accept-Encoding": "identity, gzip;q=0"})
+        assert response.status_code == 200
+        assert "content-encoding" not in response.headers
+
+        response = client.get("/", headers={"Accept-Encoding": "gzip"})
+        assert response.headers["content-encoding"] == "gzip"
+
+    def test_etag_revalidation(self):
+        """A matching If-None-Match gets a bodyless 304"""
+        etag = client.get("/", headers={"Accept-Encoding": "gzip"}).headers["etag"]
+        response = client.get("/", headers={"Accept-Encoding": "gzip", "If-None-Match": etag})
+        assert response.status_code == 304
+        assert response.content == b""
+
 class TestResponsePatterns:
     """Test that responses match expected patterns for different input types"""
     
@@ -142,5 +159,97 @@ class TestResponsePatterns:
             data = response.json()
             assert any(word in data["response"].lower() for word in ["layout", "spacing", "grid"])
 
+class TestVersionedStaticFiles:
+    def test_versioned_urls_are_immutable(self):
+        """Content-versioned script URLs may be cached for a year"""
+        response = client.get(f"/static/js/chat.js?v={CHAT_JS_VERSION}")
+        assert response.status_code == 200
+        assert response.headers["cache-control"] == "public, max-age=31536000, immutable"
+
+    def test_unversioned_urls_are_not_pinned(self):
+        """Plain static URLs keep the default revalidation"""
+        response = client.get("/static/js/chat.js")
+        assert response.status_code == 200
+        assert "immutable" not in response.headers.get("cache-control", "")
+
+    def test_other_parameters_ending_in_v_are_not_pinned(self):
+        """Only a real v parameter pins the URL, not dev=, nav= or lv="""
+        for query in ("dev=1", "nav=x", "lv=2"):
+            response = client.get(f"/static/js/chat.js?{query}")
+            assert response.status_code == 200
+            assert "immutable" not in response.headers.get("cache-control", "")
+
+    def test_home_page_references_current_version(self):
+        """The chat page links the script by its content hash"""
+        response = client.get("/")
+        assert f"/static/js/chat.js?v={CHAT_JS_VERSION}" in response.text
+
+class StubReviewer:
+    """Reviewer streaming canned pieces, or failing after the first"""
+    def __init__(self, pieces, error=None):
+        self.pieces = pieces
+        self.error = error
+        self.calls = []
+
+    def stream_review_design(self, file, review_type, detail_level, include_suggestions):
+        self.calls.append((file.read(), file.type, review_type, detail_level, include_suggestions))
+        for piece in self.pieces:
+            yield piece
+            if self.error:
+                raise self.error
+
+def sse_payloads(response):
+    """Decode the data lines of a server-sent event stream"""
+    events = [line[len("data: "):] for line in response.text.split("\n\n") if line]
+    return [event if event == "[DONE]" else json.loads(event) for event in events]
+
+class TestReviewStream:
+    @pytest.fixture
+    def reviewer(self, monkeypatch):
+        import main
+        stub = StubReviewer(["Strong ", "hierarchy, \"tight\" spacing"])
+        monkeypatch.setattr(main, "design_reviewer", stub)
+        return stub
+
+    def test_streams_review_pieces(self, reviewer):
+        """Each piece of the review arrives as its own event, then [DONE]"""
+        response = client.post(
+            "/api/review/stream",
+            files={"file": ("design.png", b"pixels", "image/png")},
+            data={"review_type": "Accessibility", "detail_level": "4"}
+        )
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/event-stream")
+        assert response.headers["cache-control"] == "no-cache"
+        assert sse_payloads(response) == [
+            {"delta": "Strong "},
+            {"delta": 'hierarchy, "tight" spacing'},
+            "[DONE]",
+        ]
+        assert reviewer.calls == [(b"pixels", "image/png", "Accessibility", 4, True)]
+
+    def test_errors_become_events(self, reviewer):
+        """A failing review ends with an escaped error event and [DONE]"""
+        reviewer.error = RuntimeError('model said "no"')
+        response = client.post(
+            "/api/review/stream",
+            files={"file": ("design.png", b"pixels", "image/png")}
+        )
+        assert sse_payloads(response) == [
+            {"delta": "Strong "},
+            {"error": 'Failed to analyze design: model said "no"'},
+            "[DONE]",
+        ]
+
+    def test_unsupported_upload_is_rejected(self, reviewer):
+        """Files the reviewer can't read are refused before streaming starts"""
+        response = client.post(
+            "/api/review/stream",
+            files={"file": ("notes.txt", b"text", "text/plain")}
+        )
+        assert response.status_code == 400
+        assert "error" in response.json()
+        assert reviewer.calls == []
+
 if __name__ == "__main__":
     pytest.main([__file__])
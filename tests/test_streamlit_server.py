@@ -0,0 +1,82 @@
+"""
+Test suite for the ASGI app in streamlit_server.py
+Run with: pytest tests/
+"""
+
+import asyncio
+import gzip
+
+import pytest
+
+import streamlit_server
+
+
+def call(scope, messages=()):
+    """Run the ASGI app against one scope; return what it sent"""
+    incoming = list(messages)
+    sent = []
+
+    async def receive():
+        return incoming.pop(0)
+
+    async def send(message):
+        sent.append(message)
+
+    asyncio.run(streamlit_server.app(scope, receive, send))
+    return sent
+
+
+def get(method="GET", accept_encoding=None):
+    """Request the page; return (status, headers, body)"""
+    headers = [] if accept_encoding is None else [(b"accept-encoding", accept_encoding.encode())]
+    start, body = call({"type": "http", "method": method, "path": "/", "headers": headers})
+    return start["status"], {k.decode(): v.decode() for k, v in start["headers"]}, body["body"]
+
+
+class TestApp:
+    def test_lifespan(self):
+        """Startup and shutdown are acknowledged"""
+        sent = call(
+            {"type": "lifespan"},
+            [{"type": "lifespan.startup"}, {"type": "lifespan.shutdown"}],
+        )
+        assert [m["type"] for m in sent] == ["lifespan.startup.complete", "lifespan.shutdown.complete"]
+
+    def test_websocket_is_closed(self):
+        """WebSocket connections are rejected instead of crashing on scope['method']"""
+        sent = call({"type": "websocket", "path": "/", "headers": []}, [{"type": "websocket.connect"}])
+        assert sent == [{"type": "websocket.close"}]
+
+    def test_unknown_scope_type_raises(self):
+        """Scope types the app doesn't speak are refused"""
+        with pytest.raises(ValueError):
+            call({"type": "telepathy"})
+
+    def test_plain_without_accept_encoding(self):
+        """Clients that do not ask for gzip get the plain page"""
+        for accept_encoding in (None, "identity"):
+            status, headers, body = get(accept_encoding=accept_encoding)
+            assert status == 200
+            assert "content-encoding" not in headers
+            assert body == streamlit_server._HTML_BYTES
+            assert headers["content-length"] == str(len(body))
+
+    def test_gzip_when_accepted(self):
+        """gzip is sent when the client accepts it"""
+        status, headers, body = get(accept_encoding="gzip, deflate")
+        assert status == 200
+        assert headers["content-encoding"] == "gzip"
+        assert headers["vary"] == "Accept-Encoding"
+        assert gzip.decompress(body) == streamlit_server._HTML_BYTES
+
+    def test_gzip_refused_with_zero_quality(self):
+        """q=0 means "not acceptable", even though gzip is named"""
+        for accept_encoding in ("gzip;q=0", "identity, gzip;q=0"):
+            _, headers, body = get(accept_encoding=accept_encoding)
+            assert "content-encoding" not in headers
+            assert body == streamlit_server._HTML_BYTES
+
+    def test_other_methods_unsupported(self):
+        """Only GET is served"""
+        status, _, _ = get(method="POST")
+        assert status == 501
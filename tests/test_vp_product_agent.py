@@ -0,0 +1,233 @@
+"""
+Tests for Margo's VP design agent: shared HTTP clients, caches and response parsing
+Run with: pytest tests/
+"""
+
+import asyncio
+import pytest
+from agents import vp_product_agent
+from agents.vp_product_agent import (
+    MargoVPDesignAgent,
+    _HTTP_CLIENTS,
+    _get_shared_http_client,
+    _run_closing_http_clients,
+)
+
+@pytest.fixture
+def agent(monkeypatch, tmp_path):
+    """Agent with a dummy key and its response cache in a temporary database"""
+    monkeypatch.setenv("OPENAI_API_KEY", "test-key")
+    monkeypatch.setattr(vp_product_agent, "RESPONSE_CACHE_PATH", tmp_path / "cache.db")
+    return MargoVPDesignAgent(openai_api_key="test-key")
+
+class FakeDoc:
+    def __init__(self, title, content):
+        self.metadata = {"title": title}
+        self.page_content = content
+
+class FakeExaAgent:
+    """Counts searches; fails on demand"""
+    def __init__(self):
+        self.calls = 0
+        self.fail = False
+
+    def search_design_best_practices(self, query, num_results):
+        self.calls += 1
+        if self.fail:
+            raise RuntimeError("search down")
+        return [FakeDoc("Trends", f"notes on {query}")]
+
+    def search_roku_specific_content(self, query, num_results):
+        self.calls += 1
+        return [FakeDoc("Roku", query)]
+
+class TestCompetitiveResearchCache:
+    @pytest.fixture
+    def exa(self, agent):
+        exa = FakeExaAgent()
+        agent._exa_agent = exa
+        return exa
+
+    def test_repeat_design_type_is_served_from_cache(self, agent, exa):
+        """The same design type (after normalising) skips the Exa fan-out"""
+        first = asyncio.run(agent._get_competitive_research("Home Screen"))
+        searches = exa.calls
+        second = asyncio.run(agent._get_competitive_research("  home screen "))
+        assert second == first
+        assert exa.calls == searches
+
+    def test_entries_expire_after_ttl(self, agent, exa, monkeypatch):
+        """Research older than the TTL is fetched again"""
+        now = 1_000_000.0
+        monkeypatch.setattr(vp_product_agent.time, "time", lambda: now)
+        asyncio.run(agent._get_competitive_research("home screen"))
+        searches = exa.calls
+
+        now += vp_product_agent.RESEARCH_CACHE_TTL + 1
+        asyncio.run(agent._get_competitive_research("home screen"))
+        assert exa.calls == 2 * searches
+
+    def test_least_recently_used_entry_is_evicted(self, agent, exa, monkeypatch):
+        """The cache holds at most RESEARCH_CACHE_SIZE design types"""
+        monkeypatch.setattr(vp_product_agent, "RESEARCH_CACHE_SIZE", 2)
+        for design_type in ("a", "b"):
+            asyncio.run(agent._get_competitive_research(design_type))
+        asyncio.run(agent._get_competitive_research("a"))  # refresh "a"
+        asyncio.run(agent._get_competitive_research("c"))
+        assert list(agent._research_cache) == ["a", "c"]
+
+    def test_partial_results_are_not_cached(self, agent, exa):
+        """A failed query doesn't pin incomplete research for a whole TTL"""
+        exa.fail = True
+        asyncio.run(agent._get_competitive_research("home screen"))
+        assert "home screen" not in agent._research_cache
+
+def legacy_parse(response_content):
+    """The per-field extractors _parse_all replaced, kept as a reference"""
+    import re
+
+    lower = response_content.lower()
+    recommendation = "Approve with Changes"
+    if "approve" in lower:
+        if "reject" in lower:
+            recommendation = "Reject"
+        elif "changes" in lower or "modification" in lower:
+            recommendation = "Approve with Changes"
+        else:
+            recommendation = "Approve"
+    elif "reject" in lower:
+        recommendation = "Reject"
+    elif "research" in lower:
+        recommendation = "Needs More Research"
+
+    found_scores = []
+    for pattern in (r'(\d+(?:\.\d+)?)/10', r'score.*?(\d+(?:\.\d+)?)', r'rating.*?(\d+(?:\.\d+)?)'):
+        for match in re.findall(pattern, lower):
+            if 1 <= float(match) <= 10:
+                found_scores.append(float(match))
+    if found_scores:
+        score = sum(found_scores) / len(found_scores)
+    else:
+        positive = ["strong business case", "clear value", "competitive advantage",
+                    "aligns with strategy", "high impact", "excellent roi"]
+        negative = ["business risk", "unclear value", "low impact", "poor roi",
+                    "competitive disadvantage", "strategic misalignment"]
+        adjustment = (sum(t in lower for t in positive) - sum(t in lower for t in negative)) * 0.5
+        score = max(1.0, min(10.0, 7.0 + adjustment))
+
+    issue_keywords = ["business risk", "competitive threat", "user confusion",
+                      "low engagement", "poor conversion", "strategic misalignment",
+                      "unclear value", "implementation cost", "technical debt"]
+    issues = []
+    for line in response_content.split('\n'):
+        line = line.strip()
+        if any(keyword in line.lower() for keyword in issue_keywords):
+            clean_line = re.sub(r'^[-•*]\s*|\d+\.\s*', '', line)
+            if clean_line and len(clean_line) > 10:
+                issues.append(clean_line)
+
+    strategic_keywords = ["recommend", "suggest", "should", "consider", "prioritize",
+                          "focus on", "optimize", "improve", "enhance", "implement"]
+    recommendations = []
+    in_section = False
+    for line in response_content.split('\n'):
+        line = line.strip()
+        if any(keyword in line.lower() for keyword in ["recommendation", "action", "next step"]):
+            in_section = True
+            continue
+        if in_section or any(keyword in line.lower() for keyword in strategic_keywords):
+            clean_line = re.sub(r'^[-•*]\s*|\d+\.\s*', '', line)
+            if clean_line and len(clean_line) > 15:
+                recommendations.append(clean_line)
+
+    factors = [
+        min(1.0, sum(t in lower for t in ["engagement", "conversion", "retention", "revenue", "roi", "kpi"]) / 3),
+        min(1.0, sum(t in lower for t in ["competitor", "competitive", "market", "industry", "benchmark"]) / 2),
+        min(1.0, sum(t in lower for t in ["strategy", "vision", "roadmap", "long-term", "strategic"]) / 2),
+        min(1.0, len(response_content.split()) / 500),
+    ]
+    return {
+        "recommendation": recommendation,
+        "score": score,
+        "issues": issues[:5],
+        "recommendations": recommendations[:5],
+        "confidence": sum(factors) / len(factors),
+    }
+
+SAMPLE_RESPONSES = [
+    """Executive summary: Approve with changes. Overall score: 7.5/10
+
+Business risks:
+- Business risk: the new rail pushes premium content below the fold
+- User confusion around the two competing CTAs
+1. Technical debt from the bespoke carousel component
+* Low engagement expected on the secondary row
+
+Strategic recommendations:
+- Prioritize a single primary CTA for subscription conversion
+- Benchmark against competitor home screens before launch
+2. Improve focus states for 10-foot navigation
+short
+We should consider a retention-focused roadmap for next quarter.
+""",
+    """This design has a strong business case and clear value.
+It creates a competitive advantage in the market and aligns with strategy.
+We recommend shipping it as-is; the team should monitor engagement and revenue.
+""",
+    """Reject. There is a business risk of strategic misalignment and poor roi.
+Unclear value to users; implementation cost is high and there is low impact.
+Needs more research before any decision.
+""",
+    """More research is needed. The industry benchmark suggests competitors lead here.
+Consider a long-term vision. Next steps:
+* Run a usability study with twenty households
+* Validate the pricing page with the growth team
+""",
+]
+
+class TestParseAll:
+    @pytest.mark.parametrize("response", SAMPLE_RESPONSES)
+    def test_matches_legacy_extractors(self, agent, response):
+        """The fused single-pass parser agrees with the helpers it replaced"""
+        expected = legacy_parse(response)
+        parsed = agent._parse_all(response)
+
+        assert parsed.recommendation == expected["recommendation"]
+        assert parsed.score == pytest.approx(expected["score"])
+        assert parsed.issues == expected["issues"]
+        assert parsed.recommendations == expected["recommendations"]
+        assert agent._calculate_strategic_confidence(parsed, {}) == pytest.approx(expected["confidence"])
+
+class TestResponseCache:
+    def test_key_depends_on_image_and_prompt(self, agent):
+        """Different images or prompts never share an entry"""
+        key = agent._response_cache_key("aW1hZ2U=", "prompt")
+        assert key == agent._response_cache_key("aW1hZ2U=", "prompt")
+        assert key != agent._response_cache_key("b3RoZXI=", "prompt")
+        assert key != agent._response_cache_key("aW1hZ2U=", "other prompt")
+
+class TestSharedHttpClient:
+    def test_no_client_outside_event_loop(self):
+        """Sync callers get no pooled client"""
+        assert _get_shared_http_client("test-key") is None
+
+    def test_each_event_loop_gets_its_own_client(self, agent):
+        """A client from a finished loop is never reused by the next one"""
+        async def grab():
+            return agent.llm, _get_shared_http_client("test-key")
+
+        first_llm, first_client = asyncio.run(_run_closing_http_clients(grab()))
+        second_llm, second_client = asyncio.run(_run_closing_http_clients(grab()))
+
+        assert first_client is not second_client
+        assert first_client.is_closed and second_client.is_closed
+        assert first_llm is not second_llm
+        assert not _HTTP_CLIENTS
+
+    def test_client_shared_within_a_loop(self, agent):
+        """Repeated lookups on one loop reuse the pooled client"""
+        async def grab_twice():
+            return _get_shared_http_client("test-key"), _get_shared_http_client("test-key")
+
+        first, second = asyncio.run(_run_closing_http_clients(grab_twice()))
+        assert first is second
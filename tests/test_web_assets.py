@@ -0,0 +1,60 @@
+"""
+Test suite for the shared web assets and the servers that use them
+Run with: pytest tests/
+"""
+
+from fastapi.testclient import TestClient
+
+from core.web_assets import CHAT_JS_VERSION, asset_version, select_encoding
+
+
+class TestAssetVersion:
+    def test_missing_asset_has_fallback_version(self):
+        """A missing file still gets a usable version string"""
+        assert asset_version("js", "does-not-exist.js") == "0"
+
+    def test_chat_script_is_hashed(self):
+        """The chat script version is a content hash"""
+        assert CHAT_JS_VERSION != "0"
+        assert len(CHAT_JS_VERSION) == 12
+
+
+class TestSelectEncoding:
+    def test_listed_coding_is_used(self):
+        """A plainly listed coding is selected"""
+        assert select_encoding("gzip, deflate", ("gzip",)) == "gzip"
+
+    def test_zero_quality_refuses_coding(self):
+        """q=0 means "not acceptable", even though the name appears"""
+        assert select_encoding("gzip;q=0", ("gzip",)) is None
+        assert select_encoding("identity, gzip;q=0", ("gzip",)) is None
+        assert select_encoding("br;q=0, gzip", ("br", "gzip")) == "gzip"
+
+    def test_client_quality_beats_server_preference(self):
+        """The client's q-values decide before the server's order"""
+        assert select_encoding("br;q=0.5, gzip", ("br", "gzip")) == "gzip"
+        assert select_encoding("br, gzip", ("br", "gzip")) == "br"
+
+    def test_wildcard_covers_unnamed_codings(self):
+        """"*" applies to codings the header doesn't name"""
+        assert select_encoding("*", ("gzip",)) == "gzip"
+        assert select_encoding("br, *;q=0", ("gzip",)) is None
+
+    def test_missing_header_means_identity(self):
+        """Without Accept-Encoding the page is sent uncompressed"""
+        assert select_encoding("", ("br", "gzip")) is None
+
+
+class TestDebugServer:
+    def test_template_references_versioned_chat_script(self):
+        """The debug page loads the same pinned chat script as the main server"""
+        from debug_main import app
+
+        client = TestClient(app)
+        response = client.get("/test")
+        assert response.status_code == 200
+        assert f"/static/js/chat.js?v={CHAT_JS_VERSION}" in response.text
+
+        script = client.get(f"/static/js/chat.js?v={CHAT_JS_VERSION}")
+        assert script.status_code == 200
+
@@ -0,0 +1,213 @@
+"""
+Tests for the workflow orchestrator: research lookups, tracking stores and workflow lifecycle
+Run with: pytest tests/
+"""
+
+import asyncio
+import json
+import pytest
+from datetime import datetime
+from agents import workflow_orchestrator
+from agents.orchestrator import OrchestratedReview, ReviewResult
+from agents.workflow_orchestrator import (
+    BoundedStore,
+    KnowledgeGap,
+    Priority,
+    WorkflowOrchestrator,
+    WorkflowStatus,
+)
+
+class FakeDoc:
+    def __init__(self, title, content):
+        self.metadata = {"title": title}
+        self.page_content = content
+
+class FakeResearchAgent:
+    """Research agent returning canned search results"""
+
+    def __init__(self, results):
+        self.results = results
+        self.calls = 0
+
+    async def asearch_design_best_practices(self, query, num_results=5):
+        self.calls += 1
+        return self.results
+
+@pytest.fixture
+def orchestrator(monkeypatch, tmp_path):
+    """Orchestrator with its lookup cache and archives in a temporary directory"""
+    monkeypatch.setattr(workflow_orchestrator, "LOOKUP_CACHE_PATH", tmp_path / "cache.db")
+    monkeypatch.setattr(workflow_orchestrator, "TRACKING_ARCHIVE_DIR", tmp_path / "archive")
+    return WorkflowOrchestrator(enhanced_system=None)
+
+class TestLookupCache:
+    def test_research_is_cached_by_normalised_query(self, orchestrator):
+        """Repeat queries differing only in case and spacing hit the cache"""
+        agent = FakeResearchAgent([FakeDoc("Onboarding", "first-run patterns")])
+        orchestrator.research_agent = agent
+
+        first = asyncio.run(orchestrator._search_existing_research("TV onboarding"))
+        second = asyncio.run(orchestrator._search_existing_research("  tv   Onboarding "))
+        assert first == second == [{"title": "Onboarding", "content": "first-run patterns"}]
+        assert agent.calls == 1
+
+class TestBoundedStore:
+    def test_evicts_least_recently_written(self, tmp_path):
+        """Overflow archives the oldest write, and rewriting refreshes an entry"""
+        store = BoundedStore(maxsize=2, archive_path=tmp_path / "archive.jsonl")
+        store["a"] = 1
+        store["b"] = 2
+        store["a"] = 3
+        store["c"] = 4
+
+        assert list(store) == ["a", "c"]
+        assert store.evictions == 1
+        store.flush()
+        archived = [json.loads(line) for line in (tmp_path / "archive.jsonl").read_text().splitlines()]
+        assert archived == [{"key": "b", "value": 2}]
+
+    def test_live_entries_are_kept(self):
+        """Open entries are skipped, even past maxsize"""
+        store = BoundedStore(maxsize=2, is_live=lambda status: status == "open")
+        store["a"] = "open"
+        store["b"] = "done"
+        store["c"] = "open"
+        assert list(store) == ["a", "c"]
+
+        store["d"] = "open"
+        assert list(store) == ["a", "c", "d"]
+        assert store.evictions == 1
+
+    def test_live_entries_are_not_rescanned(self):
+        """Inserts check each live entry once rather than on every eviction"""
+        checked = []
+
+        def is_live(status):
+            checked.append(status)
+            return status == "open"
+
+        store = BoundedStore(maxsize=2, is_live=is_live)
+        for i in range(50):
+            store[f"open{i}"] = "open"
+        assert len(store) == 50
+        assert len(checked) < 2 * 50
+
+    def test_closed_entries_are_evicted_later(self):
+        """An entry that closes after being passed over is evicted within a few inserts"""
+        statuses = {}
+        store = BoundedStore(maxsize=1, is_live=lambda key: statuses[key] == "open")
+        for key in "abc":
+            statuses[key] = "open"
+            store[key] = key
+
+        statuses["a"] = "done"
+        for key in "def":
+            statuses[key] = "open"
+            store[key] = key
+        assert "a" not in store
+        assert store.evictions == 1
+
+    def test_hit_rate_counts_lookups(self):
+        """Hits and misses are counted for get() and indexing"""
+        store = BoundedStore()
+        assert store.hit_rate == 0.0
+        store["a"] = 1
+        assert store.get("a") == 1
+        assert store["a"] == 1
+        assert store.get("b") is None
+        with pytest.raises(KeyError):
+            store["b"]
+        assert (store.hits, store.misses) == (2, 2)
+        assert store.hit_rate == 0.5
+
+class TestExistingResearch:
+    def test_unexpected_result_shape_returns_empty(self, orchestrator):
+        """Malformed research results never abort the submission"""
+        orchestrator.research_agent = FakeResearchAgent([object()])
+        assert asyncio.run(orchestrator._search_existing_research("onboarding")) == []
+
+def make_review(feedback, score=2.0):
+    """Orchestrated review holding a single agent result"""
+    result = ReviewResult(
+        agent_type="ux_researcher",
+        agent_name="UX Researcher",
+        score=score,
+        feedback=feedback,
+        specific_issues=[],
+        recommendations=[],
+        confidence=0.5,
+        review_time=datetime.now()
+    )
+    return OrchestratedReview(
+        overall_score=score,
+        phase_results={"analysis": [result]},
+        synthesis="",
+        priority_actions=[],
+        learning_insights=[],
+        review_id="review",
+        timestamp=datetime.now(),
+        design_type="ui_design"
+    )
+
+class FakeEnhancedSystem:
+    """Enhanced system returning the same canned review for every call"""
+
+    def __init__(self, review):
+        self.review = review
+
+    async def conduct_comprehensive_review(self, image_data, design_type, context):
+        return self.review
+
+class TestWorkflowLifecycle:
+    def test_open_workflows_survive_overflow(self, orchestrator):
+        """Only terminal workflows are archived when the store is full"""
+        orchestrator.active_workflows.maxsize = 1
+        for gap_id in ("gap1", "gap2"):
+            gap = KnowledgeGap(
+                gap_id=gap_id,
+                agent_name="UX Researcher",
+                topic="navigation",
+                question="Which focus order?",
+                context={},
+                severity=Priority.MEDIUM,
+                timestamp=datetime.now(),
+                suggested_next_steps=[]
+            )
+            asyncio.run(orchestrator._log_knowledge_gap(gap, "design_review_1"))
+
+        assert list(orchestrator.active_workflows) == ["intervention_gap1", "intervention_gap2"]
+        assert list(orchestrator.knowledge_gaps) == ["gap1", "gap2"]
+
+    def test_margo_review_closes_gap_interventions(self, orchestrator):
+        """Gaps handed to Margo leave active tracking once the review is done"""
+        orchestrator.enhanced_system = FakeEnhancedSystem(
+            make_review("The navigation is unclear and this is critical to fix.")
+        )
+        result = asyncio.run(orchestrator.process_design_submission({"title": "Home"}, {}))
+
+        assert "margo_review" in result["results"]
+        assert not orchestrator.knowledge_gaps
+        assert not orchestrator.active_workflows
+
+    def test_resolve_knowledge_gap(self, orchestrator):
+        """A stakeholder answer completes the intervention and drops its gap"""
+        gap = KnowledgeGap(
+            gap_id="gap1",
+            agent_name="UX Researcher",
+            topic="navigation",
+            question="Which focus order?",
+            context={},
+            severity=Priority.MEDIUM,
+            timestamp=datetime.now(),
+            suggested_next_steps=[]
+        )
+        asyncio.run(orchestrator._log_knowledge_gap(gap, "design_review_1"))
+        assert "intervention_gap1" in orchestrator.active_workflows
+
+        workflow = orchestrator.resolve_knowledge_gap("gap1", "Left to right")
+
+        assert workflow.status is WorkflowStatus.COMPLETED
+        assert workflow.results == {"resolution": "Left to right"}
+        assert "intervention_gap1" not in orchestrator.active_workflows
+        assert "gap1" not in orchestrator.knowledge_gaps
+        assert orchestrator.resolve_knowledge_gap("gap1", "again") is None